@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+class ColumnAccumulator:
+    """
+    Acumula as linhas das seções de um lote diretamente em colunas e monta o DataFrame uma única vez no final.
+    Colunas com dados ficam em arrays pré-alocados (a capacidade dobra quando necessário); colunas constantes
+    em cada seção (Tipo, Período, Agência...) são guardadas apenas como sequências de (valor, quantidade).
+    Parâmetros:
+      - columns: Colunas do DataFrame final, na ordem de saída.
+      - capacity: Quantidade inicial de linhas reservada em cada array.
+    """
+    @property
+    def columns(self) -> List[str]:
+        return self.__columns
+
+    def __init__(self, columns:List[str], *, capacity:int=256) -> None:
+        self.__columns:List[str] = list(columns)
+        self.__capacity:int = max(capacity, 1)
+        self.__size:int = 0
+        self.__arrays:Dict[str, np.ndarray] = {}
+        self.__runs:Dict[str, List[Tuple[object, int]]] = {}
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __reserve(self, rows:int) -> None:
+        if self.__size + rows <= self.__capacity:
+            return
+        while self.__capacity < self.__size + rows:
+            self.__capacity *= 2
+        for column, array in self.__arrays.items():
+            grown = np.empty(self.__capacity, dtype=object)
+            grown[:self.__size] = array[:self.__size]
+            self.__arrays[column] = grown
+
+    def __array(self, column:str) -> np.ndarray:
+        if (array:=self.__arrays.get(column)) is None:
+            array = np.empty(self.__capacity, dtype=object)
+            if (runs:=self.__runs.pop(column, None)):
+                array[:self.__size] = self.__expand(runs)
+            self.__arrays[column] = array
+        return array
+
+    def __add_run(self, column:str, value:object, rows:int) -> None:
+        runs = self.__runs.setdefault(column, [(None, self.__size)] if self.__size else [])
+        if runs and type(runs[-1][0]) is type(value) and runs[-1][0] == value:
+            runs[-1] = (value, runs[-1][1] + rows)
+        else:
+            runs.append((value, rows))
+
+    @staticmethod
+    def __expand(runs:List[Tuple[object, int]]) -> np.ndarray:
+        values = np.empty(len(runs), dtype=object)
+        values[:] = [value for value, _ in runs]
+        return np.repeat(values, [count for _, count in runs])
+
+    def append(self, rows:List[list], *, positions:Dict[str, int], constants:Dict[str, object]) -> int:
+        """
+        Acrescenta as linhas de uma seção.
+        Parâmetros:
+          - rows: Linhas (lista de listas) como lidas da planilha.
+          - positions: {coluna de saída: posição do valor em cada linha}.
+          - constants: {coluna de saída: valor repetido em todas as linhas da seção}; prevalece sobre `positions`.
+        Colunas que não estão em nenhum dos dois ficam vazias (None) nessas linhas.
+        Retorno:
+          - Quantidade de linhas acrescentadas.
+        """
+        count = len(rows)
+        if not count:
+            return 0
+        self.__reserve(count)
+        start, end = self.__size, self.__size + count
+
+        transposed = list(zip(*rows))
+        for column in self.__columns:
+            if column in constants:
+                if column in self.__arrays:
+                    self.__arrays[column][start:end] = constants[column]
+                else:
+                    self.__add_run(column, constants[column], count)
+            elif (position:=positions.get(column)) is not None and position < len(transposed):
+                self.__array(column)[start:end] = transposed[position]
+            elif column in self.__runs:
+                self.__add_run(column, None, count)
+        self.__size = end
+        return count
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Monta o DataFrame com todas as linhas acumuladas, nas colunas de `columns`.
+        """
+        data:Dict[str, np.ndarray] = {}
+        for column in self.__columns:
+            if column in self.__arrays:
+                data[column] = self.__arrays[column][:self.__size]
+            elif column in self.__runs:
+                data[column] = self.__expand(self.__runs[column])
+            else:
+                data[column] = np.full(self.__size, None, dtype=object)
+        return pd.DataFrame(data, columns=self.__columns)
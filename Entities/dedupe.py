@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+from typing import List, Literal, Tuple
+
+DEFAULT_KEY:List[str] = [
+    'Agência',
+    'Conta',
+    'Data de Emissão',
+    'Valor Principal',
+    'Tipo',
+]
+
+FLAG_COLUMN = 'Duplicado'
+
+Mode = Literal['drop', 'flag']
+
+class DuplicateIndex:
+    """
+    Detecta linhas repetidas entre os extratos consolidados (ex: os arquivos 'CDB DI' e 'CDB' da mesma conta),
+    sem comparar linhas duas a duas: cada linha vira um hash de 64 bits das colunas da chave
+    (`pd.util.hash_pandas_object`, vetorizado) e os hashes já vistos ficam em arrays ordenados de uint64
+    (8 bytes por linha), consultados com busca binária. A primeira ocorrência é mantida.
+    Parâmetros:
+      - key: Colunas que identificam a mesma aplicação.
+      - mode: 'drop' remove as repetidas; 'flag' mantém todas e marca as repetidas na coluna `FLAG_COLUMN`.
+    """
+    @property
+    def key(self) -> List[str]:
+        return self.__key
+
+    @property
+    def mode(self) -> Mode:
+        return self.__mode
+
+    @property
+    def seen(self) -> int:
+        return sum(len(run) for run in self.__runs)
+
+    @property
+    def duplicates(self) -> int:
+        return self.__duplicates
+
+    def __init__(self, key:List[str]|None=None, *, mode:Mode='drop') -> None:
+        if mode not in ('drop', 'flag'):
+            raise ValueError(f"Modo inválido '{mode}', use 'drop' ou 'flag'")
+        self.__key:List[str] = list(key or DEFAULT_KEY)
+        self.__mode:Mode = mode
+        self.__duplicates:int = 0
+        # arrays ordenados e sem repetição; os menores são unidos aos maiores conforme crescem,
+        # então cada hash é reordenado apenas O(log n) vezes
+        self.__runs:List[np.ndarray] = []
+
+    def hashes(self, df:pd.DataFrame) -> np.ndarray:
+        """
+        Hash (uint64) de cada linha calculado sobre as colunas da chave.
+        """
+        if (missing:=[column for column in self.__key if column not in df.columns]):
+            raise KeyError(f"Colunas da chave de duplicidade não encontradas: {missing}")
+        return pd.util.hash_pandas_object(df[self.__key], index=False).to_numpy(dtype=np.uint64)
+
+    def __contains(self, hashes:np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.__runs:
+            position = np.searchsorted(run, hashes)
+            position[position == len(run)] = 0
+            found |= run[position] == hashes
+        return found
+
+    def __add(self, hashes:np.ndarray) -> None:
+        if not len(hashes):
+            return
+        self.__runs.append(np.unique(hashes))
+        while len(self.__runs) > 1 and len(self.__runs[-2]) <= 2 * len(self.__runs[-1]):
+            last = self.__runs.pop()
+            self.__runs[-1] = np.union1d(self.__runs[-1], last)
+
+    def mask(self, df:pd.DataFrame) -> np.ndarray:
+        """
+        Marca as linhas do DataFrame que repetem uma linha já vista (neste ou em DataFrames anteriores)
+        e registra as novas no índice.
+        Retorno:
+          - Array booleano, True para as repetidas.
+        """
+        if df.empty:
+            return np.zeros(0, dtype=bool)
+        hashes = self.hashes(df)
+        repeated = pd.Series(hashes).duplicated().to_numpy()
+        if self.__runs:
+            repeated |= self.__contains(hashes)
+        self.__add(hashes[~repeated])
+        self.__duplicates += int(repeated.sum())
+        return repeated
+
+    def apply(self, df:pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """
+        Aplica o modo configurado ao DataFrame.
+        Retorno:
+          - (DataFrame sem as repetidas ou com a coluna `FLAG_COLUMN`, quantidade de repetidas).
+        """
+        repeated = self.mask(df)
+        count = int(repeated.sum())
+        if self.__mode == 'flag':
+            return df.assign(**{FLAG_COLUMN: repeated}), count
+        if count:
+            df = df[~repeated]
+        return df, count
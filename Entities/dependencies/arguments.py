@@ -1,6 +1,6 @@
 import sys
 from typing import Dict, List
-from Entities.dependencies.logs import Logs, traceback
+import traceback
 from typing import Literal
 
 class Arguments:
@@ -25,6 +25,7 @@ class Arguments:
         if len(self.__argv) > 1:
             selected_argv = self.__argv[1]
             if selected_argv in self.__valid_arguments:
+                from Entities.dependencies.logs import Logs
                 try:
                     if len(self.__argv) == 3:
                         self.__valid_arguments[selected_argv](self.__argv[2]) #type: ignore
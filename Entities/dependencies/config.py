@@ -1,8 +1,10 @@
-import configparser
 import os
+import configparser
+from copy import deepcopy
 from typing import Dict
 import sys
 from getpass import getuser
+from Entities.dependencies.settings import settings
 
 try:
     from Entities.dependencies.default_config import default as default_config
@@ -23,19 +25,18 @@ class Config:
         if not os.path.exists(self.file_name):
             with open(self.file_name, 'w', encoding='utf-8')as _file:
                 _file.write("")
-            self.__config = configparser.ConfigParser()
             self.read()
+            config = self.__copy()
             if default_config:
                 for key, options in default_config.items():
-                    self.config.add_section(str(key))
+                    config.add_section(str(key))
                     if options:
                         for option, value in options.items():
-                            self.config[str(key)][option] = str(value)
-            self.__save()
+                            config[str(key)][option] = str(value)
+            self.__save(config)
             print(f"o arquivo '{self.file_name}' não existia então foi criado e o script sera encerrado!")
             sys.exit()
         else:
-            self.__config = configparser.ConfigParser()
             self.read()
         
     def __getitem__(self, section:str):
@@ -45,43 +46,56 @@ class Config:
             return {}
         
     def read(self):
-        self.__config.read(self.file_name, encoding='utf-8')
+        """
+        Carrega o arquivo pelo `settings` (lido de novo apenas se tiver sido alterado desde a última leitura).
+        """
+        self.__config = settings.config(self.file_name)
         
-    def __save(self) -> None:
+    def __copy(self) -> configparser.ConfigParser:
+        """
+        Cópia privada do `ConfigParser` compartilhado pelo `settings`: as alterações são feitas nela e só
+        chegam aos demais `Config` depois de gravadas no arquivo (o que invalida o cache).
+        """
+        return deepcopy(self.config)
+        
+    def __save(self, config:configparser.ConfigParser) -> None:
         with open(self.file_name, 'w', encoding='utf-8')as _file:
-            self.config.write(_file)
+            config.write(_file)
+        settings.invalidate(self.file_name)
         self.read()
         
     def add(self, *, section:str, **kwargs):
-        self.config.add_section(section)
-        
-        if kwargs:
-            for key, value in kwargs.items():
-                self.config[section][str(key)] = str(value)
-            self.__save()
-        else:
+        if not kwargs:
             raise Exception("nenhum atributo foi passado para alimentar o config")
+        
+        config = self.__copy()
+        config.add_section(section)
+        for key, value in kwargs.items():
+            config[section][str(key)] = str(value)
+        self.__save(config)
     
     def alt(self, *, section:str, **kwargs):
+        config = self.__copy()
         for key, value in kwargs.items():
             try:
-                self.config[section][str(key)] = str(value)
+                config[section][str(key)] = str(value)
             except Exception as error:
                 print(type(error),str(error), f"---> {key=}:{value=}")
-        self.__save()
+        self.__save(config)
         
     def delete(self, section:str, option:str="") -> None:
+        config = self.__copy()
         if option:
-            if self.config.has_option(section, option):
-                self.config.remove_option(section, option)
+            if config.has_option(section, option):
+                config.remove_option(section, option)
             else:
                 raise Exception(f"{option=} não foi encontrado")
         else:
-            if self.config.has_section(section):
-                self.config.remove_section(section)
+            if config.has_section(section):
+                config.remove_section(section)
             else:
                 raise Exception(f"{section=} não foi encontrado")
-        self.__save()
+        self.__save(config)
         
 if __name__ == "__main__":
     config = Config()        
@@ -4,6 +4,7 @@ from copy import deepcopy
 from random import randint
 from getpass import getuser
 from typing import Literal, Dict
+from Entities.dependencies.settings import settings
 
 class CredentialFileNotFoundError(Exception):
     def __init__(self, *args: object) -> None:
@@ -67,9 +68,9 @@ class Credential:
         
             #raise FileNotFoundError(f"{self.path=} não existe! então foi criar uma no repositorio, edite as credenciais e execute o codigo novamente!")
 
-        with open(self.path, 'r')as _file:
-            result:dict = json.load(_file)
-        
+        return settings.credential(self.path, self.__decode)
+    
+    def __decode(self, result:dict) -> dict:
         new_result = deepcopy(result)
         for key,value in new_result.items():
             if key == 'key':
@@ -89,6 +90,7 @@ class Credential:
             json.dump(
                 words,
                 _file)
+        settings.invalidate(self.path)
     
     def criar_cifra(self, text:str, key:int=1, response_json:bool=False) -> str:
         """criptografa a string informada orientada pela Key
@@ -103,10 +105,7 @@ class Credential:
         """
         if not isinstance(key, int):
             key = int(key)
-        result:str = ""
-        for letra in text:
-            codigo:int = ord(letra) + key
-            result += chr(codigo)
+        result:str = "".join([chr(ord(letra) + key) for letra in text])
         
         if response_json:    
             return json.dumps(result)
@@ -1,46 +1,51 @@
-import xlwings as xw
-from xlwings.main import Book
+import os
 from time import sleep
 from datetime import datetime
-import re
 import colorama
 colorama.init()
 from colorama import Fore
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
+if TYPE_CHECKING:
+    from xlwings.main import Book
 
 class Functions:
     @staticmethod
     def fechar_excel(path:str, *, timeout:int=1, wait:int=0) -> bool:
+        """
+        Fecha apenas a pasta de trabalho correspondente a `path` (pelo caminho completo ou pelo nome do arquivo).
+        A instância do Excel só é encerrada se tiver sido aberta por este processo (ver `resource_tracker`)
+        e ficar sem pastas abertas; a espera por esse encerramento é limitada a `timeout` segundos.
+        Retorno:
+          - True se a pasta estava aberta e foi fechada.
+        """
+        import xlwings as xw
+        from Entities.dependencies.resource_tracker import tracker
         if wait > 0:
             sleep(wait)
+        name = os.path.basename(path).lower()
         try:
             achou:bool = False
-            for _ in range(timeout):
-                for app in xw.apps:
-                    for open_app in app.books:
-                        open_app:Book
-                        if open_app.name in path:
-                            open_app.close()
-                            if len(xw.apps) <= 0:
-                                app.kill()                        
-                            achou = True
-                        if not re.search(r'Pasta[0-9]+', open_app.name) is None:
-                            open_app.close()
-                            if len(xw.apps) <= 0:
-                                app.kill()                        
-                sleep(1)
-            if achou:
-                return True
-            return False
+            own_pids = {tracked.pid for tracked in tracker.processes}
+            for app in list(xw.apps):
+                closed_here = False
+                for open_app in list(app.books):
+                    open_app:"Book"
+                    if open_app.fullname.lower() == path.lower() or open_app.name.lower() == name:
+                        open_app.close()
+                        closed_here = achou = True
+                if closed_here and app.pid in own_pids and len(app.books) <= 0:
+                    tracker.release(app.pid, timeout=timeout)
+            return achou
         except:
             return False
     
     @staticmethod
     def excel_open() -> list:
+        import xlwings as xw
         open_excel:list = []
         for app in xw.apps:
             for open_app in app.books:
-                open_app:Book
+                open_app:"Book"
                 open_excel.append(open_app.name)
         return open_excel
     
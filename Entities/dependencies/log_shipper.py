@@ -0,0 +1,250 @@
+import os
+import json
+import time
+import queue
+import atexit
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Tuple
+
+_STOP = object()
+
+class LogShipper:
+    """
+    Envia os registros do log online em segundo plano, sem bloquear quem registra.
+    Os registros entram em uma fila e uma thread os envia em lotes, reaproveitando as conexões
+    de um `requests.Session`, com timeout e um número limitado de tentativas (com espera crescente).
+    Quando o servidor não responde, os registros são gravados em `spill_path` (um JSON por linha)
+    e reenviados assim que o servidor voltar. Ao encerrar o processo, o que restar na fila é enviado
+    (ou gravado em disco) dentro de `exit_timeout` segundos.
+    Parâmetros:
+      - url: Endereço do endpoint (ex: 'http://servidor:8000/api/rpa_logs/registrar').
+      - headers: Cabeçalhos enviados em cada requisição (ex: Authorization).
+      - spill_path: Arquivo onde os registros não enviados são guardados.
+      - method: Método HTTP usado no envio.
+      - batch_size: Quantidade máxima de registros retirados da fila de uma vez.
+      - timeout: Timeout (s) de cada requisição.
+      - retries: Tentativas por registro antes de considerar o servidor indisponível.
+      - backoff: Espera inicial (s) entre tentativas; dobra a cada nova tentativa.
+      - cooldown: Tempo (s) em que, após uma falha, os registros vão direto para o disco.
+      - max_queue: Tamanho máximo da fila; acima disso os registros vão direto para o disco.
+      - exit_timeout: Tempo máximo (s) gasto no envio final ao encerrar o processo.
+    """
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self.__stats
+
+    @property
+    def spill_path(self) -> str:
+        return self.__spill_path
+
+    def __init__(self, url:str, *, headers:Dict[str, str]|None=None, spill_path:str=os.path.join(os.getcwd(), 'Logs', 'online_spill.jsonl'),
+                 method:str="PATCH", batch_size:int=20, timeout:float=5, retries:int=3, backoff:float=0.5, cooldown:float=30,
+                 max_queue:int=10000, exit_timeout:float=5) -> None:
+        self.__url:str = url
+        self.__method:str = method
+        self.__batch_size:int = batch_size
+        self.__timeout:float = timeout
+        self.__retries:int = retries
+        self.__backoff:float = backoff
+        self.__cooldown:float = cooldown
+        self.__exit_timeout:float = exit_timeout
+        self.__spill_path:str = spill_path
+        self.__spill_lock = threading.Lock()
+        self.__down_until:float = 0
+        # registros que a thread está enviando agora (e se contam como novos em 'spilled');
+        # se `close` desistir de esperar a thread, são gravados em disco por ele
+        self.__inflight:Tuple[List[dict], bool] = ([], True)
+        self.__inflight_lock = threading.Lock()
+        self.__abandoned:bool = False
+        self.__stats:Dict[str, int] = {'sent': 0, 'spilled': 0, 'dropped': 0, 'replayed': 0}
+
+        self.__session = requests.Session()
+        self.__session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+        self.__queue:queue.Queue = queue.Queue(maxsize=max_queue)
+        self.__closed = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name='LogShipper', daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    def submit(self, payload:dict) -> None:
+        """
+        Coloca o registro na fila de envio e retorna imediatamente.
+        """
+        if self.__closed.is_set():
+            self.__spill([payload])
+            return
+        try:
+            self.__queue.put_nowait(payload)
+        except queue.Full:
+            self.__spill([payload])
+
+    def flush(self, timeout:float|None=None) -> bool:
+        """
+        Aguarda (até `timeout` segundos) a fila ser esvaziada.
+        Retorno:
+          - True se todos os registros já foram tratados (enviados ou gravados em disco).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.__queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self) -> None:
+        """
+        Envia o que restar na fila (até `exit_timeout` segundos), grava o resto em disco e encerra a thread.
+        """
+        if self.__closed.is_set():
+            return
+        self.__closed.set()
+        deadline = time.monotonic() + self.__exit_timeout
+        self.flush(self.__exit_timeout)
+        self.__queue.put(_STOP)
+        self.__thread.join(max(deadline - time.monotonic(), 0))
+        if self.__thread.is_alive():
+            # a thread está presa em um envio (ex: servidor que aceita a conexão e não responde)
+            with self.__inflight_lock:
+                self.__abandoned = True
+                inflight, count = self.__inflight
+                self.__inflight = ([], True)
+            self.__spill(inflight, count=count)
+        leftover:List[dict] = []
+        while True:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        self.__spill(leftover)
+        self.__session.close()
+
+    def __run(self) -> None:
+        while True:
+            item = self.__queue.get()
+            if item is _STOP:
+                self.__queue.task_done()
+                return
+            batch:List[dict] = [item]
+            while len(batch) < self.__batch_size:
+                try:
+                    item = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self.__queue.put(_STOP)
+                    self.__queue.task_done()
+                    break
+                batch.append(item)
+            try:
+                self.__ship(batch)
+            finally:
+                for _ in batch:
+                    self.__queue.task_done()
+
+    def __ship(self, batch:List[dict]) -> None:
+        for position, payload in enumerate(batch):
+            if not self.__sending(batch[position:], count=True):
+                if position == 0:
+                    # lote retirado da fila depois de `close` desistir da thread: ninguém mais o gravou
+                    self.__spill(batch)
+                return
+            if time.monotonic() < self.__down_until or not self.__send(payload):
+                if self.__sending([], count=True):
+                    self.__spill(batch[position:])
+                return
+        if self.__sending([], count=True):
+            self.__replay()
+
+    def __sending(self, payloads:List[dict], *, count:bool) -> bool:
+        """
+        Registra os registros em envio pela thread.
+        Retorno:
+          - False se `close` já desistiu da thread (e gravou esses registros em disco); a thread não deve fazer mais nada.
+        """
+        with self.__inflight_lock:
+            if self.__abandoned:
+                return False
+            self.__inflight = (payloads, count)
+            return True
+
+    def __send(self, payload:dict) -> bool:
+        """
+        Envia um registro com até `retries` tentativas.
+        Retorno:
+          - True se o servidor aceitou (ou recusou definitivamente) o registro; False se estiver indisponível.
+        """
+        data = json.dumps(payload)
+        for attempt in range(self.__retries):
+            if attempt and self.__closed.is_set():
+                break
+            try:
+                response = self.__session.request(self.__method, self.__url, data=data, timeout=self.__timeout)
+                if response.status_code < 500 and response.status_code not in (408, 429):
+                    self.__stats['dropped' if response.status_code >= 400 else 'sent'] += 1
+                    return True
+            except requests.RequestException:
+                pass
+            if attempt + 1 < self.__retries and not self.__closed.is_set():
+                time.sleep(self.__backoff * 2 ** attempt)
+        self.__down_until = time.monotonic() + self.__cooldown
+        return False
+
+    def __spill(self, payloads:List[dict], *, count:bool=True) -> None:
+        if not payloads:
+            return
+        with self.__spill_lock:
+            folder = os.path.dirname(self.__spill_path)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder)
+            with open(self.__spill_path, 'a', encoding='utf-8') as _file:
+                for payload in payloads:
+                    _file.write(json.dumps(payload) + '\n')
+        if count:
+            self.__stats['spilled'] += len(payloads)
+
+    def __replay(self) -> None:
+        """
+        Reenvia os registros guardados em disco, depois de um envio bem-sucedido.
+        """
+        if self.__closed.is_set() or not os.path.exists(self.__spill_path):
+            return
+        replay_path = f"{self.__spill_path}.{os.getpid()}.replay"
+        with self.__spill_lock:
+            try:
+                os.replace(self.__spill_path, replay_path)
+            except OSError:
+                return
+        with open(replay_path, 'r', encoding='utf-8') as _file:
+            payloads = [json.loads(line) for line in _file if line.strip()]
+        os.unlink(replay_path)
+
+        for position, payload in enumerate(payloads):
+            if not self.__sending(payloads[position:], count=False):
+                return
+            if self.__closed.is_set() or time.monotonic() < self.__down_until or not self.__send(payload):
+                if self.__sending([], count=False):
+                    self.__spill(payloads[position:], count=False)
+                return
+            self.__stats['replayed'] += 1
+        self.__sending([], count=False)
+
+_shippers:Dict[Tuple[str, str], LogShipper] = {}
+_shippers_lock = threading.Lock()
+
+def get_shipper(url:str, token:str, **kwargs) -> LogShipper:
+    """
+    Retorna o `LogShipper` do endpoint (um por url/token no processo), criando-o na primeira chamada.
+    """
+    with _shippers_lock:
+        if (url, token) not in _shippers:
+            headers = {"Authorization": f"Token {token}", "Content-Type": "application/json"}
+            _shippers[(url, token)] = LogShipper(url, headers=headers, **kwargs)
+        return _shippers[(url, token)]
@@ -5,8 +5,6 @@ from datetime import datetime
 import re
 from .functions import Functions
 import traceback
-import requests
-import json
 from getpass import getuser
 from socket import gethostname
 from .project_name import PROJECT_NAME
@@ -23,26 +21,48 @@ class Logs:
     def name(self) -> str:
         return self.__name
     
-    def __init__(self, name:str=PROJECT_NAME, *, path_folder:str=os.path.join(os.getcwd(), 'Logs'), hostname:str=Config()['log']['hostname'], port:str=Config()['log']['port'], token:str=Credential(Config()['log']['token']).load()['token']) -> None:
+    @property
+    def hostname(self) -> str:
+        if self.__hostname is None:
+            self.__hostname = Config()['log']['hostname']
+        return self.__hostname
+    
+    @property
+    def port(self) -> str:
+        if self.__port is None:
+            self.__port = Config()['log']['port']
+        return self.__port
+    
+    @property
+    def token(self) -> str:
+        if self.__token is None:
+            self.__token = Credential(Config()['log']['token']).load()['token']
+        return self.__token
+    
+    def __init__(self, name:str=PROJECT_NAME, *, path_folder:str=os.path.join(os.getcwd(), 'Logs'), hostname:str|None=None, port:str|None=None, token:str|None=None) -> None:
+        """
+        Parâmetros:
+          - hostname, port, token: Servidor de logs online; quando não informados, são lidos do `Config`
+            e do `Credential` apenas no primeiro envio.
+        """
         self.__path_folder:str = path_folder
         self.__name:str = name
         if not os.path.exists(self.path_folder):
             os.makedirs(self.path_folder)
             
-        self.__hostname:str = hostname
-        self.__port:str = port
-        self.__token:str = token
+        self.__hostname:str|None = hostname
+        self.__port:str|None = port
+        self.__token:str|None = token
             
     def online_register(self, *, name_rpa:str, status:Literal[0,1,2,99], date:datetime, descricao:str, exception:str="", nome_pc:str="", nome_agente=""):
+        """
+        Coloca o registro na fila de envio ao servidor de logs (ver `LogShipper`) e retorna sem esperar a resposta.
+        """
         try:
-            reqUrl = f"http://{self.__hostname}:{self.__port}/api/rpa_logs/registrar"
-
-            headersList = {
-            "Authorization": f"Token {self.__token}",
-            "Content-Type": "application/json" 
-            }
+            from .log_shipper import get_shipper
+            reqUrl = f"http://{self.hostname}:{self.port}/api/rpa_logs/registrar"
 
-            payload = json.dumps({
+            payload = {
             "nome_rpa": str(name_rpa),
             "nome_pc" : str(nome_pc),
             "nome_agente": str(nome_agente),
@@ -50,11 +70,9 @@ class Logs:
             "horario" : date.strftime('%d/%m/%Y %H:%M:%S'),
             "descricao": str(descricao),
             "exception": str(exception)
-            })
-
-            response = requests.request("PATCH", reqUrl, data=payload,  headers=headersList)
+            }
 
-            #print(response.text)
+            get_shipper(reqUrl, self.token, spill_path=os.path.join(self.path_folder, 'online_spill.jsonl')).submit(payload)
         except Exception as error:
             print(error)
                     
@@ -0,0 +1,209 @@
+import time
+import atexit
+import threading
+import subprocess
+from typing import Callable, Dict, List, Tuple
+
+import psutil
+
+class TrackedProcess:
+    """
+    Processo registrado no `ResourceTracker`, identificado pelo PID e pelo horário de criação
+    (para não confundir com outro processo que venha a reutilizar o mesmo PID).
+    """
+    @property
+    def pid(self) -> int:
+        return self.__pid
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def process(self) -> psutil.Process|None:
+        """
+        `psutil.Process` do processo registrado, ou None se ele já terminou (ou o PID foi reutilizado).
+        """
+        try:
+            process = psutil.Process(self.__pid)
+            if process.create_time() != self.__create_time:
+                return None
+            return process
+        except psutil.Error:
+            return None
+
+    def __init__(self, pid:int, name:str="") -> None:
+        self.__pid:int = pid
+        process = psutil.Process(pid)
+        self.__create_time:float = process.create_time()
+        self.__name:str = name or process.name()
+
+    def is_running(self) -> bool:
+        process = self.process
+        return process is not None and process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+
+    def __repr__(self) -> str:
+        return f"<TrackedProcess {self.name} pid={self.pid}>"
+
+class ResourceTracker:
+    """
+    Registra os processos e objetos abertos por este processo (Excel, SAP Logon, pastas de trabalho...)
+    e encerra exatamente esses, com esperas limitadas, em vez de varrer e matar tudo o que estiver aberto na máquina.
+    Processos são encerrados com terminate e, se não saírem em `timeout` segundos, com kill.
+    Parâmetros:
+      - timeout: Espera máxima (s) padrão pelo encerramento de cada grupo de processos.
+    """
+    @property
+    def processes(self) -> List[TrackedProcess]:
+        with self.__lock:
+            return list(self.__processes.values())
+
+    @property
+    def handles(self) -> List[str]:
+        with self.__lock:
+            return [name for name, _ in self.__handles.values()]
+
+    def __init__(self, *, timeout:float=5) -> None:
+        self.__timeout:float = timeout
+        self.__lock = threading.RLock()
+        self.__processes:Dict[int, TrackedProcess] = {}
+        self.__handles:Dict[int, Tuple[str, Callable[[], None]]] = {}
+
+    def track_process(self, pid:int, *, name:str="") -> TrackedProcess|None:
+        """
+        Passa a controlar o processo com o PID informado (ex: `app.pid` do xlwings).
+        Retorno:
+          - O `TrackedProcess`, ou None se o processo já não existir.
+        """
+        try:
+            tracked = TrackedProcess(pid, name)
+        except psutil.Error:
+            return None
+        with self.__lock:
+            self.__processes[pid] = tracked
+        return tracked
+
+    def spawn(self, args:str|list, *, name:str="", **popen_kwargs) -> subprocess.Popen:
+        """
+        Inicia um processo com `subprocess.Popen` e já o registra.
+        """
+        process = subprocess.Popen(args, **popen_kwargs)
+        self.track_process(process.pid, name=name)
+        return process
+
+    def track(self, handle:object, close:Callable[[], None], *, name:str="") -> object:
+        """
+        Registra um objeto que precisa ser fechado (ex: pasta de trabalho) e a função que o fecha.
+        Retorno:
+          - O próprio objeto, para uso em atribuições.
+        """
+        with self.__lock:
+            self.__handles[id(handle)] = (name or repr(handle), close)
+        return handle
+
+    def untrack(self, handle:object) -> None:
+        """
+        Remove o objeto do controle sem fechá-lo (ex: quando ele já foi fechado normalmente).
+        """
+        with self.__lock:
+            self.__handles.pop(id(handle), None)
+
+    def close_handle(self, handle:object) -> bool:
+        """
+        Fecha um objeto registrado. Erros ao fechar são ignorados.
+        Retorno:
+          - True se o objeto estava registrado.
+        """
+        with self.__lock:
+            entry = self.__handles.pop(id(handle), None)
+        if entry is None:
+            return False
+        try:
+            entry[1]()
+        except Exception:
+            pass
+        return True
+
+    def find(self, predicate:Callable[[TrackedProcess], bool]) -> List[TrackedProcess]:
+        """
+        Processos registrados (e ainda em execução) que atendem ao filtro, ex: `lambda p: 'sap' in p.name.lower()`.
+        """
+        return [tracked for tracked in self.processes if predicate(tracked) and tracked.is_running()]
+
+    def release(self, *pids:int, timeout:float|None=None) -> List[int]:
+        """
+        Encerra os processos registrados informados (todos, se nenhum for informado), aguardando no máximo
+        `timeout` segundos pelo terminate e mais `timeout` segundos pelo kill dos que sobrarem.
+        PIDs não registrados por este rastreador são ignorados.
+        Retorno:
+          - PIDs que continuaram em execução mesmo após o kill.
+        """
+        timeout = self.__timeout if timeout is None else timeout
+        with self.__lock:
+            selected = [self.__processes.pop(pid) for pid in (pids or list(self.__processes)) if pid in self.__processes]
+
+        processes:List[psutil.Process] = []
+        for tracked in selected:
+            if (process:=tracked.process) is not None:
+                processes.append(process)
+        if not processes:
+            return []
+
+        for process in processes:
+            try:
+                process.terminate()
+            except psutil.Error:
+                pass
+        _, alive = psutil.wait_procs(processes, timeout=timeout)
+        for process in alive:
+            try:
+                process.kill()
+            except psutil.Error:
+                pass
+        _, alive = psutil.wait_procs(alive, timeout=timeout)
+        return [process.pid for process in alive]
+
+    def close_all(self, timeout:float|None=None) -> List[int]:
+        """
+        Fecha todos os objetos registrados (do mais recente ao mais antigo) e encerra todos os processos registrados.
+        Retorno:
+          - PIDs que não puderam ser encerrados.
+        """
+        with self.__lock:
+            handles = list(self.__handles.keys())
+        for key in reversed(handles):
+            with self.__lock:
+                entry = self.__handles.pop(key, None)
+            if entry is not None:
+                try:
+                    entry[1]()
+                except Exception:
+                    pass
+        return self.release(timeout=timeout)
+
+    def __enter__(self) -> "ResourceTracker":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close_all()
+
+def wait_until(predicate:Callable[[], object], *, timeout:float, interval:float=0.1) -> object:
+    """
+    Verifica `predicate` a cada `interval` segundos até ele retornar um valor verdadeiro ou o tempo acabar.
+    Exceções lançadas pelo `predicate` contam como "ainda não".
+    Retorno:
+      - O último valor retornado (falso se o tempo acabou).
+    """
+    deadline = time.monotonic() + timeout
+    result:object = None
+    while True:
+        try:
+            result = predicate()
+        except Exception:
+            result = None
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+
+tracker = ResourceTracker()
+atexit.register(tracker.close_all)
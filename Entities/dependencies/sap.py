@@ -1,9 +1,9 @@
 from Entities.dependencies.logs import Logs
 from Entities.dependencies.functions import P
+from Entities.dependencies.resource_tracker import tracker, wait_until
 import win32com.client
 from functools import wraps
 import psutil
-import subprocess
 from time import sleep
 import traceback
 import sys
@@ -63,11 +63,15 @@ class SAPManipulation():
     @property
     def log(self) -> Logs:
         """
-        Retorna um objeto de log.
+        Retorna o objeto de log (criado no primeiro acesso e reaproveitado nos seguintes).
 
         :return: Objeto de log.
         """
-        return Logs()
+        try:
+            return self.__log
+        except AttributeError:
+            self.__log:Logs = Logs()
+            return self.__log
     
     @property
     def using_active_conection(self) -> bool:
@@ -167,8 +171,8 @@ class SAPManipulation():
             if not self.using_active_conection:
                 try:
                     if not self.__verificar_sap_aberto():
-                        subprocess.Popen(r"C:\Program Files (x86)\SAP\FrontEnd\SapGui\saplogon.exe")
-                        sleep(5)
+                        tracker.spawn(r"C:\Program Files (x86)\SAP\FrontEnd\SapGui\saplogon.exe", name='saplogon')
+                        wait_until(lambda: win32com.client.GetObject("SAPGUI"), timeout=30, interval=0.5)
                     
                     SapGuiAuto: win32com.client.CDispatch = win32com.client.GetObject("SAPGUI")# type: ignore
                     application: win32com.client.CDispatch = SapGuiAuto.GetScriptingEngine# type: ignore
@@ -298,11 +302,15 @@ class SAPManipulation():
         return False    
     
     
-    def finalizar_programa_sap(self):
-        for proc in psutil.process_iter(['name']):
-            if "sap" in proc.info['name'].lower():
-                proc.kill()
-                print("Processo SAP encerrado.")    
+    def finalizar_programa_sap(self, timeout:float=5):
+        """
+        Encerra apenas os processos do SAP iniciados por este processo (registrados no `resource_tracker`),
+        esperando no máximo `timeout` segundos; instâncias abertas pelo usuário ou por outros processos não são afetadas.
+        """
+        own = tracker.find(lambda tracked: "sap" in tracked.name.lower())
+        if own:
+            tracker.release(*[tracked.pid for tracked in own], timeout=timeout)
+            print("Processo SAP encerrado.")
     
     # Método de teste         
     @start_SAP
@@ -0,0 +1,63 @@
+import os
+import json
+import threading
+import configparser
+from copy import deepcopy
+from typing import Callable, Dict, Tuple
+
+class SettingsService:
+    """
+    Cache, compartilhado pelo processo inteiro, dos arquivos de configuração (`config.init`) e de credenciais.
+    Cada arquivo é lido e interpretado uma única vez e só volta a ser lido quando a data de modificação
+    (ou o tamanho) mudar. Pode ser usado por várias threads ao mesmo tempo.
+    """
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__entries:Dict[Tuple[str, str], Tuple[Tuple[int, int], object]] = {}
+
+    def __get(self, kind:str, file_path:str, load:Callable[[str], object]) -> object:
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (kind, file_path)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+            value = load(file_path)
+            self.__entries[key] = (signature, value)
+            return value
+
+    def config(self, file_path:str) -> configparser.ConfigParser:
+        """
+        Retorna o `ConfigParser` do arquivo. O objeto é compartilhado e não deve ser alterado: para mudar a
+        configuração, altere uma cópia e grave no arquivo (como faz `Config`), o que invalida o cache automaticamente.
+        """
+        def load(path:str) -> configparser.ConfigParser:
+            parser = configparser.ConfigParser()
+            parser.read(path, encoding='utf-8')
+            return parser
+        return self.__get('config', file_path, load) # type: ignore
+
+    def credential(self, file_path:str, decode:Callable[[dict], dict]) -> dict:
+        """
+        Retorna uma cópia das credenciais já decifradas por `decode`.
+        """
+        def load(path:str) -> dict:
+            with open(path, 'r') as _file:
+                return decode(json.load(_file))
+        return deepcopy(self.__get('credential', file_path, load)) # type: ignore
+
+    def invalidate(self, file_path:str|None=None) -> None:
+        """
+        Descarta o cache de um arquivo (ou de todos).
+        """
+        with self.__lock:
+            if file_path is None:
+                self.__entries.clear()
+                return
+            file_path = os.path.abspath(file_path)
+            for key in [key for key in self.__entries if key[1] == file_path]:
+                del self.__entries[key]
+
+settings = SettingsService()
@@ -1,6 +1,115 @@
 import os
 from getpass import getuser
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+class PathIndex:
+    """
+    Índice persistente (JSON) de alvos já localizados: {alvo: caminho}.
+    Mantém todos os alvos no mesmo arquivo, valida cada entrada na leitura (a pasta ainda existe e ainda
+    contém o alvo) e guarda uma cópia em memória, relida apenas quando o arquivo for alterado.
+    Parâmetros:
+      - file_path: Caminho do arquivo do índice.
+    """
+    __lock = threading.Lock()
+    __memory:Dict[str, tuple] = {}
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    def __init__(self, file_path:str) -> None:
+        self.__file_path:str = file_path
+
+    def __load(self) -> Dict[str, str]:
+        try:
+            mtime = os.stat(self.__file_path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        cached = PathIndex.__memory.get(self.__file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(self.__file_path, 'r', encoding='utf-8') as _file:
+                data = json.load(_file)
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        PathIndex.__memory[self.__file_path] = (mtime, data)
+        return data
+
+    def __save(self, data:Dict[str, str]) -> None:
+        temp_path = f"{self.__file_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as _file:
+            json.dump(data, _file, ensure_ascii=False, indent=4)
+        os.replace(temp_path, self.__file_path)
+        PathIndex.__memory.pop(self.__file_path, None)
+
+    def get(self, target:str) -> str|None:
+        """
+        Retorna o caminho registrado para o alvo, se ainda for válido; entradas inválidas são descartadas.
+        """
+        with PathIndex.__lock:
+            path = self.__load().get(target)
+        if not path:
+            return None
+        if target in path and os.path.isdir(path):
+            return path
+        self.discard(target)
+        return None
+
+    def put(self, target:str, path:str) -> None:
+        """
+        Registra o caminho do alvo preservando os demais alvos do índice.
+        """
+        with PathIndex.__lock:
+            data = dict(self.__load())
+            data[target] = path
+            self.__save(data)
+
+    def discard(self, target:str) -> None:
+        with PathIndex.__lock:
+            data = dict(self.__load())
+            if data.pop(target, None) is not None:
+                self.__save(data)
+
+def _list_dirs(path:str) -> List[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+def search_path(target:str, initial_path:str, *, max_depth:int=8, workers:int=8) -> str|None:
+    """
+    Procura, a partir de `initial_path`, a primeira pasta cujo caminho contém `target`.
+    A busca é feita nível a nível (as pastas mais rasas primeiro) com `os.scandir`, listando as pastas de cada
+    nível em paralelo, e termina no primeiro nível em que houver correspondência.
+    Parâmetros:
+      - target: Trecho do caminho procurado (ex: 'RPA - Dados\\Relatorios Auditoria\\KPMG').
+      - initial_path: Pasta inicial da busca.
+      - max_depth: Profundidade máxima, contada a partir de `initial_path`.
+      - workers: Threads usadas para listar as pastas.
+    Retorno:
+      - Caminho encontrado (o primeiro em ordem alfabética entre os do nível mais raso) ou None.
+    """
+    if target in initial_path and os.path.isdir(initial_path):
+        return initial_path
+    level:List[str] = [initial_path]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(max_depth):
+            if not level:
+                break
+            next_level:List[str] = []
+            for children in executor.map(_list_dirs, level):
+                next_level.extend(children)
+            if found:=sorted(path for path in next_level if target in path):
+                return found[0]
+            level = next_level
+    return None
 
 class SharepointFolders:
     @property
@@ -11,42 +120,39 @@ class SharepointFolders:
             else:
                 raise Exception(f"não foi possivel encontrar o caminho '{self.__value}'")
         raise Exception("value esta vazio")
-            
-    
-    def __init__(self, target:str , *, initial_path:str=f'C:\\Users\\{getuser()}') -> None:
-        self.__file_register_path = os.path.join(os.getcwd(), 'register.json')
-        if not os.path.exists(self.__file_register_path):
-            with open(self.__file_register_path, 'w', encoding='utf-8') as _file:
-                json.dump({}, _file)
-                
+
+
+    def __init__(self, target:str , *, initial_path:str=f'C:\\Users\\{getuser()}', max_depth:int=8, workers:int=8) -> None:
+        """
+        Localiza a pasta sincronizada do SharePoint que contém `target`.
+        O caminho é consultado primeiro no índice 'register.json' (que guarda todos os alvos já encontrados);
+        se não estiver lá, ou não for mais válido, é feita a busca em `initial_path` e o resultado é registrado.
+        Parâmetros:
+          - target: Trecho do caminho procurado.
+          - initial_path: Pasta inicial da busca.
+          - max_depth: Profundidade máxima da busca.
+          - workers: Threads usadas na busca.
+        """
+        self.__index = PathIndex(os.path.join(os.getcwd(), 'register.json'))
+        self.__max_depth:int = max_depth
+        self.__workers:int = workers
+
         self.__value = ""
-        if (value:=self.__read().get(target)):
+        if (value:=self.__index.get(target)):
             self.__value = value
         else:
-            self.__value = self.find_path(target=target, initial_path=initial_path)
-            self.__register(target, self.__value)
-        
-    
-    def __read(self) -> dict:
-        with open(self.__file_register_path, 'r', encoding='utf-8')as _file:
-            return json.load(_file)
-        
-    def __register(self, key, value):
-        with open(self.__file_register_path, 'w', encoding='utf-8') as _file:
-            json.dump({key:value}, _file)
+            self.__value = self.find_path(target=target, initial_path=initial_path) or ""
+            if self.__value:
+                self.__index.put(target, self.__value)
 
     def find_path(self, *, target,  initial_path):
-        base_path = initial_path
-        for path, file, folder in os.walk(base_path):
-            if target in path:
-                return path
-            
+        return search_path(target, initial_path, max_depth=self.__max_depth, workers=self.__workers)
+
     def __repr__(self) -> str:
         return self.value
-    
+
     def __str__(self) -> str:
         return self.value
-    
+
 if __name__ == "__main__":
     SharepointFolders("RPA - Dados\\Relatorios Auditoria\\KPMG").value
-    
\ No newline at end of file
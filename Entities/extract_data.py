@@ -1,64 +1,47 @@
 import os
+import time
 import pandas as pd
-import xlwings as xw
 import re
 import multiprocessing as mp
-from xlwings.main import Sheet
-from xlwings.main import Range
-from xlwings.main import Book
-from typing import Literal
+from multiprocessing.util import Finalize
+from typing import Dict, Iterator, List, Literal, Tuple
+from bisect import bisect_right
 from datetime import datetime
-from dependencies.functions import Functions
-from time import sleep
 import traceback
-from logInformativo import LogInformativo
+from readers import open_workbook, Engine, SheetGrid, WorkbookSession
+from parse_cache import ParseCache
+from schema import coerce_types
+from accumulator import ColumnAccumulator
+from records import StatementRecord, section_records
+from tracing import tracer
+from readers.grid import column_index
 
 
-valid_sheet = 'Sheet0'
+EXTRACTOR_VERSION = '4'
 
-def __find_ranged_lines(ws:Sheet, *, tipo:Literal['Aplicações', 'Resgates / Vencimentos'], firs_column_letter:str="A",last_column_letter:str) -> Range:
-    """
-    Localiza e retorna o intervalo de linhas que contém registros do tipo especificado.
-    Parâmetros:
-      - ws: Planilha (`Sheet`) onde serão pesquisadas as linhas.
-      - tipo: Uma string que define se o trecho é de "Aplicações" ou "Resgates / Vencimentos".
-      - firs_column_letter: Letra da primeira coluna a analisar (padrão "A").
-      - last_column_letter: Letra da última coluna a analisar.
-    Retorno:
-      - `Range` correspondente às linhas localizadas.
-    """
-    result = {}
-    achou_primeiro = False
-    for num in range(1,ws.used_range.last_cell.row):
-        cell = ws.range(f'{firs_column_letter}{num}')
-
-        if not achou_primeiro:
-            if cell.value == tipo:
-                result['start'] =  num + 1
-                achou_primeiro = True
-        else:
-            if cell.value == 'Total':
-                result['end'] =  num - 1
-                break
-    return ws.range(f'{firs_column_letter}{result["start"]}:{last_column_letter}{result["end"]}')
-
-def __find_line(ws:Sheet, *, value:Literal['Dt. Aplicação', 'Empresa/CNPJ', 'Agência/conta'], firs_column_letter:str="A", last_column_letter:str) -> Range:
-    """
-    Encontra uma linha que contenha o texto especificado.
-    Parâmetros:
-      - ws: Planilha (`Sheet`) onde será feita a busca.
-      - value: Texto exato a ser procurado.
-      - firs_column_letter e last_column_letter: Definem o intervalo de colunas na planilha.
-    Retorno:
-      - Retorna o `Range` da linha encontrada ou `None` se não existir.
-    """
-    for num in range(1,ws.used_range.last_cell.row):
-        cell = ws.range(f'{firs_column_letter}{num}')
-        #print(cell.value)
-        if cell.value:
-            if value in cell.value:
-                return ws.range(f'{firs_column_letter}{num}:{last_column_letter}{num}')
-    return None
+COLUMNS:List[str] = [
+    'Período',
+    'Agência',
+    'Conta',
+    'CPF/CNPJ',
+    'Nome',
+    'Tipo',
+    'Certificado',
+    'Data de Emissão',
+    'Data de Vencto',
+    'Taxa/ PCT',
+    'Valor Principal',
+    'Valor da Renda',
+    'Valor de IOF(*)',
+    'Valor de IRRF(*)',
+    'Valor de Resgate',
+    'Data de Pagto',
+    'Vlr da Renda',
+    'Valor de IOF',
+    'Valor de IRRF',
+    'Valor do Crédito',
+    'Renda no Mês',
+]
 
 def verify_file(file_path:str) -> bool:
     """
@@ -74,51 +57,159 @@ def verify_file(file_path:str) -> bool:
         raise ValueError(f"O arquivo não é um arquivo xls válido")
     return file_path
 
-def __get_agencia_conta(ws: Sheet) -> dict:
-    """
-    Extrai os dados de agência e conta de uma linha específica da planilha.
-    Parâmetros:
-      - ws: Planilha (`Sheet`) de onde serão extraídos os dados.
-    Retorno:
-      - Dicionário com as chaves "agencia" e "conta" ou mensagens de erro se não encontradas.
-    """
-    result = {}
-    text = __find_line(ws, value='Agência/conta', last_column_letter='A').value
-    
-    if (agencia:=re.search(r'(\d{4})', text)):
-        result['agencia'] = agencia.group()
-    else:
-        result['agencia'] = "Agencia não encontrada"
-        
-    if (conta:=re.search(r'(\d+-\d)', text)):
-        result['conta'] = conta.group()
-    else:
-        result['conta'] = "Conta não encontrada"
+_MARKERS = re.compile(
+    r"(?P<header>Dt\. Aplicação)"
+    r"|(?P<empresa>Empresa/CNPJ)"
+    r"|(?P<agencia>Agência/conta)"
+    r"|^(?P<aplicacoes>Aplicações)$"
+    r"|^(?P<resgates>Resgates / Vencimentos)$"
+    r"|^(?P<total>Total)$"
+)
+_SECTION_GROUPS = {'Aplicações': 'aplicacoes', 'Resgates / Vencimentos': 'resgates'}
+_AGENCIA = re.compile(r'(\d{4})')
+_CONTA = re.compile(r'(\d+-\d)')
+_EMPRESA = re.compile(r'(?<=[:])[\w\d\D ]+(?=[|])')
+_CNPJ = re.compile(r'(?<=[|])[\w\d\D ]+')
 
-    return result
-
-def __get_empresa_cnpj(ws:Sheet) -> dict:
+class StatementIndex:
     """
-    Obtém informações sobre a empresa e seu CNPJ.
-    Parâmetros:
-      - ws: Planilha (`Sheet`) de onde serão extraídos os dados.
-    Retorno:
-      - Dicionário com as chaves "empresa" e "cnpj" ou mensagens de erro se não encontradas.
+    Índice das linhas marcadoras de um extrato ('Dt. Aplicação', 'Empresa/CNPJ', 'Agência/conta',
+    'Aplicações', 'Resgates / Vencimentos' e todos os 'Total'), montado com uma única passada pela
+    primeira coluna da planilha. Os dados de agência/conta e empresa/CNPJ são interpretados uma única vez.
     """
-    result = {}
-    text = __find_line(ws, value='Empresa/CNPJ', last_column_letter='A').value
+    @property
+    def ws(self) -> SheetGrid:
+        return self.__ws
+    
+    @property
+    def rows(self) -> Dict[str, int]:
+        return self.__rows
+    
+    @property
+    def total_rows(self) -> List[int]:
+        return self.__total_rows
     
-    if (empresa:=re.search(r'(?<=[:])[\w\d\D ]+(?=[|])', text)):
-        result['empresa'] = empresa.group().strip()
-    else:
-        result['empresa'] = "Empresa não encontrada"
+    def __init__(self, ws:SheetGrid, *, firs_column_letter:str="A", first_row:int=1, last_row:int|None=None) -> None:
+        """
+        Parâmetros:
+          - ws: Grade da planilha (`SheetGrid`) a ser indexada.
+          - firs_column_letter: Letra da coluna onde ficam os marcadores (padrão "A").
+          - first_row, last_row: Trecho da planilha (1-based, inclusivo) ocupado pelo extrato; padrão é a planilha toda.
+        """
+        self.__ws:SheetGrid = ws
+        self.__first_column:int = column_index(firs_column_letter)
+        self.__rows:Dict[str, int] = {}
+        self.__total_rows:List[int] = []
+        self.__agencia_conta:dict|None = None
+        self.__empresa_cnpj:dict|None = None
         
-    if (cnpj:=re.search(r'(?<=[|])[\w\d\D ]+', text)):
-        result['cnpj'] = cnpj.group().strip()   
-    else:
-        result['cnpj'] = "CNPJ não encontrado"      
+        column = ws.column(self.__first_column)
+        last_row = len(column) if last_row is None else min(last_row, len(column))
+        for num in range(first_row, last_row + 1):
+            cell = column[num - 1]
+            if not isinstance(cell, str):
+                continue
+            if not (match:=_MARKERS.search(cell)):
+                continue
+            if match.lastgroup == 'total':
+                self.__total_rows.append(num)
+            else:
+                self.__rows.setdefault(match.lastgroup, num)
+    
+    @staticmethod
+    def split(ws:SheetGrid, *, firs_column_letter:str="A") -> List["StatementIndex"]:
+        """
+        Separa a planilha em extratos: um novo extrato começa quando um marcador de cabeçalho
+        ('Empresa/CNPJ', 'Agência/conta', 'Dt. Aplicação', 'Aplicações' ou 'Resgates / Vencimentos')
+        se repete dentro do extrato atual.
+        Retorno:
+          - Um `StatementIndex` para cada extrato encontrado (lista vazia se a planilha não tiver marcadores).
+        """
+        starts:List[int] = []
+        seen:set = set()
+        for num, cell in enumerate(ws.column(column_index(firs_column_letter)), start=1):
+            if not isinstance(cell, str) or not (match:=_MARKERS.search(cell)) or match.lastgroup == 'total':
+                continue
+            if not starts or match.lastgroup in seen:
+                starts.append(num)
+                seen = set()
+            seen.add(match.lastgroup)
         
-    return result
+        bounds = zip(starts, [start - 1 for start in starts[1:]] + [None])
+        return [StatementIndex(ws, firs_column_letter=firs_column_letter, first_row=first, last_row=last) for first, last in bounds]
+    
+    def has_section(self, tipo:Literal['Aplicações', 'Resgates / Vencimentos']) -> bool:
+        return _SECTION_GROUPS[tipo] in self.__rows
+    
+    def __text(self, group:str) -> str:
+        if (num:=self.__rows.get(group)) is None:
+            return ""
+        return self.__ws.cell(num, self.__first_column)
+    
+    def header(self, *, last_column_letter:str) -> list|None:
+        """
+        Retorna os valores da linha de cabeçalho ('Dt. Aplicação') ou `None` se não existir.
+        """
+        if (num:=self.__rows.get('header')) is None:
+            return None
+        return self.__ws.values(num, num, self.__first_column, column_index(last_column_letter))[0]
+    
+    def section(self, tipo:Literal['Aplicações', 'Resgates / Vencimentos'], *, last_column_letter:str) -> List[list]:
+        """
+        Retorna as linhas entre o marcador do tipo informado e o 'Total' seguinte.
+        Parâmetros:
+          - tipo: "Aplicações" ou "Resgates / Vencimentos".
+          - last_column_letter: Letra da última coluna a retornar.
+        Retorno:
+          - Lista de linhas (lista de listas) do trecho localizado.
+        """
+        if (start:=self.__rows.get(_SECTION_GROUPS[tipo])) is None:
+            raise ValueError(f"Seção '{tipo}' não encontrada na planilha")
+        position = bisect_right(self.__total_rows, start)
+        if position >= len(self.__total_rows):
+            raise ValueError(f"'Total' da seção '{tipo}' não encontrado na planilha")
+        first_row, last_row = sorted((start + 1, self.__total_rows[position] - 1))
+        return self.__ws.values(first_row, last_row, self.__first_column, column_index(last_column_letter))
+    
+    @property
+    def agencia_conta(self) -> dict:
+        """
+        Dicionário com as chaves "agencia" e "conta" ou mensagens de erro se não encontradas.
+        """
+        if self.__agencia_conta is None:
+            text = self.__text('agencia')
+            result = {}
+            if (agencia:=_AGENCIA.search(text)):
+                result['agencia'] = agencia.group()
+            else:
+                result['agencia'] = "Agencia não encontrada"
+                
+            if (conta:=_CONTA.search(text)):
+                result['conta'] = conta.group()
+            else:
+                result['conta'] = "Conta não encontrada"
+            self.__agencia_conta = result
+        return self.__agencia_conta
+    
+    @property
+    def empresa_cnpj(self) -> dict:
+        """
+        Dicionário com as chaves "empresa" e "cnpj" ou mensagens de erro se não encontradas.
+        """
+        if self.__empresa_cnpj is None:
+            text = self.__text('empresa')
+            result = {}
+            if (empresa:=_EMPRESA.search(text)):
+                result['empresa'] = empresa.group().strip()
+            else:
+                result['empresa'] = "Empresa não encontrada"
+                
+            if (cnpj:=_CNPJ.search(text)):
+                result['cnpj'] = cnpj.group().strip()   
+            else:
+                result['cnpj'] = "CNPJ não encontrado"
+            self.__empresa_cnpj = result
+        return self.__empresa_cnpj
 
 def corrigir_linhas_dados(dados):
     """
@@ -132,141 +223,240 @@ def corrigir_linhas_dados(dados):
         return dados
     return [dados]
 
-def get_dados(ws, *, tipo:Literal['Aplicações', 'Resgates'], periodo:datetime) -> pd.DataFrame:
+_RENAMES:Dict[str, str] = {
+    'Dt. Aplicação': 'Data de Emissão',
+    'Dt. Vencto': 'Data de Vencto',
+    'Taxa (%)': 'Taxa/ PCT',
+    'Vlr Princ. (R$)': 'Valor Principal',
+    'Renda Total(R$)': 'Valor da Renda',
+    'Vlr. IOF (R$)': 'Valor de IOF(*)',
+    'Vlr. IRRF (R$)': 'Valor de IRRF(*)',
+    'Vlr. Bruto (R$)': 'Valor de Resgate',
+    'Dt. Resgate / Carência': 'Data de Pagto',
+    'Vlr Líquido(R$)': 'Valor do Crédito',
+    'Renda Bruta Per': 'Renda no Mês',
+}
+_SECTIONS = (('Aplicações', 'Aplicações'), ('Resgates', 'Resgates / Vencimentos'))
+
+# (linhas, {coluna: posição na linha}, {coluna: valor constante}), ver `ColumnAccumulator.append`
+Section = Tuple[List[list], Dict[str, int], Dict[str, object]]
+
+def get_section(index:StatementIndex, *, tipo:Literal['Aplicações', 'Resgates'], periodo:datetime) -> Section:
+    """
+    Retorna as linhas de Aplicações ou Resgates do extrato, já com as colunas de saída de cada posição
+    e as colunas constantes (conta, empresa, período...), sem montar DataFrame.
+    """
+    data = corrigir_linhas_dados(index.section('Aplicações' if tipo == 'Aplicações' else 'Resgates / Vencimentos', last_column_letter="K"))
+    
+    positions:Dict[str, int] = {}
+    for position, name in enumerate(index.header(last_column_letter="K") or []):
+        positions.setdefault(_RENAMES.get(name, name), position)
+    
+    agencia_conta:dict = index.agencia_conta
+    empresa_cnpj:dict = index.empresa_cnpj
+    constants:Dict[str, object] = {
+        'Tipo': tipo,
+        'Período': periodo.strftime("%d/%m/%Y"),
+        'Agência': agencia_conta['agencia'],
+        'Conta': agencia_conta['conta'],
+        'CPF/CNPJ': empresa_cnpj['cnpj'],
+        'Nome': empresa_cnpj['empresa'],
+        'Certificado': "",
+        'Vlr da Renda': "",
+        'Valor de IOF': "",
+        'Valor de IRRF': "",
+    }
+    return data, positions, constants
+
+def get_dados(ws, *, tipo:Literal['Aplicações', 'Resgates'], periodo:datetime, index:StatementIndex|None=None) -> pd.DataFrame:
     """
     Retorna um DataFrame contendo dados de Aplicações ou Resgates. 
     Parâmetros:
-      - ws: Planilha (`Sheet`) a ser analisada.
+      - ws: Grade da planilha (`SheetGrid`) a ser analisada.
       - tipo: Define qual tipo de registro será coletado (Aplicações ou Resgates).
       - periodo: Data usada para identificação no DataFrame.
+      - index: `StatementIndex` já montado para a planilha (evita varrer a planilha novamente).
     Retorno:
-      - DataFrame com colunas padronizadas incluindo informações de conta e empresa.
+      - DataFrame com as colunas de `COLUMNS` (incluindo informações de conta e empresa).
     """
-    data = None
-    if tipo == 'Aplicações':
+    if index is None:
+        index = StatementIndex(ws)
+    
+    data, positions, constants = get_section(index, tipo=tipo, periodo=periodo)
+    accumulator = ColumnAccumulator(COLUMNS, capacity=len(data))
+    accumulator.append(data, positions=positions, constants=constants)
+    return accumulator.frame()
 
-        
-        data = [__find_line(ws, value='Dt. Aplicação', last_column_letter="K").value] + corrigir_linhas_dados(__find_ranged_lines(ws, tipo='Aplicações', last_column_letter="K").value)
-    elif tipo == 'Resgates':
-        data = [__find_line(ws, value='Dt. Aplicação', last_column_letter="K").value] + corrigir_linhas_dados(__find_ranged_lines(ws, tipo='Resgates / Vencimentos', last_column_letter="K").value)
-            
-    agencia_conta:dict = __get_agencia_conta(ws)
-    empresa_cnpj:dict = __get_empresa_cnpj(ws)
+def sheet_sections(ws:SheetGrid, periodo:datetime, *, indexes:List[StatementIndex]|None=None, sheet_name:str="") -> List[Section]:
+    """
+    Extrai todos os extratos de uma planilha: para cada extrato, as seções de Aplicações e Resgates
+    que existirem e tiverem linhas.
+    Parâmetros:
+      - indexes: Extratos já localizados com `StatementIndex.split` (evita varrer a planilha novamente).
+    Retorno:
+      - Lista de seções na ordem em que aparecem na planilha (vazia se não houver extratos).
+    """
+    if indexes is None:
+        with tracer.span('index', sheet=sheet_name):
+            indexes = StatementIndex.split(ws)
+    return list(_iter_sections(indexes, periodo, sheet_name))
 
-    #import pdb; pdb.set_trace()
-    if data:
-        df = pd.DataFrame(data)
-    else:
+def _iter_sections(indexes:List[StatementIndex], periodo:datetime, sheet_name:str="") -> Iterator[Section]:
+    for index in indexes:
+        for tipo, marker in _SECTIONS:
+            if not index.has_section(marker):
+                continue
+            with tracer.span('get_dados', tipo=tipo, sheet=sheet_name):
+                section = get_section(index, tipo=tipo, periodo=periodo)
+            first = section[0][0][0] if section[0] and section[0][0] else None
+            if not (isinstance(first, str) and marker in first):
+                yield section
+
+def build_frame(sections:List[Section]) -> pd.DataFrame:
+    """
+    Monta, uma única vez, o DataFrame tipado (`COLUMNS`) com todas as seções do lote.
+    Retorno:
+      - DataFrame vazio (sem colunas) se não houver linhas.
+    """
+    accumulator = ColumnAccumulator(COLUMNS, capacity=sum(len(data) for data, _, _ in sections))
+    with tracer.span('accumulate', sections=len(sections)):
+        for data, positions, constants in sections:
+            accumulator.append(data, positions=positions, constants=constants)
+        df = accumulator.frame()
+    
+    if df.empty:
         return pd.DataFrame()
     
-    df.columns = df.iloc[0]
-    df = df[1:]
-    df['Tipo'] = tipo
-    df['Período'] = periodo.strftime("%d/%m/%Y")
-    df['Agência'] = agencia_conta['agencia']
-    df['Conta'] = agencia_conta['conta']
-    df['CPF/CNPJ'] = empresa_cnpj['cnpj']
-    df['Nome'] = empresa_cnpj['empresa']
-    df['Certificado'] = ""
-    df['Vlr da Renda'] = ""
-    df['Valor de IOF'] = ""
-    df['Valor de IRRF'] = ""
+    with tracer.span('coerce_types', rows=len(df)):
+        return coerce_types(df)
+
+def _extract_dataframe(file_path:str, periodo:datetime, engine:Engine, session:WorkbookSession|None) -> pd.DataFrame:
+    """
+    Lê o arquivo e monta o DataFrame de Aplicações e Resgates (sem passar pelo cache).
+    Todos os extratos de todas as planilhas são extraídos com o arquivo aberto uma única vez; as planilhas
+    são copiadas para a memória e o arquivo é fechado antes da extração.
+    """
+    with open_workbook(file_path, engine=engine, session=session) as wb:
+        grids:Dict[str, SheetGrid] = {name: wb.sheets[name] for name in wb.sheet_names}
+    
+    sections:List[Section] = []
+    found = False
+    for name, ws in grids.items():
+        if not ws.n_rows:
+            continue
+        with tracer.span('index', sheet=name):
+            indexes = StatementIndex.split(ws)
+        found = found or bool(indexes)
+        sections.extend(sheet_sections(ws, periodo, indexes=indexes, sheet_name=name))
     
-    df.rename(columns={
-        'Dt. Aplicação': 'Data de Emissão',
-        'Dt. Vencto': 'Data de Vencto',
-        'Taxa (%)': 'Taxa/ PCT',
-        'Vlr Princ. (R$)': 'Valor Principal',
-        'Renda Total(R$)': 'Valor da Renda',
-        'Vlr. IOF (R$)': 'Valor de IOF(*)',
-        'Vlr. IRRF (R$)': 'Valor de IRRF(*)',
-        'Vlr. Bruto (R$)': 'Valor de Resgate',
-        'Dt. Resgate / Carência': 'Data de Pagto',
-        'Vlr Líquido(R$)': 'Valor do Crédito',
-        'Renda Bruta Per': 'Renda no Mês',
-    }, inplace=True)
-    return df
+    if not found:
+        raise ValueError(f"Nenhum extrato encontrado no arquivo")
+    
+    return build_frame(sections)
+
+_worker_session:WorkbookSession|None = None
 
 class ExtractData:
     @staticmethod
-    def get_dataframe(*, file_path:str, periodo:datetime) -> pd.DataFrame:
+    def get_dataframe(*, file_path:str, periodo:datetime, engine:Engine='auto', session:WorkbookSession|None=None, cache:ParseCache|None=None) -> pd.DataFrame:
         """
         Função principal para carregar e consolidar dados de Aplicações e Resgates de uma planilha.
         Parâmetros:
           - file_path: Caminho do arquivo xls a ser processado.
           - periodo: Data para rotulação em cada linha.
+          - engine: Motor de leitura do arquivo ('auto', 'biff' ou 'xlwings'), ver `readers.open_workbook`.
+          - session: `WorkbookSession` reaproveitado entre arquivos (evita abrir e fechar o Excel a cada arquivo).
+          - cache: `ParseCache` consultado antes da leitura; arquivos com o mesmo conteúdo não são lidos novamente.
         Retorno:
           - DataFrame unificado, contendo todas as colunas definidas para análise posterior.
         """
-        try:
-            app = xw.App(visible=False)
-            app.display_alerts = False
-            app.screen_updating = False
-            
-            wb:Book = xw.Book(file_path, update_links=False, read_only=True)
-
-            if not valid_sheet in wb.sheet_names:
-                raise ValueError(f"Sheet não encontrada no arquivo")
-            ws:Sheet = wb.sheets[valid_sheet]
+        with tracer.span('get_dataframe', file=os.path.basename(file_path)):
+            if cache is None:
+                return _extract_dataframe(file_path, periodo, engine, session)
             
-            df = pd.DataFrame()
-            df_aplic = get_dados(ws, tipo='Aplicações', periodo=periodo)
-            df_resg = get_dados(ws, tipo='Resgates', periodo=periodo)
+            with tracer.span('cache.get'):
+                key = cache.key(file_path)
+                df = cache.get(key)
+            if df is not None:
+                if not df.empty:
+                    df['Período'] = periodo.strftime("%d/%m/%Y")
+                df.attrs['cached'] = True
+                return df
             
-            if not 'Aplicações' in df_aplic.iloc[0,0]:
-                df = pd.concat([df, df_aplic])
-            
-            if not 'Resgates / Vencimentos' in df_resg.iloc[0,0]:
-                df = pd.concat([df, df_resg])
-            
-            #import pdb; pdb.set_trace()
-            #df = pd.concat([df, get_dados(ws, tipo='Resgates', periodo=periodo)])
-            
-            if df.empty:
-                return pd.DataFrame()
-                
-            df = df[[
-                'Período',
-                'Agência',
-                'Conta',
-                'CPF/CNPJ',
-                'Nome',
-                'Tipo',
-                'Certificado',
-                'Data de Emissão',
-                'Data de Vencto',
-                'Taxa/ PCT',
-                'Valor Principal',
-                'Valor da Renda',
-                'Valor de IOF(*)',
-                'Valor de IRRF(*)',
-                'Valor de Resgate',
-                'Data de Pagto',
-                'Vlr da Renda',
-                'Valor de IOF',
-                'Valor de IRRF',
-                'Valor do Crédito',
-                'Renda no Mês'
-                ]]
-            
-        
-        finally:
-            try:
-                wb.close()
-            except:
-                pass
-            try:
-                app.kill()
-            except:
-                pass
-            
-            sleep(1)
-            Functions.fechar_excel(file_path)
-
+            df = _extract_dataframe(file_path, periodo, engine, session)
+            with tracer.span('cache.put'):
+                cache.put(key, df)
+            return df
+    
+    @staticmethod
+    def iter_records(file_path:str, periodo:datetime, *, engine:Engine='auto', session:WorkbookSession|None=None) -> Iterator[StatementRecord]:
+        """
+        Alternativa ao `get_dataframe` que não monta DataFrame: percorre os extratos do arquivo e entrega
+        cada linha como um `StatementRecord` já tipado, à medida que as seções são lidas
+        (os escritores aceitam os registros diretamente em `write_records`).
+        O arquivo fica aberto até o iterador terminar (ou ser fechado) e o cache não é usado.
+        Parâmetros:
+          - file_path: Caminho do arquivo xls a ser processado.
+          - periodo: Data para rotulação em cada linha.
+          - engine: Motor de leitura do arquivo ('auto', 'biff' ou 'xlwings').
+          - session: `WorkbookSession` reaproveitado entre arquivos.
+        Retorno:
+          - Iterador de `StatementRecord` na mesma ordem das linhas de `get_dataframe`.
+        """
+        with open_workbook(file_path, engine=engine, session=session) as wb:
+            found = False
+            for name in wb.sheet_names:
+                ws:SheetGrid = wb.sheets[name]
+                if not ws.n_rows or not (indexes:=StatementIndex.split(ws)):
+                    continue
+                found = True
+                for data, positions, constants in _iter_sections(indexes, periodo, name):
+                    yield from section_records(data, positions=positions, constants=constants)
+            if not found:
+                raise ValueError(f"Nenhum extrato encontrado no arquivo")
+    
+    @staticmethod
+    def init_worker(recycle_every:int=50, trace:bool=False) -> None:
+        """
+        Inicializador dos processos do pool: cria a sessão do Excel do processo, encerrada quando ele termina.
+        Parâmetros:
+          - recycle_every: Quantidade de arquivos após a qual a instância do Excel é reiniciada.
+          - trace: Ativa o registro de spans (`tracing.tracer`) no processo.
+        """
+        global _worker_session
+        if trace:
+            tracer.enable()
+        _worker_session = WorkbookSession(recycle_every=recycle_every)
+        Finalize(None, _worker_session.close, exitpriority=10)
+    
+    @staticmethod
+    def pool_get_dataframe(file_path:str, periodo:datetime, engine:Engine='auto', cache:ParseCache|None=None) -> pd.DataFrame:
+        """
+        Versão de `get_dataframe` executada dentro de um processo do pool, usando a sessão criada em `init_worker`.
+        Parâmetros:
+          - file_path: Caminho do arquivo xls a ser processado.
+          - periodo: Data utilizada para rotulação nas linhas do DataFrame.
+          - engine: Motor de leitura do arquivo ('auto', 'biff' ou 'xlwings').
+          - cache: `ParseCache` compartilhado (em disco) entre os processos.
+        Retorno:
+          - DataFrame do arquivo (exceções são propagadas para o processo principal), com o tempo de extração
+            em `df.attrs['seconds']`. Com o trace ativo, os spans do arquivo seguem em `df.attrs['trace']`
+            (ou em `erro.trace`, se a extração falhar, para não se misturarem aos do próximo arquivo).
+        """
+        start = time.perf_counter()
+        try:
+            df = ExtractData.get_dataframe(file_path=file_path, periodo=periodo, engine=engine, session=_worker_session, cache=cache)
+        except Exception as error:
+            if tracer.enabled:
+                error.trace = tracer.drain()
+            raise
+        df.attrs['seconds'] = time.perf_counter() - start
+        if tracer.enabled:
+            df.attrs['trace'] = tracer.drain()
         return df
     
     @staticmethod
-    def mp_get_dataframe(queue:mp.Queue, file_path:str, periodo:datetime):
+    def mp_get_dataframe(queue:mp.Queue, file_path:str, periodo:datetime, engine:Engine='auto'):
         """
         Processa o arquivo utilizando multiprocessing e insere o DataFrame resultante na fila.
         Em caso de exceção, tenta até 5 vezes e registra os logs de erro.
@@ -274,12 +464,13 @@ class ExtractData:
           - queue: Objeto Queue do módulo multiprocessing para armazenar o DataFrame.
           - file_path: Caminho do arquivo xls a ser processado.
           - periodo: Data utilizada para rotulação nas linhas do DataFrame.
+          - engine: Motor de leitura do arquivo ('auto', 'biff' ou 'xlwings').
         Retorno:
           - Não retorna valor diretamente; o DataFrame é inserido na queue.
         """
         for _ in range(5):
             try:
-                return queue.put(ExtractData.get_dataframe(file_path=file_path, periodo=periodo))
+                return queue.put(ExtractData.get_dataframe(file_path=file_path, periodo=periodo, engine=engine))
             except Exception as e:
                 print(f"[{_+1}/5]Erro no arquivo {os.path.basename(file_path)}: {e}")
                 with open(datetime.now().strftime(f"logs/%Y%m%d%H%M%S{os.path.basename(file_path)}") + '.txt', 'w') as f:
@@ -293,7 +484,6 @@ if __name__ == "__main__":
     df1 = ExtractData.get_dataframe(file_path=r'C:\Users\renan.oliveira\Downloads\x\1101050008 - SPE AXIS - PORTO FINO - 12.2024 - CDB DI OK.XLS', periodo=datetime.now())    
     df2 = ExtractData.get_dataframe(file_path=r'C:\Users\renan.oliveira\Downloads\x\1101050008 - SPE AXIS - PORTO FINO - 12.2024 - CDB OK.XLS', periodo=datetime.now())    
     
-    import pdb; pdb.set_trace()
     df = pd.concat([df1, df2], ignore_index=True)
     
     df.to_excel('output.xlsx', index=False)
@@ -1,41 +1,164 @@
 import os
 import json
+import time
+import weakref
+import threading
 from dependencies.functions import P
 from datetime import datetime
+from typing import List
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class _FileLock:
+    """
+    Trava exclusiva entre processos baseada em um arquivo '.lock' (fcntl no Linux, msvcrt no Windows).
+    """
+    def __init__(self, path:str) -> None:
+        self.__path = path
+        self.__fd:int|None = None
+
+    def __enter__(self) -> "_FileLock":
+        self.__fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.01)
+        return self
+
+    def __exit__(self, *args) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self.__fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        os.close(self.__fd)
+        self.__fd = None
+
+def _write_lines(file_path:str, lock_path:str, lines:List[str]) -> None:
+    if not lines:
+        return
+    data = ''.join(lines).encode('utf-8')
+    with _FileLock(lock_path):
+        fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
 class LogInformativo:
+    """
+    Log informativo do processamento, gravado apenas por acréscimo: uma mensagem JSON por linha em
+    'informativoLog.jsonl'. As mensagens ficam em memória e são gravadas em lote (a cada `buffer_size`
+    mensagens, por um timer no máximo `flush_interval` segundos após a primeira mensagem pendente, em
+    `get`/`clear` e ao encerrar o processo), com trava entre processos. O custo de `add` não depende do tamanho do log.
+    O formato anterior ('informativoLog.json', uma lista JSON reescrita a cada mensagem) é migrado na primeira
+    abertura: as mensagens passam para o '.jsonl' e o arquivo antigo é renomeado para 'informativoLog.json.migrated'.
+    `get` continua retornando a mesma lista de mensagens.
+    Parâmetros:
+      - buffer_size: Quantidade de mensagens acumuladas antes de gravar.
+      - flush_interval: Tempo máximo (s) que uma mensagem fica só em memória.
+    """
     @property
     def file_path(self):
+        return os.path.join(os.getcwd(), 'informativoLog.jsonl')
+
+    @property
+    def lock_path(self):
+        return self.file_path + '.lock'
+
+    @property
+    def legacy_path(self):
         return os.path.join(os.getcwd(), 'informativoLog.json')
-    
-    def __init__(self):
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-                
+
+    def __init__(self, *, buffer_size:int=50, flush_interval:float=1.0):
+        self.__file_path:str = self.file_path
+        self.__lock_path:str = self.lock_path
+        self.__buffer_size:int = buffer_size
+        self.__flush_interval:float = flush_interval
+        self.__buffer:List[str] = []
+        self.__lock = threading.Lock()
+        self.__timer:threading.Timer|None = None
+        if not os.path.exists(self.__file_path) or os.path.exists(self.legacy_path):
+            with _FileLock(self.__lock_path):
+                self.__migrate()
+                open(self.__file_path, 'a', encoding='utf-8').close()
+        self.__finalizer = weakref.finalize(self, _write_lines, self.__file_path, self.__lock_path, self.__buffer)
+
+    def __migrate(self) -> None:
+        """
+        Copia as mensagens do 'informativoLog.json' (formato antigo) para o '.jsonl' e renomeia o arquivo antigo.
+        Deve ser chamado com a trava entre processos adquirida.
+        """
+        legacy_path = self.legacy_path
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                messages = json.load(f)
+        except ValueError:
+            messages = []
+        if not isinstance(messages, list):
+            messages = []
+        lines = [json.dumps(message if isinstance(message, str) else str(message)) + '\n' for message in messages]
+        if lines:
+            with open(self.__file_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+        os.replace(legacy_path, legacy_path + '.migrated')
+
     def get(self) -> list:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            try:
-                return json.load(f)
-            except:
-                return []
-        
+        self.flush()
+        logs:list = []
+        with open(self.__file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    logs.append(json.loads(line))
+                except ValueError:
+                    continue
+        return logs
+
     def add(self, message:str) -> None:
-        logs = self.get()
         date_tag = datetime.now().strftime('[%Y-%m-%d %H:%M:%S]')
-        logs.append(f"{date_tag} - {message}")
-        
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(logs, f)
-            
+        with self.__lock:
+            self.__buffer.append(json.dumps(f"{date_tag} - {message}") + '\n')
+            full = len(self.__buffer) >= self.__buffer_size
+            if not full and self.__timer is None:
+                self.__timer = threading.Timer(self.__flush_interval, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Grava no arquivo as mensagens ainda em memória.
+        """
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            lines = self.__buffer[:]
+            del self.__buffer[:]
+            _write_lines(self.__file_path, self.__lock_path, lines)
+
     def clear(self) -> None:
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump([], f)
-            
+        with self.__lock:
+            del self.__buffer[:]
+            with _FileLock(self.__lock_path):
+                open(self.__file_path, 'w', encoding='utf-8').close()
+
 if __name__ == "__main__":
     log = LogInformativo()
     log.add("Teste")
     print(log.get())
     #log.clear()
-    print(log.get())
\ No newline at end of file
+    print(log.get())
@@ -0,0 +1,106 @@
+import os
+import pickle
+import zlib
+import hashlib
+import pandas as pd
+from typing import List, Tuple
+
+class ParseCache:
+    """
+    Cache local, endereçado pelo conteúdo, dos DataFrames extraídos de cada arquivo.
+    A chave é o hash do conteúdo do arquivo junto com a versão do extrator, então um mesmo extrato
+    colocado de novo na pasta 'Files' não precisa ser lido outra vez. Os resultados são gravados
+    em pickle compactado e os menos usados são removidos quando o cache passa de `max_bytes`.
+    Parâmetros:
+      - version: Versão do extrator (muda a chave quando a lógica de extração muda).
+      - path: Pasta do cache.
+      - max_bytes: Tamanho máximo do cache em disco.
+    """
+    @property
+    def path(self) -> str:
+        return self.__path
+    
+    def __init__(self, version:str, *, path:str=os.path.join(os.getcwd(), 'Cache'), max_bytes:int=512 * 1024 * 1024) -> None:
+        self.__version:str = version
+        self.__path:str = path
+        self.__max_bytes:int = max_bytes
+        if not os.path.exists(self.__path):
+            os.makedirs(self.__path, exist_ok=True)
+    
+    def key(self, file_path:str) -> str:
+        """
+        Calcula a chave do arquivo (hash do conteúdo + versão do extrator).
+        """
+        digest = hashlib.blake2b(self.__version.encode('utf-8'), digest_size=20)
+        with open(file_path, 'rb') as _file:
+            while (chunk:=_file.read(1024 * 1024)):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def __entry(self, key:str) -> str:
+        return os.path.join(self.__path, f"{key}.bin")
+    
+    def get(self, key:str) -> pd.DataFrame|None:
+        """
+        Retorna o DataFrame guardado para a chave ou `None` se não existir (ou estiver corrompido).
+        """
+        entry = self.__entry(key)
+        try:
+            with open(entry, 'rb') as _file:
+                data = _file.read()
+            df = pickle.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            try:
+                os.unlink(entry)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return df
+    
+    def put(self, key:str, df:pd.DataFrame) -> None:
+        """
+        Grava o DataFrame para a chave (escrita atômica) e aplica a política de tamanho.
+        """
+        entry = self.__entry(key)
+        temp = f"{entry}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as _file:
+            _file.write(zlib.compress(pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL), 1))
+        os.replace(temp, entry)
+        self.evict()
+    
+    def evict(self) -> None:
+        """
+        Remove as entradas usadas há mais tempo até o cache caber em `max_bytes`.
+        """
+        entries:List[Tuple[float, int, str]] = []
+        total = 0
+        for item in os.scandir(self.__path):
+            if not item.name.endswith('.bin'):
+                continue
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item.path))
+            total += stat.st_size
+        if total <= self.__max_bytes:
+            return
+        for _mtime, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.__max_bytes:
+                break
+    
+    def clear(self) -> None:
+        for item in os.scandir(self.__path):
+            if item.name.endswith('.bin'):
+                os.unlink(item.path)
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from typing import Iterator, Literal
+from .ole2 import UnsupportedFormatError
+from .grid import SheetGrid
+from .session import WorkbookSession, WorkbookDriver, StubDriver
+from .text_formats import sniff_format, NATIVE_READERS
+from tracing import tracer
+
+Engine = Literal['auto', 'biff', 'xlwings']
+ENGINES = ('auto', 'biff', 'xlwings')
+
+def _read_native(file_path:str):
+    file_format = sniff_format(file_path)
+    if file_format == 'biff':
+        from .biff8 import BiffWorkbook
+        reader = BiffWorkbook
+    elif file_format in NATIVE_READERS:
+        reader = NATIVE_READERS[file_format]
+    else:
+        raise UnsupportedFormatError(f"Formato '{file_format}' não suportado pelo leitor nativo")
+    with tracer.span(f'{file_format}.read'):
+        return reader(file_path)
+
+@contextmanager
+def open_workbook(file_path:str, *, engine:Engine='auto', session:WorkbookSession|None=None) -> Iterator:
+    """
+    Abre a pasta de trabalho com o motor de leitura escolhido.
+    Parâmetros:
+      - file_path: Caminho do arquivo xls.
+      - engine: 'biff' lê o arquivo nativamente (sem Excel), 'xlwings' usa uma instância do Excel e
+        'auto' tenta o leitor nativo e recorre ao xlwings quando o formato não é suportado.
+        O leitor nativo é escolhido pelo conteúdo (`sniff_format`): xls binário (BIFF8), HTML, XML do
+        Excel 2003 (SpreadsheetML) ou CSV, mesmo que todos tenham a extensão .xls.
+      - session: `WorkbookSession` compartilhado entre vários arquivos; sem ele é aberta uma sessão só para este arquivo.
+    Retorno:
+      - Objeto com `sheet_names` e `sheets[nome]`, cujas planilhas são `SheetGrid` já carregadas em memória.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Motor de leitura inválido '{engine}', use um de {ENGINES}")
+    
+    if engine in ('auto', 'biff'):
+        try:
+            wb = _read_native(file_path)
+        except UnsupportedFormatError:
+            if engine == 'biff':
+                raise
+        else:
+            yield wb
+            return
+    
+    if session is None:
+        with WorkbookSession() as own_session, own_session.open(file_path) as wb:
+            yield wb
+    else:
+        with session.open(file_path) as wb:
+            yield wb
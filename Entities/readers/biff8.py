@@ -0,0 +1,269 @@
+import re
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+from .ole2 import CompoundFile, UnsupportedFormatError
+from .grid import SheetGrid
+
+BOF = 0x0809
+EOF = 0x000A
+CONTINUE = 0x003C
+BOUNDSHEET = 0x0085
+DATEMODE = 0x0022
+FORMAT = 0x041E
+XF = 0x00E0
+SST = 0x00FC
+DIMENSIONS = 0x0200
+LABELSST = 0x00FD
+LABEL = 0x0204
+NUMBER = 0x0203
+RK = 0x027E
+MULRK = 0x00BD
+FORMULA = 0x0006
+STRING = 0x0207
+BOOLERR = 0x0205
+
+BIFF8_VERSION = 0x0600
+WORKSHEET_TYPE = 0x0010
+
+_BUILTIN_DATE_FORMATS = set(range(14, 23)) | set(range(27, 37)) | set(range(45, 48)) | set(range(50, 59))
+
+def _is_date_format(code:str) -> bool:
+    code = re.sub(r'"[^"]*"|\\.|_.|\*.', '', code)
+    code = re.sub(r'\[(?![hms]+\])[^\]]*\]', '', code, flags=re.IGNORECASE)
+    section = code.split(';')[0].lower()
+    if 'general' in section:
+        return False
+    return re.search(r'[dmyhs]', section) is not None
+
+def _decode_rk(rk:int) -> float:
+    if rk & 0x02:
+        value = float(struct.unpack('<i', struct.pack('<I', rk & 0xFFFFFFFC))[0] >> 2)
+    else:
+        value = struct.unpack('<d', struct.pack('<Q', (rk & 0xFFFFFFFC) << 32))[0]
+    if rk & 0x01:
+        value /= 100
+    return value
+
+class _ChunkReader:
+    """
+    Lê dados de um registro BIFF que continua em registros CONTINUE, tratando a troca
+    de compressão de caracteres no início de cada continuação.
+    """
+    def __init__(self, chunks:List[bytes], pos:int=0) -> None:
+        self.chunks = chunks
+        self.index = 0
+        self.pos = pos
+
+    def __advance(self) -> bytes:
+        self.index += 1
+        self.pos = 0
+        if self.index >= len(self.chunks):
+            raise UnsupportedFormatError("Registro BIFF truncado")
+        return self.chunks[self.index]
+
+    def read(self, size:int) -> bytes:
+        out = bytearray()
+        while size:
+            chunk = self.chunks[self.index]
+            if self.pos >= len(chunk):
+                chunk = self.__advance()
+            take = min(size, len(chunk) - self.pos)
+            out += chunk[self.pos:self.pos + take]
+            self.pos += take
+            size -= take
+        return bytes(out)
+
+    def read_chars(self, count:int, high_byte:bool) -> str:
+        parts:List[str] = []
+        while count:
+            chunk = self.chunks[self.index]
+            if self.pos >= len(chunk):
+                chunk = self.__advance()
+                high_byte = bool(chunk[0] & 0x01)
+                self.pos = 1
+                continue
+            width = 2 if high_byte else 1
+            take = min(count, (len(chunk) - self.pos) // width)
+            raw = chunk[self.pos:self.pos + take * width]
+            parts.append(raw.decode('utf-16-le' if high_byte else 'latin-1'))
+            self.pos += take * width
+            count -= take
+        return ''.join(parts)
+
+    def read_unicode_string(self, length_size:int=2) -> str:
+        count = struct.unpack('<H' if length_size == 2 else '<B', self.read(length_size))[0]
+        flags = self.read(1)[0]
+        runs = struct.unpack('<H', self.read(2))[0] if flags & 0x08 else 0
+        ext = struct.unpack('<I', self.read(4))[0] if flags & 0x04 else 0
+        text = self.read_chars(count, bool(flags & 0x01))
+        if runs:
+            self.read(4 * runs)
+        if ext:
+            self.read(ext)
+        return text
+
+def _iter_records(stream:bytes, offset:int) -> Iterator[Tuple[int, List[bytes]]]:
+    size = len(stream)
+    pending:Tuple[int, List[bytes]]|None = None
+    while offset + 4 <= size:
+        rtype, length = struct.unpack_from('<HH', stream, offset)
+        data = stream[offset + 4:offset + 4 + length]
+        offset += 4 + length
+        if rtype == CONTINUE and pending is not None:
+            pending[1].append(data)
+            continue
+        if pending is not None:
+            yield pending
+        pending = (rtype, [data])
+        if rtype == EOF:
+            break
+    if pending is not None:
+        yield pending
+
+class BiffWorkbook:
+    """
+    Leitor nativo de pastas de trabalho .xls (BIFF8 dentro de um container OLE2), sem depender do Excel.
+    Carrega os valores de todas as planilhas em `SheetGrid`s com a mesma semântica de valores do xlwings:
+    números como float, datas como datetime, textos como str e células vazias como None.
+    """
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.__sheets.keys())
+
+    @property
+    def sheets(self) -> Dict[str, SheetGrid]:
+        return self.__sheets
+
+    def __init__(self, file_path:str) -> None:
+        with open(file_path, 'rb') as _file:
+            data = _file.read()
+
+        self.__datemode:int = 0
+        self.__sst:List[str] = []
+        self.__xf_is_date:List[bool] = []
+        self.__sheets:Dict[str, SheetGrid] = {}
+
+        # qualquer falha de leitura (Excel 5/95 com stream 'Book', arquivo truncado ou registros irregulares)
+        # vira UnsupportedFormatError para que o motor 'auto' recorra ao Excel
+        try:
+            compound = CompoundFile(data)
+            if 'workbook' not in (name.lower() for name in compound.stream_names):
+                raise UnsupportedFormatError("Stream 'Workbook' não encontrado (apenas .xls BIFF8, Excel 97-2003, é suportado)")
+            stream = compound.open_stream('Workbook')
+            for name, position in self.__read_globals(stream):
+                self.__sheets[name] = self.__read_sheet(stream, name, position)
+        except (struct.error, IndexError, KeyError, ValueError) as error:
+            raise UnsupportedFormatError(f"Arquivo .xls inválido ou truncado: {error}") from error
+
+    def __read_globals(self, stream:bytes) -> List[Tuple[str, int]]:
+        boundsheets:List[Tuple[str, int]] = []
+        formats:Dict[int, str] = {}
+        xf_formats:List[int] = []
+        first = True
+        for rtype, chunks in _iter_records(stream, 0):
+            data = chunks[0]
+            if first:
+                if rtype != BOF or struct.unpack_from('<H', data, 0)[0] != BIFF8_VERSION:
+                    raise UnsupportedFormatError("Apenas arquivos .xls BIFF8 (Excel 97-2003) são suportados")
+                first = False
+            elif rtype == DATEMODE:
+                self.__datemode = struct.unpack_from('<H', data, 0)[0]
+            elif rtype == FORMAT:
+                index = struct.unpack_from('<H', data, 0)[0]
+                formats[index] = _ChunkReader(chunks, 2).read_unicode_string()
+            elif rtype == XF:
+                xf_formats.append(struct.unpack_from('<H', data, 2)[0])
+            elif rtype == BOUNDSHEET:
+                position, _visibility, sheet_type = struct.unpack_from('<IBB', data, 0)
+                if sheet_type == 0:
+                    boundsheets.append((_ChunkReader(chunks, 6).read_unicode_string(length_size=1), position))
+            elif rtype == SST:
+                self.__sst = self.__read_sst(chunks)
+
+        self.__xf_is_date = [
+            index in _BUILTIN_DATE_FORMATS or (index in formats and _is_date_format(formats[index]))
+            for index in xf_formats
+        ]
+        return boundsheets
+
+    @staticmethod
+    def __read_sst(chunks:List[bytes]) -> List[str]:
+        unique = struct.unpack_from('<I', chunks[0], 4)[0]
+        reader = _ChunkReader(chunks, 8)
+        strings:List[str] = []
+        for _ in range(unique):
+            strings.append(reader.read_unicode_string())
+        return strings
+
+    def __number(self, xf:int, value:float):
+        if xf < len(self.__xf_is_date) and self.__xf_is_date[xf]:
+            base = datetime(1904, 1, 1) if self.__datemode else datetime(1899, 12, 30)
+            return base + timedelta(milliseconds=round(value * 86400000))
+        return float(value)
+
+    def __read_sheet(self, stream:bytes, name:str, position:int) -> SheetGrid:
+        cells:Dict[Tuple[int, int], object] = {}
+        last_row, last_col = 0, 0
+        pending_formula:Tuple[int, int]|None = None
+        first = True
+        for rtype, chunks in _iter_records(stream, position):
+            data = chunks[0]
+            if first:
+                if rtype != BOF or struct.unpack_from('<H', data, 0)[0] != BIFF8_VERSION:
+                    raise UnsupportedFormatError(f"Planilha '{name}' não está em BIFF8")
+                first = False
+                continue
+            if rtype == DIMENSIONS:
+                _, row_mac, _, col_mac = struct.unpack_from('<IIHH', data, 0)
+                last_row, last_col = max(last_row, row_mac), max(last_col, col_mac)
+            elif rtype == LABELSST:
+                row, col, _, index = struct.unpack_from('<HHHI', data, 0)
+                cells[(row, col)] = self.__sst[index] if index < len(self.__sst) else None
+            elif rtype == LABEL:
+                row, col = struct.unpack_from('<HH', data, 0)
+                cells[(row, col)] = _ChunkReader(chunks, 6).read_unicode_string()
+            elif rtype == NUMBER:
+                row, col, xf, value = struct.unpack_from('<HHHd', data, 0)
+                cells[(row, col)] = self.__number(xf, value)
+            elif rtype == RK:
+                row, col, xf, rk = struct.unpack_from('<HHHI', data, 0)
+                cells[(row, col)] = self.__number(xf, _decode_rk(rk))
+            elif rtype == MULRK:
+                row, col = struct.unpack_from('<HH', data, 0)
+                for offset in range(4, len(data) - 2, 6):
+                    xf, rk = struct.unpack_from('<HI', data, offset)
+                    cells[(row, col)] = self.__number(xf, _decode_rk(rk))
+                    col += 1
+            elif rtype == FORMULA:
+                row, col, xf = struct.unpack_from('<HHH', data, 0)
+                result = data[6:14]
+                if result[6:8] != b'\xFF\xFF':
+                    cells[(row, col)] = self.__number(xf, struct.unpack('<d', result)[0])
+                elif result[0] == 0x00:
+                    pending_formula = (row, col)
+                    continue
+                elif result[0] == 0x01:
+                    cells[(row, col)] = bool(result[2])
+                elif result[0] == 0x03:
+                    cells[(row, col)] = None
+            elif rtype == STRING and pending_formula is not None:
+                cells[pending_formula] = _ChunkReader(chunks).read_unicode_string()
+            elif rtype == BOOLERR:
+                row, col, _, value, is_error = struct.unpack_from('<HHHBB', data, 0)
+                cells[(row, col)] = None if is_error else bool(value)
+            elif rtype == EOF:
+                break
+            pending_formula = None
+
+        for (row, col), value in cells.items():
+            if value is not None:
+                last_row, last_col = max(last_row, row + 1), max(last_col, col + 1)
+
+        rows:List[list] = [[None] * last_col for _ in range(last_row)]
+        for (row, col), value in cells.items():
+            if value == "":
+                value = None
+            if row < last_row and col < last_col:
+                rows[row][col] = value
+        return SheetGrid(name, rows)
@@ -0,0 +1,142 @@
+import re
+from typing import List, Tuple
+
+def column_index(letters:str) -> int:
+    """
+    Converte a letra da coluna (ex: 'A', 'K', 'AB') para o índice 1-based.
+    """
+    result = 0
+    for letter in letters.upper():
+        result = result * 26 + (ord(letter) - 64)
+    return result
+
+def column_letter(index:int) -> str:
+    """
+    Converte o índice 1-based da coluna para a letra correspondente.
+    """
+    result = ""
+    while index > 0:
+        index, rest = divmod(index - 1, 26)
+        result = chr(65 + rest) + result
+    return result
+
+class _Cell:
+    def __init__(self, row:int, column:int) -> None:
+        self.row = row
+        self.column = column
+
+class GridRange:
+    """
+    Intervalo retangular de um `SheetGrid`, com a mesma semântica de `.value` do xlwings:
+    uma célula -> escalar, uma linha ou coluna -> lista, várias linhas -> lista de listas.
+    """
+    @property
+    def row(self) -> int:
+        return self.__first[0]
+
+    @property
+    def column(self) -> int:
+        return self.__first[1]
+
+    @property
+    def last_cell(self) -> _Cell:
+        return _Cell(*self.__last)
+
+    @property
+    def value(self):
+        (first_row, first_col), (last_row, last_col) = self.__first, self.__last
+        rows = [
+            [self.__grid.cell(r, c) for c in range(first_col, last_col + 1)]
+            for r in range(first_row, last_row + 1)
+        ]
+        if len(rows) == 1 and len(rows[0]) == 1:
+            return rows[0][0]
+        if len(rows) == 1:
+            return rows[0]
+        if last_col == first_col:
+            return [row[0] for row in rows]
+        return rows
+
+    def __init__(self, grid:"SheetGrid", first:Tuple[int, int], last:Tuple[int, int]) -> None:
+        self.__grid = grid
+        self.__first = first
+        self.__last = last
+
+class SheetGrid:
+    """
+    Representação em memória de uma planilha, ancorada na célula A1.
+    É a grade entregue pelos leitores (`readers`) para o `get_dados`, independente do motor usado
+    para abrir o arquivo.
+    """
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def rows(self) -> List[list]:
+        return self.__rows
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.__rows)
+
+    @property
+    def n_cols(self) -> int:
+        return max((len(row) for row in self.__rows), default=0)
+
+    @property
+    def used_range(self) -> GridRange:
+        return GridRange(self, (1, 1), (max(self.n_rows, 1), max(self.n_cols, 1)))
+
+    def __init__(self, name:str, rows:List[list]) -> None:
+        self.__name:str = name
+        self.__rows:List[list] = rows
+
+    def cell(self, row:int, column:int):
+        """
+        Retorna o valor da célula (índices 1-based) ou `None` se estiver fora da grade.
+        """
+        if 0 < row <= len(self.__rows):
+            line = self.__rows[row - 1]
+            if 0 < column <= len(line):
+                return line[column - 1]
+        return None
+
+    def column(self, column:int) -> list:
+        """
+        Retorna os valores de uma coluna inteira (índice 1-based), da linha 1 até a última linha da grade.
+        """
+        return [self.cell(row, column) for row in range(1, len(self.__rows) + 1)]
+
+    def values(self, first_row:int, last_row:int, first_column:int, last_column:int) -> List[list]:
+        """
+        Retorna o bloco retangular (índices 1-based, inclusivos) como lista de listas,
+        completando com `None` o que estiver fora da grade.
+        """
+        result:List[list] = []
+        width = last_column - first_column + 1
+        for row in range(first_row, last_row + 1):
+            if 0 < row <= len(self.__rows):
+                line = self.__rows[row - 1][first_column - 1:last_column]
+                if len(line) < width:
+                    line = line + [None] * (width - len(line))
+            else:
+                line = [None] * width
+            result.append(line)
+        return result
+
+    def range(self, address:str) -> GridRange:
+        """
+        Emula `Sheet.range` do xlwings para endereços no formato 'A1' ou 'A1:K10'.
+        """
+        refs:List[Tuple[int, int]] = []
+        for ref in address.split(':'):
+            if not (match:=re.fullmatch(r'\$?([A-Za-z]+)\$?(\d+)', ref.strip())):
+                raise ValueError(f"Endereço inválido: '{address}'")
+            refs.append((int(match.group(2)), column_index(match.group(1))))
+        first = (min(refs[0][0], refs[-1][0]), min(refs[0][1], refs[-1][1]))
+        last = (max(refs[0][0], refs[-1][0]), max(refs[0][1], refs[-1][1]))
+        return GridRange(self, first, last)
+
+    def __repr__(self) -> str:
+        return f"<SheetGrid '{self.name}' {self.n_rows}x{self.n_cols}>"
@@ -0,0 +1,138 @@
+import struct
+from typing import Dict, List
+
+OLE2_SIGNATURE = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
+
+FREESECT = 0xFFFFFFFF
+ENDOFCHAIN = 0xFFFFFFFE
+FATSECT = 0xFFFFFFFD
+DIFSECT = 0xFFFFFFFC
+
+STGTY_STORAGE = 1
+STGTY_STREAM = 2
+STGTY_ROOT = 5
+
+class UnsupportedFormatError(Exception):
+    """
+    Exceção lançada quando o arquivo não está em um formato que o leitor nativo saiba interpretar.
+    """
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+
+class CompoundFile:
+    """
+    Leitor mínimo de arquivos OLE2 / Compound File Binary (container dos .xls BIFF8).
+    Carrega o arquivo inteiro em memória e permite ler qualquer stream pelo nome.
+    """
+    @property
+    def stream_names(self) -> List[str]:
+        return list(self.__entries.keys())
+
+    def __init__(self, data:bytes) -> None:
+        if len(data) < 512 or data[:8] != OLE2_SIGNATURE:
+            raise UnsupportedFormatError("O arquivo não é um documento OLE2 (xls binário)")
+        self.__data = data
+
+        (
+            sector_shift,
+            mini_sector_shift,
+        ) = struct.unpack_from('<HH', data, 0x1E)
+        (
+            num_fat_sectors,
+            first_dir_sector,
+            _transaction,
+            mini_cutoff,
+            first_minifat_sector,
+            num_minifat_sectors,
+            first_difat_sector,
+            num_difat_sectors,
+        ) = struct.unpack_from('<IIIIIIII', data, 0x2C)
+
+        self.__sector_size:int = 1 << sector_shift
+        self.__mini_sector_size:int = 1 << mini_sector_shift
+        self.__mini_cutoff:int = mini_cutoff
+
+        self.__fat:List[int] = self.__read_fat(num_fat_sectors, first_difat_sector, num_difat_sectors)
+
+        directory = self.__read_chain(first_dir_sector)
+        self.__entries:Dict[str, tuple] = {}
+        root_start, root_size = ENDOFCHAIN, 0
+        for offset in range(0, len(directory) - 127, 128):
+            name_len, entry_type = struct.unpack_from('<HB', directory, offset + 0x40)
+            if entry_type not in (STGTY_STREAM, STGTY_ROOT):
+                continue
+            name = directory[offset:offset + max(name_len - 2, 0)].decode('utf-16-le', errors='replace')
+            start, size_low, size_high = struct.unpack_from('<III', directory, offset + 0x74)
+            size = size_low if self.__sector_size == 512 else size_low | (size_high << 32)
+            if entry_type == STGTY_ROOT:
+                root_start, root_size = start, size
+            else:
+                self.__entries.setdefault(name, (start, size))
+
+        self.__mini_stream:bytes = self.__read_chain(root_start)[:root_size] if root_size else b''
+        self.__minifat:List[int] = []
+        if num_minifat_sectors and first_minifat_sector != ENDOFCHAIN:
+            raw = self.__read_chain(first_minifat_sector)
+            self.__minifat = list(struct.unpack_from(f'<{len(raw) // 4}I', raw))
+
+    def __sector(self, index:int) -> memoryview:
+        offset = (index + 1) * self.__sector_size
+        return memoryview(self.__data)[offset:offset + self.__sector_size]
+
+    def __read_fat(self, num_fat_sectors:int, first_difat_sector:int, num_difat_sectors:int) -> List[int]:
+        difat:List[int] = [x for x in struct.unpack_from('<109I', self.__data, 0x4C)]
+        per_sector = self.__sector_size // 4
+        sector = first_difat_sector
+        for _ in range(num_difat_sectors):
+            if sector in (ENDOFCHAIN, FREESECT):
+                break
+            values = struct.unpack_from(f'<{per_sector}I', self.__sector(sector))
+            difat.extend(values[:-1])
+            sector = values[-1]
+
+        fat:List[int] = []
+        for sector in difat[:num_fat_sectors]:
+            if sector in (FREESECT, ENDOFCHAIN):
+                continue
+            fat.extend(struct.unpack_from(f'<{per_sector}I', self.__sector(sector)))
+        return fat
+
+    def __read_chain(self, start:int) -> bytes:
+        chunks:List[bytes] = []
+        sector = start
+        visited = 0
+        while sector not in (ENDOFCHAIN, FREESECT) and sector < len(self.__fat):
+            chunks.append(bytes(self.__sector(sector)))
+            sector = self.__fat[sector]
+            visited += 1
+            if visited > len(self.__fat):
+                raise UnsupportedFormatError("Cadeia de setores corrompida no arquivo OLE2")
+        return b''.join(chunks)
+
+    def __read_mini_chain(self, start:int) -> bytes:
+        chunks:List[bytes] = []
+        sector = start
+        visited = 0
+        size = self.__mini_sector_size
+        while sector not in (ENDOFCHAIN, FREESECT) and sector < len(self.__minifat):
+            chunks.append(self.__mini_stream[sector * size:(sector + 1) * size])
+            sector = self.__minifat[sector]
+            visited += 1
+            if visited > len(self.__minifat):
+                raise UnsupportedFormatError("Cadeia de mini setores corrompida no arquivo OLE2")
+        return b''.join(chunks)
+
+    def open_stream(self, name:str) -> bytes:
+        """
+        Retorna o conteúdo completo do stream informado.
+        Parâmetros:
+          - name: Nome do stream (ex: 'Workbook').
+        Retorno:
+          - bytes com o conteúdo do stream.
+        """
+        for entry_name, (start, size) in self.__entries.items():
+            if entry_name.lower() == name.lower():
+                if size < self.__mini_cutoff:
+                    return self.__read_mini_chain(start)[:size]
+                return self.__read_chain(start)[:size]
+        raise KeyError(f"Stream '{name}' não encontrado no arquivo")
@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+from time import sleep
+from tracing import tracer
+
+class WorkbookDriver:
+    """
+    Interface mínima de um motor capaz de abrir pastas de trabalho.
+    O `WorkbookSession` só conversa com o motor por estes quatro métodos.
+    """
+    def start_engine(self) -> object:
+        raise NotImplementedError
+
+    def open_book(self, engine:object, file_path:str) -> object:
+        raise NotImplementedError
+
+    def close_book(self, book:object) -> None:
+        raise NotImplementedError
+
+    def stop_engine(self, engine:object) -> None:
+        raise NotImplementedError
+
+class StubDriver(WorkbookDriver):
+    """
+    Driver que não depende do Excel: lê os arquivos com o leitor nativo (BIFF8) e registra cada
+    passo do ciclo de vida em `events`. Permite testar e medir o `WorkbookSession` em qualquer máquina.
+    Parâmetros:
+      - start_delay, open_delay, close_delay, stop_delay: Tempo (s) simulado de cada operação.
+    """
+    def __init__(self, *, start_delay:float=0, open_delay:float=0, close_delay:float=0, stop_delay:float=0) -> None:
+        self.start_delay = start_delay
+        self.open_delay = open_delay
+        self.close_delay = close_delay
+        self.stop_delay = stop_delay
+        self.events:List[Tuple[str, object]] = []
+        self.__engines = 0
+
+    def start_engine(self) -> object:
+        sleep(self.start_delay)
+        self.__engines += 1
+        engine = f"engine-{self.__engines}"
+        self.events.append(('start', engine))
+        return engine
+
+    def open_book(self, engine:object, file_path:str) -> object:
+        from .biff8 import BiffWorkbook
+        sleep(self.open_delay)
+        book = BiffWorkbook(file_path)
+        self.events.append(('open', file_path))
+        return book
+
+    def close_book(self, book:object) -> None:
+        sleep(self.close_delay)
+        self.events.append(('close', book))
+
+    def stop_engine(self, engine:object) -> None:
+        sleep(self.stop_delay)
+        self.events.append(('stop', engine))
+
+class WorkbookSession:
+    """
+    Mantém um único motor (ex: uma instância do Excel) aberto durante vários arquivos.
+    Fecha apenas as pastas que ele mesmo abriu e recicla o motor a cada `recycle_every` arquivos,
+    evitando o custo de abrir/matar o Excel e as esperas fixas a cada arquivo.
+    Parâmetros:
+      - driver: Implementação de `WorkbookDriver` (padrão: `XlwingsDriver`).
+      - recycle_every: Quantidade de arquivos após a qual o motor é reiniciado (0 desativa).
+    """
+    @property
+    def driver(self) -> WorkbookDriver:
+        return self.__driver
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self.__stats
+
+    def __init__(self, driver:WorkbookDriver|None=None, *, recycle_every:int=50) -> None:
+        if driver is None:
+            from .xlwings_reader import XlwingsDriver
+            driver = XlwingsDriver()
+        self.__driver:WorkbookDriver = driver
+        self.__recycle_every:int = recycle_every
+        self.__engine:object|None = None
+        self.__books:List[object] = []
+        self.__opened_in_engine:int = 0
+        self.__stats:Dict[str, int] = {'engines': 0, 'books': 0}
+
+    def __start_engine(self) -> object:
+        if self.__engine is None:
+            with tracer.span('engine.start'):
+                self.__engine = self.__driver.start_engine()
+            self.__opened_in_engine = 0
+            self.__stats['engines'] += 1
+        return self.__engine
+
+    def __stop_engine(self) -> None:
+        for book in list(self.__books):
+            self.__close_book(book)
+        if self.__engine is not None:
+            engine, self.__engine = self.__engine, None
+            try:
+                with tracer.span('engine.stop'):
+                    self.__driver.stop_engine(engine)
+            except Exception:
+                pass
+
+    def __close_book(self, book:object) -> None:
+        if book in self.__books:
+            self.__books.remove(book)
+        try:
+            with tracer.span('book.close'):
+                self.__driver.close_book(book)
+        except Exception:
+            pass
+
+    @contextmanager
+    def open(self, file_path:str) -> Iterator:
+        """
+        Abre o arquivo no motor da sessão e o fecha ao sair do contexto.
+        Parâmetros:
+          - file_path: Caminho do arquivo a ser aberto.
+        Retorno:
+          - Pasta de trabalho entregue pelo driver (com `sheet_names` e `sheets[nome]`).
+        """
+        engine = self.__start_engine()
+        try:
+            with tracer.span('book.open'):
+                book = self.__driver.open_book(engine, file_path)
+        except Exception:
+            self.__stop_engine()
+            raise
+        self.__books.append(book)
+        self.__stats['books'] += 1
+        try:
+            yield book
+        finally:
+            self.__close_book(book)
+            self.__opened_in_engine += 1
+            if self.__recycle_every and self.__opened_in_engine >= self.__recycle_every:
+                self.__stop_engine()
+
+    def close(self) -> None:
+        """
+        Fecha as pastas ainda abertas pela sessão e encerra o motor.
+        """
+        self.__stop_engine()
+
+    def __enter__(self) -> "WorkbookSession":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,288 @@
+import re
+import csv
+import codecs
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Dict, List, Literal
+from .grid import SheetGrid
+from .ole2 import OLE2_SIGNATURE, UnsupportedFormatError
+
+Format = Literal['biff', 'html', 'xml', 'csv', 'zip', 'unknown']
+
+SNIFF_BYTES = 8192
+CHUNK_SIZE = 1 << 16
+
+_XML_SPREADSHEET = b'urn:schemas-microsoft-com:office:spreadsheet'
+_HTML_TAGS = re.compile(rb'<\s*(!doctype\s+html|html|head|body|table|meta|style|tr|td)\b', re.IGNORECASE)
+_CHARSET = re.compile(rb'''(?:charset|encoding)\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)''', re.IGNORECASE)
+_CSV_DELIMITERS = ';,\t|'
+
+def sniff_format(file_path:str) -> Format:
+    """
+    Identifica o formato real do arquivo pelos primeiros bytes, independentemente da extensão.
+    Muitos portais de bancos geram ".xls" que na verdade são tabelas HTML, XML do Excel 2003 (SpreadsheetML) ou texto CSV.
+    Retorno:
+      - 'biff' (xls binário/OLE2), 'html', 'xml' (SpreadsheetML), 'csv', 'zip' (xlsx) ou 'unknown'.
+    """
+    with open(file_path, 'rb') as _file:
+        head = _file.read(SNIFF_BYTES)
+    if head.startswith(OLE2_SIGNATURE):
+        return 'biff'
+    if head.startswith(b'PK\x03\x04'):
+        return 'zip'
+    if not head:
+        return 'unknown'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        head = head.decode(_encoding(head), errors='ignore').encode('utf-8')
+    elif b'\x00' in head:
+        return 'unknown'
+    text = head.lstrip(codecs.BOM_UTF8).lstrip()
+    if _XML_SPREADSHEET in head and text.startswith(b'<'):
+        return 'xml'
+    if text.startswith(b'<') and _HTML_TAGS.search(head):
+        return 'html'
+    if text.startswith(b'<?xml'):
+        return 'unknown'
+    return 'csv'
+
+def _encoding(head:bytes) -> str:
+    """
+    Codificação do texto: BOM, declaração no próprio arquivo (meta charset / encoding do XML),
+    UTF-8 se o início do arquivo for UTF-8 válido e, por fim, cp1252 (padrão do Excel em português).
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if (declared:=_CHARSET.search(head)):
+        try:
+            return codecs.lookup(declared.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+    try:
+        head.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as error:
+        # o trecho lido pode terminar no meio de um caractere
+        if error.start >= len(head) - 3:
+            return 'utf-8'
+    return 'cp1252'
+
+def _open_text(file_path:str, **kwargs):
+    with open(file_path, 'rb') as _file:
+        head = _file.read(SNIFF_BYTES)
+    return open(file_path, 'r', encoding=_encoding(head), errors='replace', **kwargs)
+
+def _text_value(text:str):
+    text = " ".join(text.split())
+    return text or None
+
+class _TableParser(HTMLParser):
+    """
+    Converte o HTML em linhas como o Excel faz ao abrir um "xls" em HTML: as tabelas ficam empilhadas
+    em uma única planilha, cada `<tr>` vira uma linha (com `colspan` ocupando colunas vazias) e textos
+    fora das tabelas ocupam uma linha própria. Tabelas dentro de células viram texto da célula.
+    """
+    _BLOCKS = {'p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'caption'}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows:List[list] = []
+        self.__depth:int = 0
+        self.__row:list|None = None
+        self.__cell:List[str]|None = None
+        self.__colspan:int = 1
+        self.__outside:List[str] = []
+        self.__skip:int = 0
+
+    def __flush_outside(self) -> None:
+        if (value:=_text_value("".join(self.__outside))) is not None:
+            self.rows.append([value])
+        self.__outside = []
+
+    def __close_cell(self) -> None:
+        if self.__cell is None:
+            return
+        if self.__row is None:
+            self.__row = []
+        self.__row.append(_text_value("".join(self.__cell)))
+        self.__row.extend([None] * (self.__colspan - 1))
+        self.__cell = None
+
+    def __close_row(self) -> None:
+        self.__close_cell()
+        if self.__row is not None:
+            self.rows.append(self.__row)
+            self.__row = None
+
+    def handle_starttag(self, tag:str, attrs:list) -> None:
+        if tag in ('script', 'style', 'title'):
+            self.__skip += 1
+            return
+        if tag == 'table':
+            if self.__depth == 0:
+                self.__flush_outside()
+            self.__depth += 1
+        elif self.__depth == 1 and tag == 'tr':
+            self.__close_row()
+            self.__row = []
+        elif self.__depth == 1 and tag in ('td', 'th'):
+            self.__close_cell()
+            self.__cell = []
+            colspan = dict(attrs).get('colspan') or '1'
+            self.__colspan = int(colspan) if colspan.isdigit() and int(colspan) > 0 else 1
+        elif self.__depth == 0 and tag in self._BLOCKS:
+            self.__flush_outside()
+        elif tag == 'br':
+            self.handle_data(' ')
+
+    def handle_endtag(self, tag:str) -> None:
+        if tag in ('script', 'style', 'title'):
+            self.__skip = max(self.__skip - 1, 0)
+            return
+        if tag == 'table' and self.__depth:
+            if self.__depth == 1:
+                self.__close_row()
+            self.__depth -= 1
+        elif self.__depth == 1 and tag in ('td', 'th'):
+            self.__close_cell()
+        elif self.__depth == 1 and tag == 'tr':
+            self.__close_row()
+        elif self.__depth == 0 and tag in self._BLOCKS:
+            self.__flush_outside()
+
+    def handle_data(self, data:str) -> None:
+        if self.__skip:
+            return
+        if self.__cell is not None:
+            self.__cell.append(data)
+        elif self.__depth == 0:
+            self.__outside.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self.__close_row()
+        self.__flush_outside()
+
+class HtmlWorkbook:
+    """
+    Leitor de ".xls" que na verdade são páginas HTML. O arquivo é lido em blocos (sem carregar o texto inteiro)
+    e vira uma única planilha 'Sheet0', com os valores como texto (a conversão de números e datas fica com `schema`).
+    """
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.__sheets.keys())
+
+    @property
+    def sheets(self) -> Dict[str, SheetGrid]:
+        return self.__sheets
+
+    def __init__(self, file_path:str) -> None:
+        parser = _TableParser()
+        with _open_text(file_path) as _file:
+            while (chunk:=_file.read(CHUNK_SIZE)):
+                parser.feed(chunk)
+        parser.close()
+        self.__sheets:Dict[str, SheetGrid] = {'Sheet0': SheetGrid('Sheet0', parser.rows)}
+
+_SS = '{urn:schemas-microsoft-com:office:spreadsheet}'
+
+def _xml_value(kind:str|None, text:str|None):
+    if text is None or text == "":
+        return None
+    if kind == 'Number':
+        try:
+            return float(text)
+        except ValueError:
+            return text
+    if kind == 'DateTime':
+        try:
+            return datetime.fromisoformat(text.rstrip('Z'))
+        except ValueError:
+            return text
+    if kind == 'Boolean':
+        return text.strip() in ('1', 'true', 'True')
+    return text
+
+class SpreadsheetMLWorkbook:
+    """
+    Leitor de ".xls" no formato XML do Excel 2003 (SpreadsheetML), lido em fluxo com `iterparse`
+    (cada linha é descartada da árvore assim que lida). Mantém os nomes das planilhas e a mesma semântica
+    de valores do xlwings: números como float, datas como datetime, textos como str e vazios como None.
+    """
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.__sheets.keys())
+
+    @property
+    def sheets(self) -> Dict[str, SheetGrid]:
+        return self.__sheets
+
+    def __init__(self, file_path:str) -> None:
+        from xml.etree.ElementTree import iterparse, ParseError
+        self.__sheets:Dict[str, SheetGrid] = {}
+        rows:List[list] = []
+        try:
+            for event, element in iterparse(file_path, events=('start', 'end')):
+                if event == 'start':
+                    if element.tag == f'{_SS}Worksheet':
+                        rows = []
+                    continue
+                if element.tag == f'{_SS}Row':
+                    if (index:=element.get(f'{_SS}Index')):
+                        rows.extend([] for _ in range(int(index) - 1 - len(rows)))
+                    rows.append(self.__row(element))
+                    element.clear()
+                elif element.tag == f'{_SS}Worksheet':
+                    name = element.get(f'{_SS}Name') or f"Sheet{len(self.__sheets)}"
+                    self.__sheets[name] = SheetGrid(name, rows)
+                    element.clear()
+        except ParseError as error:
+            raise UnsupportedFormatError(f"XML inválido: {error}")
+
+    @staticmethod
+    def __row(element) -> list:
+        row:list = []
+        for cell in element.iter(f'{_SS}Cell'):
+            if (index:=cell.get(f'{_SS}Index')):
+                row.extend([None] * (int(index) - 1 - len(row)))
+            data = cell.find(f'{_SS}Data')
+            if data is None:
+                row.append(None)
+            else:
+                row.append(_xml_value(data.get(f'{_SS}Type'), "".join(data.itertext())))
+            row.extend([None] * int(cell.get(f'{_SS}MergeAcross') or 0))
+        return row
+
+class _Semicolon(csv.excel):
+    delimiter = ';'
+
+class CsvWorkbook:
+    """
+    Leitor de ".xls" que na verdade são texto delimitado (';', ',', tab ou '|', detectado no início do arquivo),
+    lido linha a linha em uma planilha 'Sheet0' com os valores como texto.
+    """
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.__sheets.keys())
+
+    @property
+    def sheets(self) -> Dict[str, SheetGrid]:
+        return self.__sheets
+
+    def __init__(self, file_path:str) -> None:
+        with _open_text(file_path, newline='') as _file:
+            sample = _file.read(SNIFF_BYTES)
+            _file.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=_CSV_DELIMITERS)
+            except csv.Error:
+                dialect = _Semicolon
+            rows = [[value.strip() or None for value in line] for line in csv.reader(_file, dialect)]
+        self.__sheets:Dict[str, SheetGrid] = {'Sheet0': SheetGrid('Sheet0', rows)}
+
+NATIVE_READERS = {
+    'html': HtmlWorkbook,
+    'xml': SpreadsheetMLWorkbook,
+    'csv': CsvWorkbook,
+}
@@ -0,0 +1,80 @@
+import xlwings as xw
+from xlwings.main import App, Book, Sheet
+from typing import Dict, List
+from .grid import SheetGrid
+from .session import WorkbookDriver
+from Entities.dependencies.resource_tracker import tracker
+
+def snapshot_sheet(ws:Sheet) -> SheetGrid:
+    """
+    Copia todo o conteúdo utilizado da planilha para memória com uma única transferência COM.
+    A grade é ancorada em A1 (mesma numeração de linhas/colunas do Excel).
+    Parâmetros:
+      - ws: Planilha (`Sheet`) do xlwings.
+    Retorno:
+      - `SheetGrid` com os valores da planilha.
+    """
+    last_cell = ws.used_range.last_cell
+    rows:List[list] = ws.range((1, 1), (last_cell.row, last_cell.column)).options(ndim=2).value
+    return SheetGrid(ws.name, rows)
+
+class _SnapshotSheets:
+    def __init__(self, wb:Book) -> None:
+        self.__wb = wb
+        self.__cache:Dict[str, SheetGrid] = {}
+        
+    def __getitem__(self, name:str) -> SheetGrid:
+        if not name in self.__cache:
+            self.__cache[name] = snapshot_sheet(self.__wb.sheets[name])
+        return self.__cache[name]
+
+class XlwingsWorkbook:
+    """
+    Pasta aberta pelo Excel cujas planilhas são entregues como `SheetGrid` (snapshot feito no primeiro acesso).
+    """
+    @property
+    def book(self) -> Book:
+        return self.__book
+    
+    @property
+    def sheet_names(self) -> List[str]:
+        return self.__book.sheet_names
+    
+    @property
+    def sheets(self) -> _SnapshotSheets:
+        return self.__sheets
+    
+    def __init__(self, book:Book) -> None:
+        self.__book:Book = book
+        self.__sheets = _SnapshotSheets(book)
+
+class XlwingsDriver(WorkbookDriver):
+    """
+    Driver do `WorkbookSession` que usa uma instância invisível e exclusiva do Excel via xlwings.
+    """
+    def start_engine(self) -> App:
+        app = xw.App(visible=False, add_book=False)
+        tracker.track_process(app.pid, name='EXCEL')
+        app.display_alerts = False
+        app.screen_updating = False
+        return app
+    
+    def open_book(self, engine:App, file_path:str) -> XlwingsWorkbook:
+        book = engine.books.open(file_path, update_links=False, read_only=True)
+        # se o processo terminar com a pasta aberta, `tracker.close_all` a fecha antes de encerrar o Excel
+        tracker.track(book, book.close, name=file_path)
+        return XlwingsWorkbook(book)
+    
+    def close_book(self, book:XlwingsWorkbook) -> None:
+        try:
+            book.book.close()
+        finally:
+            tracker.untrack(book.book)
+    
+    def stop_engine(self, engine:App) -> None:
+        pid = engine.pid
+        try:
+            engine.quit()
+        except:
+            pass
+        tracker.release(pid)
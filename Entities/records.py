@@ -0,0 +1,105 @@
+from typing import Callable, Dict, Iterator, List, Tuple
+from schema import DATE_COLUMNS, DECIMAL_COLUMNS, date_value, decimal_value
+
+# atributo do registro -> coluna da saída (mesma ordem de `extract_data.COLUMNS`)
+FIELDS:Dict[str, str] = {
+    'periodo': 'Período',
+    'agencia': 'Agência',
+    'conta': 'Conta',
+    'cpf_cnpj': 'CPF/CNPJ',
+    'nome': 'Nome',
+    'tipo': 'Tipo',
+    'certificado': 'Certificado',
+    'data_emissao': 'Data de Emissão',
+    'data_vencto': 'Data de Vencto',
+    'taxa_pct': 'Taxa/ PCT',
+    'valor_principal': 'Valor Principal',
+    'valor_renda': 'Valor da Renda',
+    'valor_iof_renda': 'Valor de IOF(*)',
+    'valor_irrf_renda': 'Valor de IRRF(*)',
+    'valor_resgate': 'Valor de Resgate',
+    'data_pagto': 'Data de Pagto',
+    'vlr_da_renda': 'Vlr da Renda',
+    'valor_de_iof': 'Valor de IOF',
+    'valor_de_irrf': 'Valor de IRRF',
+    'valor_credito': 'Valor do Crédito',
+    'renda_mes': 'Renda no Mês',
+}
+_ATTRIBUTES:Dict[str, str] = {column: attribute for attribute, column in FIELDS.items()}
+
+class StatementRecord:
+    """
+    Uma linha da saída, com os valores já tipados como em `schema.coerce_types`
+    (datas como `datetime`, valores/taxas como `float`; o que não puder ser convertido fica None).
+    Usa `__slots__`: não tem `__dict__` e ocupa bem menos memória que um dicionário.
+    Os valores podem ser lidos pelo atributo (`record.valor_principal`) ou pelo nome da coluna (`record['Valor Principal']`).
+    """
+    __slots__ = tuple(FIELDS)
+
+    def __init__(self, values:tuple) -> None:
+        for attribute, value in zip(self.__slots__, values):
+            setattr(self, attribute, value)
+
+    def __getitem__(self, column:str):
+        return getattr(self, _ATTRIBUTES[column])
+
+    def values(self) -> tuple:
+        """
+        Valores na ordem das colunas da saída.
+        """
+        return tuple(getattr(self, attribute) for attribute in self.__slots__)
+
+    def as_dict(self) -> Dict[str, object]:
+        """
+        {coluna da saída: valor}.
+        """
+        return dict(zip(FIELDS.values(), self.values()))
+
+    def __eq__(self, other:object) -> bool:
+        return isinstance(other, StatementRecord) and self.values() == other.values()
+
+    def __repr__(self) -> str:
+        return f"<StatementRecord {self.tipo} {self.agencia}/{self.conta} {self.data_emissao} {self.valor_principal}>"
+
+def row_getter(columns:List[str]) -> Callable[[StatementRecord], tuple]:
+    """
+    Função que devolve os valores de um registro na ordem de `columns` (colunas desconhecidas ficam None).
+    """
+    attributes = [_ATTRIBUTES.get(column) for column in columns]
+    return lambda record: tuple(getattr(record, attribute) if attribute else None for attribute in attributes)
+
+def _converter(column:str):
+    if column in DATE_COLUMNS:
+        return date_value
+    if column in DECIMAL_COLUMNS:
+        scale = DECIMAL_COLUMNS[column]
+        return lambda value: decimal_value(value, scale)
+    return None
+
+def section_records(rows:List[list], *, positions:Dict[str, int], constants:Dict[str, object]) -> Iterator[StatementRecord]:
+    """
+    Converte as linhas de uma seção (ver `extract_data.get_section`) em `StatementRecord`, uma por vez.
+    Parâmetros:
+      - rows: Linhas da seção como lidas da planilha.
+      - positions: {coluna da saída: posição do valor em cada linha}.
+      - constants: {coluna da saída: valor repetido em todas as linhas}; prevalece sobre `positions`.
+    """
+    # para cada coluna: (posição na linha ou None, valor constante já convertido, conversor)
+    plan:List[Tuple[int|None, object, object]] = []
+    for column in FIELDS.values():
+        convert = _converter(column)
+        if column in constants:
+            value = constants[column]
+            plan.append((None, convert(value) if convert else value, None))
+        else:
+            plan.append((positions.get(column), None, convert))
+
+    for row in rows:
+        values = []
+        for position, constant, convert in plan:
+            if position is None:
+                values.append(constant)
+                continue
+            value = row[position] if position < len(row) else None
+            values.append(convert(value) if convert else value)
+        yield StatementRecord(tuple(values))
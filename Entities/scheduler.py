@@ -0,0 +1,131 @@
+import os
+import json
+import fnmatch
+from typing import Dict, List, Tuple
+
+class CostHistory:
+    """
+    Histórico (JSON) do custo de extração de cada arquivo, usado para estimar o tempo de arquivos novos.
+    Guarda, por nome de arquivo, o tamanho, as linhas e os segundos da última extração, além de médias móveis
+    globais de linhas por byte, segundos por linha e custo fixo por arquivo (medido nos arquivos sem linhas).
+    Parâmetros:
+      - file_path: Caminho do arquivo do histórico.
+      - alpha: Peso de cada nova medição nas médias móveis.
+    """
+    DEFAULTS:Dict[str, float] = {
+        'rows_per_byte': 0.01,
+        'seconds_per_row': 0.0001,
+        'overhead': 0.05,
+    }
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        return self.__rates
+
+    def __init__(self, file_path:str=os.path.join(os.getcwd(), 'Cache', 'schedule.json'), *, alpha:float=0.3) -> None:
+        self.__file_path:str = file_path
+        self.__alpha:float = alpha
+        self.__files:Dict[str, dict] = {}
+        self.__rates:Dict[str, float] = dict(CostHistory.DEFAULTS)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as _file:
+                data = json.load(_file)
+            self.__files.update(data.get('files', {}))
+            self.__rates.update(data.get('rates', {}))
+        except (FileNotFoundError, ValueError, AttributeError):
+            pass
+
+    def estimate(self, name:str, size:int) -> float:
+        """
+        Segundos estimados para extrair o arquivo: custo fixo + linhas x segundos por linha.
+        As linhas são as da última extração do mesmo arquivo (mesmo nome e tamanho) ou estimadas pelo tamanho.
+        """
+        entry = self.__files.get(name)
+        if entry is not None and entry.get('size') == size and entry.get('rows') is not None:
+            rows = entry['rows']
+        else:
+            rows = size * self.__rates['rows_per_byte']
+        return self.__rates['overhead'] + rows * self.__rates['seconds_per_row']
+
+    def record(self, name:str, *, size:int, rows:int, seconds:float, cached:bool=False) -> None:
+        """
+        Registra uma extração. Resultados vindos do cache atualizam só as linhas do arquivo, não as médias de tempo.
+        """
+        self.__files[name] = {'size': size, 'rows': rows, 'seconds': round(seconds, 6)}
+        if cached:
+            return
+        if rows > 0:
+            if size > 0:
+                self.__update('rows_per_byte', rows / size)
+            self.__update('seconds_per_row', max(seconds - self.__rates['overhead'], 0) / rows)
+        else:
+            self.__update('overhead', seconds)
+
+    def __update(self, rate:str, value:float) -> None:
+        self.__rates[rate] += self.__alpha * (value - self.__rates[rate])
+
+    def save(self) -> None:
+        folder = os.path.dirname(self.__file_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+        temp_path = f"{self.__file_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as _file:
+            json.dump({'rates': self.__rates, 'files': self.__files}, _file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.__file_path)
+
+def parse_priorities(specs:List[str]|None) -> List[Tuple[str, int]]:
+    """
+    Interpreta as prioridades da linha de comando no formato 'padrão=prioridade' (ex: '*CDB DI*=10').
+    Retorno:
+      - Lista de (padrão fnmatch, prioridade).
+    """
+    priorities:List[Tuple[str, int]] = []
+    for spec in specs or []:
+        pattern, separator, value = spec.rpartition('=')
+        try:
+            if not separator or not pattern:
+                raise ValueError
+            priorities.append((pattern, int(value)))
+        except ValueError:
+            raise ValueError(f"Prioridade inválida '{spec}', use 'padrão=número'")
+    return priorities
+
+def priority_of(name:str, priorities:List[Tuple[str, int]]) -> int:
+    """
+    Prioridade do arquivo: a do primeiro padrão que corresponder ao nome (sem diferenciar maiúsculas), ou 0.
+    """
+    for pattern, priority in priorities:
+        if fnmatch.fnmatch(name.lower(), pattern.lower()):
+            return priority
+    return 0
+
+def schedule(files:List[Tuple[str, str]], *, history:CostHistory, priorities:List[Tuple[str, int]]|None=None, longest_first:bool=True) -> List[Tuple[str, str]]:
+    """
+    Ordena os arquivos para processamento: maior prioridade primeiro e, dentro da mesma prioridade,
+    os de maior custo estimado primeiro (LPT). Com vários processos consumindo a fila nessa ordem,
+    os arquivos longos começam cedo e os curtos preenchem o fim, aproximando o tempo total da soma
+    dos custos dividida pela quantidade de processos.
+    Parâmetros:
+      - files: Lista de (nome, caminho).
+      - history: `CostHistory` usado nas estimativas.
+      - priorities: Lista de (padrão, prioridade), ver `parse_priorities`.
+      - longest_first: False mantém a ordem de entrada dentro de cada prioridade (útil no modo sequencial).
+    Retorno:
+      - Nova lista de (nome, caminho) na ordem de processamento.
+    """
+    def cost(item:Tuple[str, str]) -> float:
+        try:
+            size = os.path.getsize(item[1])
+        except OSError:
+            size = 0
+        return history.estimate(item[0], size)
+
+    keyed = []
+    for position, item in enumerate(files):
+        priority = priority_of(item[0], priorities or [])
+        keyed.append((-priority, -cost(item) if longest_first else 0, position, item))
+    return [item for *_, item in sorted(keyed)]
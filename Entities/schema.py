@@ -0,0 +1,160 @@
+import re
+import math
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List
+
+DATE_COLUMNS:List[str] = [
+    'Data de Emissão',
+    'Data de Vencto',
+    'Data de Pagto',
+]
+
+# coluna -> quantidade de casas decimais mantidas
+DECIMAL_COLUMNS:Dict[str, int] = {
+    'Taxa/ PCT': 4,
+    'Valor Principal': 2,
+    'Valor da Renda': 2,
+    'Valor de IOF(*)': 2,
+    'Valor de IRRF(*)': 2,
+    'Valor de Resgate': 2,
+    'Valor do Crédito': 2,
+    'Renda no Mês': 2,
+}
+
+ISSUE_SAMPLES = 5
+
+def _is_blank(values:pd.Series) -> pd.Series:
+    return values.isna() | (values.astype(str).str.strip() == "")
+
+def _text_mask(values:pd.Series) -> pd.Series:
+    return values.map(lambda value: isinstance(value, str)).astype(bool)
+
+def parse_decimal(values:pd.Series, scale:int) -> pd.Series:
+    """
+    Converte a coluna inteira para `Float64` arredondado em `scale` casas.
+    Aceita números, textos no padrão brasileiro ('1.234,56', 'R$ 1.234,56', '(1.234,56)') e no padrão '1234.56'.
+    Valores que não puderem ser convertidos ficam como <NA>.
+    """
+    index = values.index
+    values = values.astype(object).reset_index(drop=True)
+    result = pd.Series(float('nan'), index=values.index, dtype='float64')
+    
+    is_text = _text_mask(values)
+    if (~is_text).any():
+        result[~is_text] = pd.to_numeric(values[~is_text], errors='coerce')
+    if is_text.any():
+        text = values[is_text].str.replace(r'R\$|\s', '', regex=True)
+        negative = text.str.fullmatch(r'\(.*\)')
+        text = text.str.strip('()')
+        brazilian = text.str.contains(',', regex=False) | text.str.fullmatch(r'-?\d{1,3}(\.\d{3})+')
+        text = text.where(~brazilian, text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False))
+        numbers = pd.to_numeric(text, errors='coerce')
+        result[is_text] = numbers.where(~negative, -numbers)
+    result.index = index
+    return result.round(scale).astype('Float64')
+
+def parse_date(values:pd.Series) -> pd.Series:
+    """
+    Converte a coluna inteira para `datetime64`. Aceita datas já lidas como data e textos 'dd/mm/aaaa'.
+    Valores que não puderem ser convertidos ficam como NaT.
+    """
+    index = values.index
+    values = values.astype(object).reset_index(drop=True)
+    result = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    
+    is_date = values.map(lambda value: isinstance(value, datetime)).astype(bool)
+    if is_date.any():
+        result[is_date] = pd.to_datetime(values[is_date], errors='coerce')
+    is_text = _text_mask(values)
+    if is_text.any():
+        text = values[is_text].str.strip()
+        parsed = pd.to_datetime(text, format='%d/%m/%Y', errors='coerce')
+        if (retry:=parsed.isna() & (text != "")).any():
+            parsed[retry] = pd.to_datetime(text[retry], dayfirst=True, format='mixed', errors='coerce')
+        result[is_text] = parsed
+    result.index = index
+    return result
+
+_CURRENCY = re.compile(r'R\$|\s')
+_NEGATIVE = re.compile(r'\(.*\)')
+_THOUSANDS = re.compile(r'-?\d{1,3}(\.\d{3})+')
+
+def decimal_value(value, scale:int) -> float|None:
+    """
+    Versão de `parse_decimal` para um único valor (usada por `ExtractData.iter_records`).
+    Retorno:
+      - float arredondado em `scale` casas ou None se não puder ser convertido.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        text = _CURRENCY.sub('', value)
+        negative = _NEGATIVE.fullmatch(text) is not None
+        text = text.strip('()')
+        if ',' in text or _THOUSANDS.fullmatch(text):
+            text = text.replace('.', '').replace(',', '.')
+        try:
+            number = float(text)
+        except ValueError:
+            return None
+        if negative:
+            number = -number
+    else:
+        return None
+    if math.isnan(number):
+        return None
+    if math.isinf(number):
+        return number
+    # mesma conta do `round` do numpy/pandas (multiplica, arredonda para o par mais próximo e divide)
+    factor = 10.0 ** scale
+    return round(number * factor) / factor
+
+def date_value(value) -> datetime|None:
+    """
+    Versão de `parse_date` para um único valor (usada por `ExtractData.iter_records`).
+    Retorno:
+      - datetime ou None se não puder ser convertido.
+    """
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str) or not (text:=value.strip()):
+        return None
+    try:
+        if len(text) == 10 and text[2] == text[5] == '/' and text[:2].isdigit() and text[3:5].isdigit() and text[6:].isdigit():
+            return datetime(int(text[6:]), int(text[3:5]), int(text[:2]))
+        return datetime.strptime(text, '%d/%m/%Y')
+    except ValueError:
+        pass
+    try:
+        parsed = pd.to_datetime(text, dayfirst=True, errors='coerce')
+    except (ValueError, OverflowError):
+        return None
+    return None if pd.isna(parsed) else parsed.to_pydatetime()
+
+def coerce_types(df:pd.DataFrame) -> pd.DataFrame:
+    """
+    Aplica o schema da saída: colunas de data viram `datetime64` e colunas de valores/taxas viram
+    `Float64` com escala fixa, coluna a coluna (sem laço por linha).
+    Os valores que não puderam ser convertidos são registrados em `df.attrs['coercion_issues']`
+    no formato {coluna: {'count': quantidade, 'samples': [valores originais]}}.
+    """
+    issues:Dict[str, dict] = {}
+    for column in df.columns:
+        if column in DECIMAL_COLUMNS:
+            converted = parse_decimal(df[column], DECIMAL_COLUMNS[column])
+        elif column in DATE_COLUMNS:
+            converted = parse_date(df[column])
+        else:
+            continue
+        failed = converted.isna().to_numpy() & ~_is_blank(df[column]).to_numpy()
+        if failed.any():
+            issues[column] = {
+                'count': int(failed.sum()),
+                'samples': [str(value) for value in df[column][failed].head(ISSUE_SAMPLES)],
+            }
+        df[column] = converted
+    df.attrs['coercion_issues'] = issues
+    return df
@@ -0,0 +1,294 @@
+import os
+import struct
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+HEADERS:List[str] = [
+    'Dt. Aplicação',
+    'Dt. Vencto',
+    'Taxa (%)',
+    'Vlr Princ. (R$)',
+    'Renda Total(R$)',
+    'Vlr. IOF (R$)',
+    'Vlr. IRRF (R$)',
+    'Vlr. Bruto (R$)',
+    'Dt. Resgate / Carência',
+    'Vlr Líquido(R$)',
+    'Renda Bruta Per',
+]
+
+def statement_rows(*, aplicacoes:int=50, resgates:int=20, seed:int=0, produto:str="CDB DI") -> List[list]:
+    """
+    Gera as linhas de um extrato sintético com o mesmo layout da 'Sheet0' dos bancos:
+    cabeçalho com Empresa/CNPJ e Agência/conta, linha de títulos ('Dt. Aplicação', ...),
+    seção 'Aplicações', 'Total', seção 'Resgates / Vencimentos' e 'Total'.
+    Parâmetros:
+      - aplicacoes: Quantidade de linhas na seção Aplicações.
+      - resgates: Quantidade de linhas na seção Resgates / Vencimentos.
+      - seed: Semente para gerar sempre os mesmos valores.
+      - produto: Texto usado no título do extrato.
+    Retorno:
+      - Lista de linhas (lista de listas) ancorada em A1.
+    """
+    rnd = random.Random(seed)
+    width = len(HEADERS)
+
+    def line(*values) -> list:
+        return list(values) + [None] * (width - len(values))
+
+    def movement(emissao:datetime, resgate:datetime|None) -> list:
+        principal = round(rnd.uniform(1_000, 5_000_000), 2)
+        renda = round(principal * rnd.uniform(0.001, 0.12), 2)
+        iof = round(renda * rnd.uniform(0, 0.05), 2)
+        irrf = round(renda * 0.15, 2)
+        bruto = round(principal + renda, 2)
+        return [
+            emissao.strftime('%d/%m/%Y'),
+            (emissao + timedelta(days=rnd.randint(30, 1800))).strftime('%d/%m/%Y'),
+            round(rnd.uniform(90, 120), 2),
+            principal,
+            renda,
+            iof,
+            irrf,
+            bruto,
+            resgate,
+            round(bruto - iof - irrf, 2),
+            round(renda * rnd.uniform(0, 0.2), 2),
+        ]
+
+    base = datetime(2024, 12, 31)
+    rows:List[list] = [
+        line(f"Extrato de Investimentos - {produto}"),
+        line(f"Empresa/CNPJ: EMPRESA SINTETICA {seed} LTDA | {seed % 100:02d}.345.678/0001-{seed % 90 + 10}"),
+        line(f"Agência/conta: {1000 + seed % 9000} / {10000 + seed % 90000}-{seed % 10}"),
+        line(),
+        list(HEADERS),
+        line('Aplicações'),
+    ]
+    for _ in range(aplicacoes):
+        rows.append(movement(base - timedelta(days=rnd.randint(0, 720)), None))
+    rows.append(line('Total'))
+    rows.append(line('Resgates / Vencimentos'))
+    for _ in range(resgates):
+        emissao = base - timedelta(days=rnd.randint(30, 720))
+        rows.append(movement(emissao, emissao + timedelta(days=rnd.randint(1, 29))))
+    rows.append(line('Total'))
+    rows.append(line('Posição consolidada sujeita a confirmação'))
+    return rows
+
+# ---------------------------------------------------------------------------
+# Escrita mínima de .xls (BIFF8 dentro de um container OLE2), sem dependências.
+# Gera apenas o necessário para o Excel e o leitor nativo abrirem o arquivo.
+# ---------------------------------------------------------------------------
+
+_MAX_RECORD = 8224
+_ENDOFCHAIN = 0xFFFFFFFE
+_FREESECT = 0xFFFFFFFF
+_FATSECT = 0xFFFFFFFD
+_DIFSECT = 0xFFFFFFFC
+_DATE_XF = 16
+_CELL_XF = 15
+
+def _record(rtype:int, data:bytes) -> bytes:
+    return struct.pack('<HH', rtype, len(data)) + data
+
+def _unicode(text:str, length_size:int=2) -> bytes:
+    try:
+        encoded, flags = text.encode('latin-1'), 0x00
+    except UnicodeEncodeError:
+        encoded, flags = text.encode('utf-16-le'), 0x01
+    return struct.pack('<H' if length_size == 2 else '<B', len(text)) + bytes([flags]) + encoded
+
+def _bof(kind:int) -> bytes:
+    return _record(0x0809, struct.pack('<HHHHII', 0x0600, kind, 0x0DBB, 0x07CC, 0, 6))
+
+def _sst(strings:List[str], total:int) -> bytes:
+    records:List[bytearray] = []
+    current = bytearray(struct.pack('<II', total, len(strings)))
+    for text in strings:
+        try:
+            encoded, flags, width = text.encode('latin-1'), 0x00, 1
+        except UnicodeEncodeError:
+            encoded, flags, width = text.encode('utf-16-le'), 0x01, 2
+        head = struct.pack('<HB', len(text), flags)
+        if len(current) + len(head) + width > _MAX_RECORD:
+            records.append(current)
+            current = bytearray()
+        current += head
+        position = 0
+        while position < len(encoded):
+            take = ((_MAX_RECORD - len(current)) // width) * width
+            if take:
+                current += encoded[position:position + take]
+                position += take
+            if position < len(encoded):
+                records.append(current)
+                current = bytearray([flags])
+    records.append(current)
+    return b''.join(_record(0x00FC if i == 0 else 0x003C, bytes(data)) for i, data in enumerate(records))
+
+def _globals(sheet_names:List[str], positions:List[int], strings:List[str], total_strings:int) -> bytes:
+    data = bytearray()
+    data += _bof(0x0005)
+    data += _record(0x0042, struct.pack('<H', 1200))
+    data += _record(0x003D, struct.pack('<HHHHHHHHH', 0, 0, 0x4000, 0x2000, 0x38, 0, 0, 1, 0x258))
+    data += _record(0x0022, struct.pack('<H', 0))
+    for _ in range(5):
+        data += _record(0x0031, struct.pack('<HHHHHBBBB', 200, 0, 0x7FFF, 400, 0, 0, 0, 0, 0) + _unicode('Arial', 1))
+    data += _record(0x041E, struct.pack('<H', 164) + _unicode('dd/mm/yyyy'))
+    for _ in range(15):
+        data += _record(0x00E0, struct.pack('<HHHBBBBIIH', 0, 0, 0xFFF5, 0x20, 0, 0, 0xF4, 0, 0, 0x20C0))
+    data += _record(0x00E0, struct.pack('<HHHBBBBIIH', 0, 0, 0x0001, 0x20, 0, 0, 0xF8, 0, 0, 0x20C0))
+    data += _record(0x00E0, struct.pack('<HHHBBBBIIH', 0, 164, 0x0001, 0x20, 0, 0, 0xF8, 0, 0, 0x20C0))
+    data += _record(0x0293, struct.pack('<HBB', 0x8000, 0, 0xFF))
+    for name, position in zip(sheet_names, positions):
+        data += _record(0x0085, struct.pack('<IBB', position, 0, 0) + _unicode(name, 1))
+    data += _sst(strings, total_strings)
+    data += _record(0x000A, b'')
+    return bytes(data)
+
+def _sheet(rows:List[list], sst:Dict[str, int]) -> bytes:
+    n_cols = max((len(row) for row in rows), default=0)
+    data = bytearray()
+    data += _bof(0x0010)
+    data += _record(0x0200, struct.pack('<IIHHH', 0, len(rows), 0, n_cols, 0))
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            if value is None or value == "":
+                continue
+            if isinstance(value, bool):
+                data += _record(0x0205, struct.pack('<HHHBB', r, c, _CELL_XF, int(value), 0))
+            elif isinstance(value, datetime):
+                serial = (value - datetime(1899, 12, 30)) / timedelta(days=1)
+                data += _record(0x0203, struct.pack('<HHHd', r, c, _DATE_XF, serial))
+            elif isinstance(value, (int, float)):
+                data += _record(0x0203, struct.pack('<HHHd', r, c, _CELL_XF, float(value)))
+            else:
+                data += _record(0x00FD, struct.pack('<HHHI', r, c, _CELL_XF, sst[str(value)]))
+    data += _record(0x023E, struct.pack('<HHHHHHHI', 0x06B6, 0, 0, 0x40, 0, 0, 0, 0))
+    data += _record(0x000A, b'')
+    return bytes(data)
+
+def _compound_file(stream:bytes) -> bytes:
+    sector = 512
+    if len(stream) < 4096:
+        stream += b'\x00' * (4096 - len(stream))
+    if len(stream) % sector:
+        stream += b'\x00' * (sector - len(stream) % sector)
+    n_stream = len(stream) // sector
+
+    n_fat, n_difat = 1, 0
+    while True:
+        total = n_stream + 1 + n_fat + n_difat
+        need_fat = -(-total // 128)
+        need_difat = 0 if need_fat <= 109 else -(-(need_fat - 109) // 127)
+        if (need_fat, need_difat) == (n_fat, n_difat):
+            break
+        n_fat, n_difat = need_fat, need_difat
+
+    dir_sector = n_stream
+    fat_sectors = list(range(n_stream + 1, n_stream + 1 + n_fat))
+    difat_sectors = list(range(n_stream + 1 + n_fat, n_stream + 1 + n_fat + n_difat))
+
+    fat = [_FREESECT] * (n_fat * 128)
+    for i in range(n_stream - 1):
+        fat[i] = i + 1
+    fat[n_stream - 1] = _ENDOFCHAIN
+    fat[dir_sector] = _ENDOFCHAIN
+    for i in fat_sectors:
+        fat[i] = _FATSECT
+    for i in difat_sectors:
+        fat[i] = _DIFSECT
+
+    def entry(name:str, kind:int, child:int, start:int, size:int) -> bytes:
+        encoded = name.encode('utf-16-le') + b'\x00\x00' if name else b''
+        return (
+            encoded.ljust(64, b'\x00')
+            + struct.pack('<HBB', len(encoded), kind, 1)
+            + struct.pack('<III', _FREESECT, _FREESECT, child)
+            + b'\x00' * 16
+            + struct.pack('<IQQIII', 0, 0, 0, start, size, 0)
+        )
+    directory = (
+        entry('Root Entry', 5, 1, _ENDOFCHAIN, 0)
+        + entry('Workbook', 2, _FREESECT, 0, len(stream))
+        + entry('', 0, _FREESECT, 0, 0) * 2
+    )
+
+    difat_head = fat_sectors[:109] + [_FREESECT] * (109 - len(fat_sectors[:109]))
+    header = (
+        b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1' + b'\x00' * 16
+        + struct.pack('<HHHHH', 0x003E, 0x0003, 0xFFFE, 9, 6) + b'\x00' * 6
+        + struct.pack('<IIIIIIIII', 0, n_fat, dir_sector, 0, 4096, _ENDOFCHAIN, 0, difat_sectors[0] if difat_sectors else _ENDOFCHAIN, n_difat)
+        + struct.pack('<109I', *difat_head)
+    )
+
+    difat = bytearray()
+    rest = fat_sectors[109:]
+    for i, _sector in enumerate(difat_sectors):
+        values = rest[i * 127:(i + 1) * 127]
+        values += [_FREESECT] * (127 - len(values))
+        following = difat_sectors[i + 1] if i + 1 < len(difat_sectors) else _ENDOFCHAIN
+        difat += struct.pack('<128I', *values, following)
+
+    return header + stream + directory + struct.pack(f'<{len(fat)}I', *fat) + bytes(difat)
+
+def write_xls(path:str, sheets:Dict[str, List[list]]) -> str:
+    """
+    Grava um arquivo .xls (BIFF8) com as planilhas informadas.
+    Parâmetros:
+      - path: Caminho do arquivo a ser criado.
+      - sheets: {nome da planilha: linhas (lista de listas) ancoradas em A1}. Aceita str, float/int, datetime, bool e None.
+    Retorno:
+      - O caminho do arquivo gravado.
+    """
+    sst:Dict[str, int] = {}
+    total_strings = 0
+    for rows in sheets.values():
+        for row in rows:
+            for value in row:
+                if isinstance(value, str) and value != "":
+                    total_strings += 1
+                    sst.setdefault(value, len(sst))
+
+    names = list(sheets.keys())
+    bodies = [_sheet(rows, sst) for rows in sheets.values()]
+    strings = list(sst.keys())
+    size = len(_globals(names, [0] * len(names), strings, total_strings))
+    positions:List[int] = []
+    for body in bodies:
+        positions.append(size)
+        size += len(body)
+    stream = _globals(names, positions, strings, total_strings) + b''.join(bodies)
+
+    with open(path, 'wb') as _file:
+        _file.write(_compound_file(stream))
+    return path
+
+def generate_files(folder:str, *, files:int=10, aplicacoes:int=50, resgates:int=20, seed:int=0, statements:int=1, sheets:int=1) -> List[str]:
+    """
+    Gera vários extratos sintéticos (.xls) na pasta informada.
+    Parâmetros:
+      - folder: Pasta de destino (criada se não existir).
+      - files: Quantidade de arquivos.
+      - aplicacoes / resgates: Linhas por seção em cada extrato.
+      - seed: Semente inicial; cada extrato usa uma semente diferente a partir de `seed`.
+      - statements: Extratos (contas) empilhados em cada planilha.
+      - sheets: Planilhas por arquivo ('Sheet0', 'Sheet1', ...).
+    Retorno:
+      - Lista com os caminhos gerados.
+    """
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    paths:List[str] = []
+    for i in range(files):
+        book:Dict[str, List[list]] = {}
+        for s in range(sheets):
+            rows:List[list] = []
+            for n in range(statements):
+                block_seed = seed + i + (s * statements + n) * files
+                rows.extend(statement_rows(aplicacoes=aplicacoes, resgates=resgates, seed=block_seed))
+            book[f"Sheet{s}"] = rows
+        paths.append(write_xls(os.path.join(folder, f"extrato_sintetico_{i:04d}.xls"), book))
+    return paths
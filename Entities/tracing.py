@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from itertools import count
+from typing import Dict, Iterator, List
+
+_DISABLED = nullcontext()
+
+class Tracer:
+    """
+    Registro de intervalos de tempo (spans) aninhados, por arquivo e por etapa do processamento.
+    Desativado, `span` devolve sempre o mesmo contexto vazio, sem medir nem alocar nada.
+    Cada span guarda: id, pai, nome, pid, início (epoch, s), duração (s) e atributos.
+    """
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @property
+    def spans(self) -> List[Dict[str, object]]:
+        return self.__spans
+
+    def __init__(self) -> None:
+        self.__enabled:bool = False
+        self.__spans:List[Dict[str, object]] = []
+        self.__ids = count(1)
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.__enabled = True
+
+    def disable(self) -> None:
+        self.__enabled = False
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__spans = []
+
+    def span(self, name:str, **attrs):
+        """
+        Contexto que mede o trecho de código e o registra como filho do span aberto na mesma thread.
+        Parâmetros:
+          - name: Nome da etapa (ex: 'open', 'get_dados').
+          - attrs: Informações adicionais (ex: file='extrato.xls').
+        """
+        if not self.__enabled:
+            return _DISABLED
+        return self.__span(name, attrs)
+
+    @contextmanager
+    def __span(self, name:str, attrs:dict) -> Iterator[dict]:
+        stack:List[str] = self.__local.__dict__.setdefault('stack', [])
+        record:Dict[str, object] = {
+            'id': f"{os.getpid()}-{next(self.__ids)}",
+            'parent': stack[-1] if stack else None,
+            'name': name,
+            'pid': os.getpid(),
+            'start': time.time(),
+            'duration': None,
+            'attrs': attrs,
+        }
+        stack.append(record['id'])
+        begin = time.perf_counter()
+        try:
+            yield record
+        except BaseException as error:
+            attrs['error'] = type(error).__name__
+            raise
+        finally:
+            record['duration'] = time.perf_counter() - begin
+            stack.pop()
+            with self.__lock:
+                self.__spans.append(record)
+
+    def drain(self) -> List[Dict[str, object]]:
+        """
+        Retorna e remove os spans registrados (usado para enviá-los de um processo do pool ao principal).
+        """
+        with self.__lock:
+            spans, self.__spans = self.__spans, []
+        return spans
+
+    def merge(self, spans:List[Dict[str, object]], parent:str|None=None) -> None:
+        """
+        Incorpora spans vindos de outro processo; os que não têm pai passam a ser filhos de `parent`.
+        """
+        with self.__lock:
+            for record in spans:
+                if record['parent'] is None:
+                    record['parent'] = parent
+                self.__spans.append(record)
+
+    def save(self, file_path:str, **meta) -> str:
+        """
+        Grava o trace da execução em JSON, com os spans em ordem de início.
+        Parâmetros:
+          - file_path: Caminho do arquivo .json.
+          - meta: Informações da execução (ex: opções usadas).
+        Retorno:
+          - O caminho do arquivo gravado.
+        """
+        with self.__lock:
+            spans = sorted(self.__spans, key=lambda record: record['start'])
+        with open(file_path, 'w', encoding='utf-8') as _file:
+            json.dump({'meta': meta, 'spans': spans}, _file, indent=2, ensure_ascii=False, default=str)
+        return file_path
+
+tracer = Tracer()
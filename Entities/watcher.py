@@ -0,0 +1,161 @@
+import os
+import sys
+import time
+import select
+from typing import Dict, List, Tuple
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_MODIFY = 0x00000002
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+class _Inotify:
+    """
+    Acesso mínimo ao inotify do Linux via ctypes, usado apenas para acordar o `FolderWatcher`
+    assim que algo mudar na pasta (sem depender de pacotes externos).
+    """
+    def __init__(self, path:str) -> None:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.__fd:int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_MODIFY
+        if libc.inotify_add_watch(self.__fd, os.fsencode(path), mask) < 0:
+            os.close(self.__fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch falhou")
+
+    def wait(self, timeout:float) -> bool:
+        """
+        Espera até `timeout` segundos por eventos; retorna True se algum chegou (os eventos são descartados).
+        """
+        ready, _, _ = select.select([self.__fd], [], [], max(timeout, 0))
+        if not ready:
+            return False
+        try:
+            while os.read(self.__fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self.__fd)
+
+class FolderWatcher:
+    """
+    Observa uma pasta e entrega os arquivos que terminaram de ser gravados.
+    Um arquivo só é considerado pronto quando o tamanho e a data de modificação ficam iguais por `settle`
+    segundos, evitando ler downloads ainda incompletos. No Linux usa inotify para reagir na hora;
+    nos demais sistemas (ou se o inotify falhar) verifica a pasta a cada `poll_interval` segundos com `os.scandir`.
+    Parâmetros:
+      - path: Pasta observada.
+      - extensions: Extensões aceitas (ex: ('.xls',)); vazio aceita qualquer arquivo.
+      - settle: Tempo (s) sem alterações para o arquivo ser considerado completo.
+      - poll_interval: Intervalo (s) entre verificações quando não há inotify.
+      - use_inotify: Permite desligar o inotify (força a verificação periódica).
+    """
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self.__inotify is not None else 'poll'
+
+    def __init__(self, path:str, *, extensions:Tuple[str, ...]=(), settle:float=2.0, poll_interval:float=1.0, use_inotify:bool=True) -> None:
+        self.__path:str = path
+        self.__extensions:Tuple[str, ...] = tuple(ext.lower() for ext in extensions)
+        self.__settle:float = settle
+        self.__poll_interval:float = poll_interval
+        self.__pending:Dict[str, Tuple[int, int, float]] = {}
+        self.__ignored:Dict[str, Tuple[int, int]] = {}
+        self.__inotify:_Inotify|None = None
+        if use_inotify and sys.platform.startswith('linux'):
+            try:
+                self.__inotify = _Inotify(path)
+            except (OSError, AttributeError):
+                self.__inotify = None
+
+    def __scan(self) -> None:
+        now = time.monotonic()
+        seen:Dict[str, Tuple[int, int]] = {}
+        with os.scandir(self.__path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if self.__extensions and not entry.name.lower().endswith(self.__extensions):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                seen[entry.path] = (stat.st_size, stat.st_mtime_ns)
+
+        for path in list(self.__pending):
+            if path not in seen:
+                del self.__pending[path]
+        for path in list(self.__ignored):
+            if seen.get(path) != self.__ignored[path]:
+                del self.__ignored[path]
+
+        for path, signature in seen.items():
+            if path in self.__ignored:
+                continue
+            previous = self.__pending.get(path)
+            if previous is None or previous[:2] != signature:
+                self.__pending[path] = (*signature, now)
+
+    def ignore(self, path:str) -> None:
+        """
+        Não entrega mais o arquivo enquanto ele não for alterado (ex: arquivos que falharam no processamento).
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        self.__ignored[path] = (stat.st_size, stat.st_mtime_ns)
+        self.__pending.pop(path, None)
+
+    def ready(self) -> List[str]:
+        """
+        Verifica a pasta e retorna, em ordem alfabética, os arquivos estáveis há pelo menos `settle` segundos.
+        Os arquivos retornados saem da lista de pendentes.
+        """
+        self.__scan()
+        now = time.monotonic()
+        done = sorted(path for path, (_, _, since) in self.__pending.items() if now - since >= self.__settle)
+        for path in done:
+            del self.__pending[path]
+        return done
+
+    def wait(self, timeout:float) -> List[str]:
+        """
+        Bloqueia até haver arquivos prontos ou até `timeout` segundos.
+        Retorno:
+          - Lista de arquivos prontos (pode ser vazia se o tempo acabar).
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if files:=self.ready():
+                return files
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            if self.__pending:
+                oldest = min(since for _, _, since in self.__pending.values())
+                remaining = min(remaining, max(oldest + self.__settle - time.monotonic(), 0.05))
+            if self.__inotify is not None:
+                self.__inotify.wait(remaining)
+            else:
+                time.sleep(min(remaining, self.__poll_interval))
+
+    def close(self) -> None:
+        if self.__inotify is not None:
+            self.__inotify.close()
+            self.__inotify = None
+
+    def __enter__(self) -> "FolderWatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,94 @@
+from itertools import islice
+from typing import Iterable, List
+import pandas as pd
+from .xlsx_writer import XlsxStreamWriter
+from .csv_writer import CsvStreamWriter, EXTENSIONS as CSV_EXTENSIONS
+from .arrow_writer import ParquetStreamWriter, ArrowStreamWriter
+from tracing import tracer
+
+FORMATS = ('xlsx', 'csv', 'parquet', 'arrow')
+
+RECORDS_CHUNK = 5000
+
+def parse_format(spec:str) -> tuple:
+    """
+    Interpreta uma especificação 'formato' ou 'formato:compressão' (ex: 'parquet:zstd', 'csv:gzip').
+    Retorno:
+      - Tupla (formato, compressão ou None).
+    """
+    output_format, _, compression = spec.strip().lower().partition(':')
+    if output_format not in FORMATS:
+        raise ValueError(f"Formato de saída inválido '{output_format}', use um de {FORMATS}")
+    if not compression:
+        compression = None
+    if output_format == 'xlsx' and compression not in (None, 'none'):
+        raise ValueError("O formato xlsx já é compactado e não aceita compressão")
+    return output_format, compression
+
+def open_writer(base_path:str, spec:str, columns:List[str]):
+    """
+    Cria o escritor do formato informado. A extensão do arquivo é acrescentada ao `base_path`.
+    Parâmetros:
+      - base_path: Caminho do arquivo de saída sem extensão.
+      - spec: 'formato' ou 'formato:compressão'.
+      - columns: Ordem das colunas.
+    """
+    output_format, compression = parse_format(spec)
+    if output_format == 'xlsx':
+        return XlsxStreamWriter(base_path + '.xlsx', columns)
+    if output_format == 'csv':
+        return CsvStreamWriter(base_path + '.csv' + CSV_EXTENSIONS.get(compression, ''), columns, compression=compression)
+    if output_format == 'parquet':
+        return ParquetStreamWriter(base_path + '.parquet', columns, compression=compression)
+    return ArrowStreamWriter(base_path + '.arrow', columns, compression=compression)
+
+class WriterGroup:
+    """
+    Repassa cada DataFrame para vários escritores, permitindo gerar mais de um formato na mesma execução.
+    Parâmetros:
+      - base_path: Caminho dos arquivos de saída sem extensão.
+      - specs: Lista de formatos ('xlsx', 'csv:gzip', 'parquet:zstd', 'arrow:lz4', ...).
+      - columns: Ordem das colunas.
+    """
+    @property
+    def paths(self) -> List[str]:
+        return [writer.path for writer in self.__writers]
+    
+    def __init__(self, base_path:str, specs:List[str], columns:List[str]) -> None:
+        self.__writers:list = []
+        try:
+            for spec in specs:
+                self.__writers.append(open_writer(base_path, spec, columns))
+        except Exception:
+            self.close()
+            raise
+    
+    def write(self, df:pd.DataFrame) -> None:
+        for writer in self.__writers:
+            writer.write(df)
+    
+    def write_records(self, records:Iterable, *, chunk_size:int=RECORDS_CHUNK) -> int:
+        """
+        Grava registros (`ExtractData.iter_records`) em todos os formatos, em blocos de `chunk_size`,
+        consumindo o iterador uma única vez e sem montar DataFrame.
+        Retorno:
+          - Quantidade de registros gravados.
+        """
+        iterator = iter(records)
+        total = 0
+        while (chunk:=list(islice(iterator, chunk_size))):
+            for writer in self.__writers:
+                writer.write_records(chunk)
+            total += len(chunk)
+        return total
+    
+    def close(self) -> None:
+        for writer in self.__writers:
+            with tracer.span('writer.close', writer=type(writer).__name__):
+                writer.close()
+    
+    def __enter__(self) -> "WriterGroup":
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,141 @@
+import pandas as pd
+from typing import Iterable, List
+from dependencies.functions import P
+from schema import DATE_COLUMNS, DECIMAL_COLUMNS
+from records import StatementRecord, row_getter
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("o formato de saída escolhido precisa do pacote 'pyarrow' (pip install pyarrow)")
+    return pyarrow
+
+def build_schema(columns:List[str]):
+    """
+    Monta o schema Arrow fixo da saída a partir de `schema`: datas como timestamp, valores/taxas como
+    float64 e as demais colunas como texto.
+    """
+    pa = _pyarrow()
+    fields = []
+    for column in columns:
+        if column in DATE_COLUMNS:
+            fields.append((column, pa.timestamp('ms')))
+        elif column in DECIMAL_COLUMNS:
+            fields.append((column, pa.float64()))
+        else:
+            fields.append((column, pa.string()))
+    return pa.schema(fields)
+
+def to_table(df:pd.DataFrame, schema):
+    """
+    Converte o DataFrame para uma tabela Arrow com o schema informado, para que todos os lotes
+    gravados no mesmo arquivo tenham exatamente os mesmos tipos.
+    """
+    pa = _pyarrow()
+    arrays = []
+    for field in schema:
+        if field.name in df.columns:
+            column = df[field.name]
+        else:
+            column = pd.Series([None] * len(df), index=df.index, dtype=object)
+        if pa.types.is_timestamp(field.type):
+            values = pd.to_datetime(column, errors='coerce')
+            arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        elif pa.types.is_floating(field.type):
+            values = pd.to_numeric(column, errors='coerce')
+            if (lost:=int((values.isna() & column.notna() & (column.astype(str) != "")).sum())):
+                print(P(f"{lost} valor(es) não numérico(s) na coluna '{field.name}' gravado(s) como vazio", color='yellow'))
+            arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        else:
+            values = [None if (value is None or (isinstance(value, float) and value != value)) else str(value) for value in column]
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def records_table(records:Iterable[StatementRecord], schema):
+    """
+    Monta a tabela Arrow direto dos registros (já tipados), sem passar por DataFrame.
+    """
+    pa = _pyarrow()
+    getter = row_getter(schema.names)
+    columns = list(zip(*(getter(record) for record in records))) or [()] * len(schema)
+    arrays = []
+    for field, values in zip(schema, columns):
+        if pa.types.is_string(field.type):
+            values = [None if value is None else str(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+class ParquetStreamWriter:
+    """
+    Grava a saída em Parquet, um row group por DataFrame recebido.
+    Parâmetros:
+      - path: Caminho do arquivo .parquet.
+      - columns: Ordem das colunas.
+      - compression: Codec do Parquet ('snappy' (padrão), 'gzip', 'zstd', 'brotli', 'lz4' ou 'none').
+    """
+    @property
+    def path(self) -> str:
+        return self.__path
+    
+    def __init__(self, path:str, columns:List[str], *, compression:str|None=None) -> None:
+        _pyarrow()
+        import pyarrow.parquet as pq
+        self.__path:str = path
+        self.__schema = build_schema(columns)
+        self.__writer = pq.ParquetWriter(path, self.__schema, compression=compression or 'snappy')
+        self.__closed:bool = False
+    
+    def write(self, df:pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self.__writer.write_table(to_table(df, self.__schema))
+    
+    def write_records(self, records:Iterable[StatementRecord]) -> None:
+        table = records_table(records, self.__schema)
+        if table.num_rows:
+            self.__writer.write_table(table)
+    
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__writer.close()
+
+class ArrowStreamWriter:
+    """
+    Grava a saída no formato Arrow IPC (arquivo .arrow / Feather v2), um lote por DataFrame recebido.
+    Parâmetros:
+      - path: Caminho do arquivo .arrow.
+      - columns: Ordem das colunas.
+      - compression: 'lz4', 'zstd' ou None/'none'.
+    """
+    @property
+    def path(self) -> str:
+        return self.__path
+    
+    def __init__(self, path:str, columns:List[str], *, compression:str|None=None) -> None:
+        pa = _pyarrow()
+        import pyarrow.ipc
+        self.__path:str = path
+        self.__schema = build_schema(columns)
+        self.__sink = pa.OSFile(path, 'wb')
+        self.__writer = pa.ipc.new_file(self.__sink, self.__schema, options=pa.ipc.IpcWriteOptions(compression=None if compression == 'none' else compression))
+        self.__closed:bool = False
+    
+    def write(self, df:pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self.__writer.write_table(to_table(df, self.__schema))
+    
+    def write_records(self, records:Iterable[StatementRecord]) -> None:
+        table = records_table(records, self.__schema)
+        if table.num_rows:
+            self.__writer.write_table(table)
+    
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__writer.close()
+        self.__sink.close()
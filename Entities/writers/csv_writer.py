@@ -0,0 +1,71 @@
+import bz2
+import csv
+import gzip
+import lzma
+import math
+import pandas as pd
+from typing import Iterable, List
+from records import StatementRecord, row_getter
+
+OPENERS = {
+    None: open,
+    'none': open,
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+EXTENSIONS = {
+    None: '',
+    'none': '',
+    'gzip': '.gz',
+    'bz2': '.bz2',
+    'xz': '.xz',
+}
+
+def _cell_value(value):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    return value
+
+class CsvStreamWriter:
+    """
+    Grava a saída em CSV (separador ';', UTF-8), acrescentando as linhas de cada DataFrame recebido.
+    Parâmetros:
+      - path: Caminho do arquivo .csv.
+      - columns: Ordem das colunas.
+      - compression: 'gzip', 'bz2', 'xz' ou None.
+    """
+    @property
+    def path(self) -> str:
+        return self.__path
+    
+    def __init__(self, path:str, columns:List[str], *, compression:str|None=None) -> None:
+        if compression not in OPENERS:
+            raise ValueError(f"Compressão '{compression}' não suportada para csv, use uma de {[x for x in OPENERS if x and x != 'none']}")
+        self.__path:str = path
+        self.__columns:List[str] = list(columns)
+        self.__file = OPENERS[compression](path, 'wt', encoding='utf-8', newline='')
+        self.__writer = csv.writer(self.__file, delimiter=';')
+        self.__writer.writerow(self.__columns)
+        self.__closed:bool = False
+    
+    def write(self, df:pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self.__writer.writerows(
+            [_cell_value(value) for value in row]
+            for row in df.reindex(columns=self.__columns).itertuples(index=False, name=None)
+        )
+    
+    def write_records(self, records:Iterable[StatementRecord]) -> None:
+        getter = row_getter(self.__columns)
+        self.__writer.writerows([_cell_value(value) for value in getter(record)] for record in records)
+    
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__file.close()
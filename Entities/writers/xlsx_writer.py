@@ -0,0 +1,73 @@
+import math
+import pandas as pd
+from openpyxl import Workbook
+from typing import Iterable, List
+from records import StatementRecord, row_getter
+
+def _cell_value(value):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+class XlsxStreamWriter:
+    """
+    Escreve o arquivo .xlsx consolidado de forma incremental, usando o modo write-only do openpyxl.
+    Cada DataFrame recebido em `write` é gravado imediatamente, então a memória usada não depende
+    da quantidade de extratos do lote.
+    Parâmetros:
+      - path: Caminho do arquivo .xlsx de saída.
+      - columns: Ordem das colunas a ser gravada (colunas ausentes ficam vazias).
+      - sheet_name: Nome da planilha de saída.
+    """
+    @property
+    def path(self) -> str:
+        return self.__path
+    
+    @property
+    def rows(self) -> int:
+        return self.__rows
+    
+    def __init__(self, path:str, columns:List[str], *, sheet_name:str='Sheet1') -> None:
+        self.__path:str = path
+        self.__columns:List[str] = list(columns)
+        self.__rows:int = 0
+        self.__wb = Workbook(write_only=True)
+        self.__ws = self.__wb.create_sheet(sheet_name)
+        self.__ws.append(self.__columns)
+        self.__closed:bool = False
+    
+    def write(self, df:pd.DataFrame) -> None:
+        """
+        Acrescenta as linhas do DataFrame ao arquivo, na ordem de colunas definida.
+        """
+        if df.empty:
+            return
+        for row in df.reindex(columns=self.__columns).itertuples(index=False, name=None):
+            self.__ws.append([_cell_value(value) for value in row])
+            self.__rows += 1
+    
+    def write_records(self, records:Iterable[StatementRecord]) -> None:
+        """
+        Acrescenta os registros (`ExtractData.iter_records`) ao arquivo, sem passar por DataFrame.
+        """
+        getter = row_getter(self.__columns)
+        for record in records:
+            self.__ws.append([_cell_value(value) for value in getter(record)])
+            self.__rows += 1
+    
+    def close(self) -> None:
+        """
+        Finaliza e salva o arquivo .xlsx.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__wb.save(self.__path)
+    
+    def __enter__(self) -> "XlsxStreamWriter":
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,276 @@
+from Entities.dependencies.functions import P
+from Entities.synthetic import generate_files
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+import tracemalloc
+import subprocess
+import statistics
+import sys
+import argparse
+import tempfile
+import shutil
+import json
+import time
+import os
+
+class Benchmark:
+    """
+    Mede o custo da extração e da consolidação usando extratos sintéticos (ver `Entities/synthetic.py`).
+    Reporta o tempo de cada etapa (leitura, índice, extração, escrita) e o tempo ponta a ponta,
+    em arquivos/s e linhas/s, além do pico de memória. O resultado é salvo em JSON na pasta 'Benchmarks'
+    para comparar versões.
+    """
+    results_path:str = os.path.join(os.getcwd(), 'Benchmarks')
+
+    @staticmethod
+    def parse_args(argv:list|None=None) -> argparse.Namespace:
+        parser = argparse.ArgumentParser(prog='benchmark.py')
+        parser.add_argument('--files', type=int, default=20, help="quantidade de extratos sintéticos")
+        parser.add_argument('--aplicacoes', type=int, default=200, help="linhas na seção Aplicações de cada extrato")
+        parser.add_argument('--resgates', type=int, default=100, help="linhas na seção Resgates / Vencimentos de cada extrato")
+        parser.add_argument('--seed', type=int, default=0, help="semente do gerador")
+        parser.add_argument('--statements', type=int, default=1, help="extratos (contas) por planilha")
+        parser.add_argument('--sheets', type=int, default=1, help="planilhas por arquivo")
+        parser.add_argument('--engine', choices=['auto', 'biff', 'xlwings'], default='biff', help="motor de leitura dos .xls")
+        parser.add_argument('--workers', type=int, default=1, help="processos na medição ponta a ponta (1 processa em sequência)")
+        parser.add_argument('--formats', nargs='+', default=['xlsx'], help="formatos de saída, como em 'main.py start --formats'")
+        parser.add_argument('--repeat', type=int, default=1, help="repetições da medição ponta a ponta (é usado o melhor tempo)")
+        parser.add_argument('--startup-runs', type=int, default=5, help="execuções de cada cenário de inicialização do main.py (0 não mede)")
+        parser.add_argument('--compare', default=None, help="JSON de uma execução anterior para comparar")
+        parser.add_argument('--output', default=None, help="caminho do JSON de resultado (padrão: pasta 'Benchmarks')")
+        return parser.parse_args(argv)
+
+    @staticmethod
+    def __stage(seconds:float, files:int, rows:int) -> Dict[str, float]:
+        return {
+            'seconds': round(seconds, 6),
+            'files_per_s': round(files / seconds, 3) if seconds else None,
+            'rows_per_s': round(rows / seconds, 3) if seconds else None,
+        }
+
+    @staticmethod
+    def stages(paths:List[str], *, engine:str, formats:List[str], work_dir:str) -> tuple:
+        """
+        Mede separadamente cada etapa do `get_dataframe` e a escrita do consolidado.
+        Parâmetros:
+          - paths: Arquivos .xls a serem processados.
+          - engine: Motor de leitura ('auto', 'biff' ou 'xlwings').
+          - formats: Formatos de saída do `WriterGroup`.
+          - work_dir: Pasta temporária para os arquivos de saída.
+        Retorno:
+          - ({etapa: {'seconds', 'files_per_s', 'rows_per_s'}}, quantidade de linhas extraídas)
+        """
+        from Entities.extract_data import StatementIndex, sheet_sections, build_frame, open_workbook, WorkbookSession, COLUMNS
+        from Entities.writers import WriterGroup
+        import pandas as pd
+
+        periodo = datetime.now()
+        timings = {'read': 0.0, 'index': 0.0, 'extract': 0.0, 'write': 0.0}
+        frames:List[pd.DataFrame] = []
+        rows = 0
+
+        with WorkbookSession() as session:
+            for file_path in paths:
+                start = time.perf_counter()
+                with open_workbook(file_path, engine=engine, session=session) as wb:
+                    grids = [wb.sheets[name] for name in wb.sheet_names]
+                timings['read'] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                indexes = [(ws, StatementIndex.split(ws)) for ws in grids]
+                timings['index'] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                sections = [section for ws, found in indexes for section in sheet_sections(ws, periodo, indexes=found)]
+                df = build_frame(sections)
+                if not df.empty:
+                    frames.append(df)
+                    rows += len(df)
+                timings['extract'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        with WriterGroup(os.path.join(work_dir, 'stages_output'), formats, COLUMNS) as writer:
+            for df in frames:
+                writer.write(df)
+        timings['write'] = time.perf_counter() - start
+
+        return {stage: Benchmark.__stage(seconds, len(paths), rows) for stage, seconds in timings.items()}, rows
+
+    @staticmethod
+    def end_to_end(paths:List[str], *, engine:str, formats:List[str], workers:int, work_dir:str) -> tuple:
+        """
+        Mede o fluxo completo do `Execute.start` (extração de todos os arquivos + escrita do consolidado),
+        sem cache, em sequência ou com `workers` processos.
+        Retorno:
+          - (segundos, linhas extraídas)
+        """
+        from Entities.extract_data import ExtractData, WorkbookSession, COLUMNS
+        from Entities.writers import WriterGroup
+
+        rows = 0
+        start = time.perf_counter()
+        with WriterGroup(os.path.join(work_dir, 'end_to_end_output'), formats, COLUMNS) as writer:
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers, initializer=ExtractData.init_worker) as executor:
+                    futures = [executor.submit(ExtractData.pool_get_dataframe, file_path, datetime.now(), engine) for file_path in paths]
+                    for future in futures:
+                        df = future.result()
+                        if not df.empty:
+                            writer.write(df)
+                            rows += len(df)
+            else:
+                with WorkbookSession() as session:
+                    for file_path in paths:
+                        df = ExtractData.get_dataframe(file_path=file_path, periodo=datetime.now(), engine=engine, session=session)
+                        if not df.empty:
+                            writer.write(df)
+                            rows += len(df)
+        return time.perf_counter() - start, rows
+
+    @staticmethod
+    def peak_memory(paths:List[str], *, engine:str, formats:List[str], work_dir:str) -> int:
+        """
+        Executa o fluxo sequencial com `tracemalloc` ativo (em uma passada separada, pois ele deixa tudo mais lento).
+        Retorno:
+          - Pico de memória alocada pelo Python, em bytes.
+        """
+        tracemalloc.start()
+        try:
+            Benchmark.end_to_end(paths, engine=engine, formats=formats, workers=1, work_dir=work_dir)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def startup(runs:int) -> Dict[str, dict]:
+        """
+        Mede a inicialização a frio do `main.py` em processos novos (importação, listagem dos comandos e
+        `start` com a pasta 'Files' vazia), em uma pasta temporária.
+        Parâmetros:
+          - runs: Execuções de cada cenário (é usada a mediana).
+        Retorno:
+          - {cenário: {'seconds', 'heavy_modules'}}, onde `heavy_modules` são os módulos pesados carregados.
+        """
+        root = os.path.dirname(os.path.abspath(__file__))
+        heavy = ['pandas', 'numpy', 'xlwings', 'requests', 'pyarrow', 'openpyxl', 'Entities.dependencies.config', 'credenciais']
+        scenarios = {
+            'import': "import main",
+            'list': f"sys.argv = ['main.py']; import runpy; runpy.run_path({os.path.join(root, 'main.py')!r}, run_name='__main__')",
+            'start_empty': "import main; main.Execute.start()",
+        }
+        result:Dict[str, dict] = {}
+        with tempfile.TemporaryDirectory(prefix='startup_') as work_dir:
+            for name, body in scenarios.items():
+                code = f"import sys, json; sys.path.insert(0, {root!r}); {body}; print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+                timings:List[float] = []
+                loaded:List[str] = []
+                for _ in range(runs):
+                    begin = time.perf_counter()
+                    process = subprocess.run([sys.executable, '-c', code], cwd=work_dir, capture_output=True, text=True)
+                    timings.append(time.perf_counter() - begin)
+                    if process.returncode != 0:
+                        raise RuntimeError(f"Falha no cenário '{name}': {process.stderr.strip()}")
+                    loaded = json.loads(process.stdout.strip().splitlines()[-1])
+                result[name] = {'seconds': round(statistics.median(timings), 6), 'heavy_modules': loaded}
+        return result
+
+    @staticmethod
+    def compare(current:dict, previous:dict) -> None:
+        """
+        Mostra a variação de tempo de cada etapa em relação a uma execução anterior.
+        """
+        def line(name:str, now:float|None, before:float|None, unit:str='s') -> None:
+            if not now or not before:
+                return
+            change = (now - before) / before * 100
+            color = 'red' if change > 10 else 'green' if change < -10 else 'white'
+            print(P(f"  {name:<20} {before:>10.4f}{unit} -> {now:>10.4f}{unit} ({change:+.1f}%)", color=color))
+
+        print(P(f"Comparando com {previous.get('version', '?')} ({previous.get('date', '?')})", color='blue'))
+        for stage, values in current['stages'].items():
+            line(stage, values['seconds'], previous.get('stages', {}).get(stage, {}).get('seconds'))
+        line('end_to_end', current['end_to_end']['seconds'], previous.get('end_to_end', {}).get('seconds'))
+        for name, values in current.get('startup', {}).items():
+            line(f"startup.{name}", values['seconds'], previous.get('startup', {}).get(name, {}).get('seconds'))
+        before_memory = previous.get('peak_memory_bytes')
+        if before_memory:
+            line('memória', current['peak_memory_bytes'] / 2**20, before_memory / 2**20, unit='MB')
+
+    @staticmethod
+    def start(argv:list|None=None) -> dict:
+        """
+        Gera os extratos sintéticos, executa as medições e salva o resultado em JSON.
+        Parâmetros:
+          - argv: Opções de linha de comando, ver `Benchmark.parse_args`.
+        Retorno:
+          - Dicionário com os parâmetros e as medições.
+        """
+        from Entities.extract_data import EXTRACTOR_VERSION
+
+        args = Benchmark.parse_args(argv)
+        work_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            print(P(f"Gerando {args.files} extrato(s) com {args.aplicacoes}+{args.resgates} linhas", color='blue'))
+            paths = generate_files(os.path.join(work_dir, 'Files'), files=args.files, aplicacoes=args.aplicacoes, resgates=args.resgates, seed=args.seed, statements=args.statements, sheets=args.sheets)
+
+            stages, rows = Benchmark.stages(paths, engine=args.engine, formats=args.formats, work_dir=work_dir)
+
+            best = None
+            for _ in range(max(args.repeat, 1)):
+                seconds, _rows = Benchmark.end_to_end(paths, engine=args.engine, formats=args.formats, workers=args.workers, work_dir=work_dir)
+                best = seconds if best is None else min(best, seconds)
+
+            peak = Benchmark.peak_memory(paths, engine=args.engine, formats=args.formats, work_dir=work_dir)
+            
+            startup = Benchmark.startup(args.startup_runs) if args.startup_runs > 0 else {}
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        result = {
+            'version': EXTRACTOR_VERSION,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'params': {
+                'files': args.files,
+                'aplicacoes': args.aplicacoes,
+                'resgates': args.resgates,
+                'seed': args.seed,
+                'statements': args.statements,
+                'sheets': args.sheets,
+                'engine': args.engine,
+                'workers': args.workers,
+                'formats': args.formats,
+                'repeat': args.repeat,
+                'startup_runs': args.startup_runs,
+            },
+            'rows': rows,
+            'stages': stages,
+            'end_to_end': Benchmark.__stage(best, args.files, rows),
+            'peak_memory_bytes': peak,
+            'startup': startup,
+        }
+
+        for stage, values in result['stages'].items():
+            print(P(f"  {stage:<12} {values['seconds']:>10.4f}s  {values['files_per_s'] or 0:>10.1f} arquivos/s  {values['rows_per_s'] or 0:>12.1f} linhas/s"))
+        end = result['end_to_end']
+        print(P(f"  {'end_to_end':<12} {end['seconds']:>10.4f}s  {end['files_per_s'] or 0:>10.1f} arquivos/s  {end['rows_per_s'] or 0:>12.1f} linhas/s", color='green'))
+        print(P(f"  pico de memória: {peak / 2**20:.1f} MB"))
+        for name, values in startup.items():
+            print(P(f"  startup.{name:<12} {values['seconds']:>8.4f}s  módulos pesados: {', '.join(values['heavy_modules']) or '-'}"))
+
+        if args.compare:
+            with open(args.compare, 'r', encoding='utf-8') as _file:
+                Benchmark.compare(result, json.load(_file))
+
+        output = args.output
+        if output is None:
+            if not os.path.exists(Benchmark.results_path):
+                os.makedirs(Benchmark.results_path)
+            output = os.path.join(Benchmark.results_path, datetime.now().strftime('%Y%m%d%H%M%S_benchmark.json'))
+        with open(output, 'w', encoding='utf-8') as _file:
+            json.dump(result, _file, indent=4, ensure_ascii=False)
+        print(P(f"Resultado salvo em '{output}'", color='green'))
+        return result
+
+if __name__ == "__main__":
+    Benchmark.start()
@@ -2,6 +2,9 @@ from Entities.dependencies.arguments import Arguments
 from Entities.dependencies.functions import P
 from Entities.logInformativo import LogInformativo
 from datetime import datetime
+from typing import Iterator, List, Tuple
+import argparse
+import time
 import os
 
 class Execute:
@@ -19,13 +22,218 @@ class Execute:
         os.makedirs(return_file_path)
         
     @staticmethod
-    def start():
+    def parse_args(argv:str|list|None=None) -> argparse.Namespace:
+        """
+        Interpreta as opções passadas após o comando 'start'.
+        Parâmetros:
+          - argv: Argumento único (str) ou lista de argumentos recebidos de `Arguments`.
+        Retorno:
+          - Namespace com as opções do processamento.
+        """
+        if argv is None:
+            argv = []
+        elif isinstance(argv, str):
+            argv = [argv]
+        
+        parser = argparse.ArgumentParser(prog='main.py start')
+        parser.add_argument('--engine', choices=['auto', 'biff', 'xlwings'], default='auto',
+                            help="motor de leitura dos .xls: 'biff' (nativo, sem Excel), 'xlwings' (Excel) ou 'auto'")
+        parser.add_argument('--recycle-every', type=int, default=50,
+                            help="reinicia a instância do Excel a cada N arquivos (0 nunca reinicia)")
+        parser.add_argument('--formats', nargs='+', default=['xlsx'],
+                            help="formatos de saída, opcionalmente com compressão: xlsx, csv[:gzip|bz2|xz], parquet[:snappy|zstd|gzip|...], arrow[:lz4|zstd]")
+        parser.add_argument('--no-cache', dest='cache', action='store_false',
+                            help="não usa o cache de arquivos já extraídos (pasta 'Cache')")
+        parser.add_argument('--cache-max-mb', type=int, default=512,
+                            help="tamanho máximo do cache em MB; os itens usados há mais tempo são removidos")
+        parser.add_argument('--workers', type=int, default=1,
+                            help="quantidade de processos para ler os arquivos em paralelo (1 processa em sequência)")
+        parser.add_argument('--priority', action='append', default=[], metavar='PADRAO=N',
+                            help="prioridade dos arquivos cujo nome corresponde ao padrão (ex: '*CDB DI*=10'); maiores são processados primeiro, pode repetir")
+        parser.add_argument('--dedupe', choices=['off', 'drop', 'flag'], default='off',
+                            help="linhas repetidas entre os extratos (mesma chave): 'drop' remove, 'flag' marca na coluna 'Duplicado'")
+        parser.add_argument('--dedupe-key', nargs='+', default=None, metavar='COLUNA',
+                            help="colunas da chave de duplicidade (padrão: Agência Conta 'Data de Emissão' 'Valor Principal' Tipo)")
+        parser.add_argument('--window', type=float, default=0,
+                            help="watch: minutos de cada arquivo de saída antes de iniciar outro (0 fecha a saída a cada lote de arquivos)")
+        parser.add_argument('--settle', type=float, default=2,
+                            help="watch: segundos sem alteração para considerar um arquivo completamente gravado")
+        parser.add_argument('--poll-interval', type=float, default=1,
+                            help="watch: intervalo (s) entre verificações da pasta quando não há inotify")
+        parser.add_argument('--duration', type=float, default=0,
+                            help="watch: encerra após N segundos (0 roda até ser interrompido)")
+        parser.add_argument('--trace', action='store_true',
+                            help="registra o tempo de cada etapa por arquivo em '<saída>_trace.json' na pasta 'ReturnFiles'")
+        args = parser.parse_args(argv)
+        
+        from Entities.scheduler import parse_priorities
+        try:
+            parse_priorities(args.priority)
+        except ValueError as error:
+            parser.error(f"--priority: {error}")
+        
+        if args.dedupe_key:
+            from Entities.extract_data import COLUMNS
+            if (unknown:=[column for column in args.dedupe_key if column not in COLUMNS]):
+                parser.error(f"--dedupe-key: coluna(s) inexistente(s) {unknown}; use as colunas da saída: {COLUMNS}")
+        return args
+        
+    @staticmethod
+    def __cache(args:argparse.Namespace):
+        """
+        Cria o cache de extração conforme as opções (ou `None` quando desativado).
+        """
+        if not args.cache:
+            return None
+        from Entities.extract_data import ParseCache, EXTRACTOR_VERSION
+        return ParseCache(EXTRACTOR_VERSION, max_bytes=args.cache_max_mb * 1024 * 1024)
+    
+    @staticmethod
+    def __dedupe(args:argparse.Namespace):
+        """
+        Cria o índice de duplicidade conforme as opções (ou `None` quando desativado).
+        """
+        if args.dedupe == 'off':
+            return None
+        from Entities.dedupe import DuplicateIndex
+        return DuplicateIndex(args.dedupe_key, mode=args.dedupe)
+    
+    @staticmethod
+    def __columns(args:argparse.Namespace) -> List[str]:
+        """
+        Colunas da saída (com a coluna 'Duplicado' no modo `--dedupe flag`).
+        """
+        from Entities.extract_data import COLUMNS
+        if args.dedupe == 'flag':
+            from Entities.dedupe import FLAG_COLUMN
+            return COLUMNS + [FLAG_COLUMN]
+        return COLUMNS
+    
+    @staticmethod
+    def __target_path() -> str:
+        """
+        Caminho (sem extensão) de uma nova saída em 'ReturnFiles'. O nome leva a data/hora em segundos e,
+        se já existir uma saída com o mesmo nome (ex: dois lotes do `watch` no mesmo segundo), recebe um sufixo '_2', '_3'...
+        """
+        base = datetime.now().strftime('%Y%m%d%H%M%S_output')
+        existing = os.listdir(Execute.return_file_path)
+        name, number = base, 1
+        while any(item.startswith(f"{name}.") or item.startswith(f"{name}_trace") for item in existing):
+            number += 1
+            name = f"{base}_{number}"
+        return os.path.join(Execute.return_file_path, name)
+    
+    @staticmethod
+    def __record(history, file:str, file_path:str, df_temp, seconds:float) -> None:
+        """
+        Registra no `CostHistory` o custo medido do arquivo (usado para ordenar os próximos lotes).
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            return
+        history.record(file, size=size, rows=len(df_temp), seconds=seconds, cached=df_temp.attrs.get('cached', False))
+    
+    @staticmethod
+    def __extract_sequential(files:List[Tuple[str, str]], args:argparse.Namespace, history) -> Iterator[tuple]:
+        """
+        Processa os arquivos um a um, reaproveitando a mesma instância do Excel.
+        Retorno:
+          - Iterador de (arquivo, caminho, DataFrame ou None, erro ou None) na ordem de entrada.
+        """
+        from Entities.extract_data import ExtractData, WorkbookSession
+        
+        cache = Execute.__cache(args)
+        with WorkbookSession(recycle_every=args.recycle_every) as session:
+            for file, file_path in files:
+                print(P(f"'{file}' Iniciado", color='blue'))
+                start = time.perf_counter()
+                try:
+                    df_temp = ExtractData.get_dataframe(file_path=file_path, periodo=datetime.now(), engine=args.engine, session=session, cache=cache)
+                except Exception as e:
+                    yield file, file_path, None, e
+                    continue
+                Execute.__record(history, file, file_path, df_temp, time.perf_counter() - start)
+                yield file, file_path, df_temp, None
+    
+    @staticmethod
+    def __extract_parallel(files:List[Tuple[str, str]], args:argparse.Namespace, history, submit_order:List[Tuple[str, str]]) -> Iterator[tuple]:
+        """
+        Distribui os arquivos entre `args.workers` processos; cada processo mantém sua própria sessão do Excel.
+        Os arquivos são enviados na ordem de `submit_order` (ver `scheduler.schedule`: os mais demorados primeiro),
+        mas os resultados são devolvidos na ordem de `files`, a mesma do processamento sequencial, para que a saída
+        e o log não dependam das estimativas de custo nem de qual processo termina antes.
+        Retorno:
+          - Iterador de (arquivo, caminho, DataFrame ou None, erro ou None) na ordem de `files`.
+        """
+        from Entities.extract_data import ExtractData
+        from concurrent.futures import ProcessPoolExecutor
+        
+        cache = Execute.__cache(args)
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=ExtractData.init_worker, initargs=(args.recycle_every, args.trace)) as executor:
+            futures = {}
+            for file, file_path in submit_order:
+                print(P(f"'{file}' Iniciado", color='blue'))
+                futures[file_path] = executor.submit(ExtractData.pool_get_dataframe, file_path, datetime.now(), args.engine, cache)
+            
+            for file, file_path in files:
+                try:
+                    df_temp = futures.pop(file_path).result()
+                except Exception as e:
+                    yield file, file_path, None, e
+                    continue
+                Execute.__record(history, file, file_path, df_temp, df_temp.attrs.pop('seconds', 0.0))
+                yield file, file_path, df_temp, None
+    
+    @staticmethod
+    def __consume(file:str, file_path:str, df_temp, error:Exception|None, writer, informativo:LogInformativo, dedupe=None) -> bool:
+        """
+        Trata o resultado de um arquivo: registra o erro, ou grava as linhas na saída e só então remove o arquivo.
+        Com `dedupe` (`DuplicateIndex`), as linhas repetidas de arquivos anteriores (ou do próprio arquivo) são removidas ou marcadas.
+        Retorno:
+          - True se o arquivo foi processado (mesmo vazio), False em caso de erro.
+        """
+        from Entities.extract_data import tracer
+        
+        if error is not None:
+            print(P(f"Erro ao processar '{file}': {error}", color='red'))
+            informativo.add(f"Erro ao processar '{file}': {error}")
+            return False
+        
+        if df_temp.empty:
+            os.unlink(file_path)
+            print(P(f"'{file}' Vazio", color='yellow'))
+            return True
+        
+        for column, issue in df_temp.attrs.get('coercion_issues', {}).items():
+            print(P(f"'{file}': {issue['count']} valor(es) inválido(s) em '{column}' (ex: {issue['samples']})", color='yellow'))
+            informativo.add(f"'{file}': {issue['count']} valor(es) inválido(s) em '{column}' (ex: {issue['samples']})")
+        
+        if dedupe is not None:
+            with tracer.span('dedupe', file=file, rows=len(df_temp)):
+                df_temp, duplicates = dedupe.apply(df_temp)
+            if duplicates:
+                action = 'removida(s)' if dedupe.mode == 'drop' else 'marcada(s)'
+                print(P(f"'{file}': {duplicates} linha(s) duplicada(s) {action}", color='yellow'))
+                informativo.add(f"'{file}': {duplicates} linha(s) duplicada(s) {action}")
+        
+        with tracer.span('write', file=file, rows=len(df_temp)):
+            writer.write(df_temp)
+        os.unlink(file_path)
+        print(P(f"'{file}' Finalizado", color='green'))
+        informativo.add(f"'{file}' processado com sucesso!")
+        return True
+    
+    @staticmethod
+    def start(argv:str|list|None=None):
         """
         Inicia o processo de consolidação dos arquivos.
         Percorre os arquivos .xls na pasta 'Files', utiliza ExtractData para extrair os dados e consolida
         os DataFrames resultantes. Ao final, salva o DataFrame unificado em um arquivo Excel na pasta 'ReturnFiles'.
+        Parâmetros:
+          - argv: Opções de linha de comando (ex: `--engine biff --workers 4`), ver `Execute.parse_args`.
         """
-        from Entities.extract_data import ExtractData, pd
+        args = Execute.parse_args(argv)
         
         informativo = LogInformativo()
         informativo.clear()
@@ -39,47 +247,162 @@ class Execute:
         for _file in os.listdir(Execute.return_file_path):
             os.unlink(os.path.join(Execute.return_file_path, _file))
         
-        df = pd.DataFrame()
-        
-        for file in os.listdir(Execute.files_path):
+        files:List[Tuple[str, str]] = []
+        for file in sorted(os.listdir(Execute.files_path)):
             file_path = os.path.join(Execute.files_path, file)
             
             if os.path.isfile(file_path):
                 if file_path.lower().endswith('.xls'):
-                    print(P(f"'{file}' Iniciado", color='blue'))
-                    try:
-                        df_temp = ExtractData.get_dataframe(file_path=file_path, periodo=datetime.now())
-                    except Exception as e:
-                        print(P(f"Erro ao processar '{file}': {e}", color='red'))
-                        informativo.add(f"Erro ao processar '{file}': {e}")
-                        continue
-                    
-                    os.unlink(file_path)
-                    
-                    if df_temp.empty:
-                        print(P(f"'{file}' Vazio", color='yellow'))
-                        continue
-                    
-                    df = pd.concat([df, df_temp], ignore_index=True)
-                    print(P(f"'{file}' Finalizado", color='green'))
-                    del df_temp
-                    informativo.add(f"'{file}' processado com sucesso!")
-                    
+                    files.append((file, file_path))
                 else:
                     informativo.add(f"Arquivo '{file}' não é .xls")
             else:
                 informativo.add(f"'{file}' não é um arquivo")
         
-        target_path = os.path.join(Execute.return_file_path, datetime.now().strftime('%Y%m%d%H%M%S_output.xlsx'))          
-        df.to_excel(target_path, index=False)
+        from Entities.extract_data import tracer
+        from Entities.writers import WriterGroup
+        from Entities.scheduler import CostHistory, parse_priorities, schedule
+        
+        dedupe = Execute.__dedupe(args)
+        history = CostHistory()
+        priorities = parse_priorities(args.priority)
+        files = schedule(files, history=history, priorities=priorities, longest_first=False)
+        
+        if args.trace:
+            tracer.clear()
+            tracer.enable()
         
+        if args.workers > 1:
+            submit_order = schedule(files, history=history, priorities=priorities, longest_first=True)
+            results = Execute.__extract_parallel(files, args, history, submit_order)
+        else:
+            results = Execute.__extract_sequential(files, args, history)
+        
+        target_path = Execute.__target_path()
+        
+        with tracer.span('run', files=len(files), workers=args.workers, engine=args.engine) as run, \
+             WriterGroup(target_path, args.formats, Execute.__columns(args)) as writer:
+            for file, file_path, df_temp, error in results:
+                if df_temp is not None and 'trace' in df_temp.attrs:
+                    tracer.merge(df_temp.attrs.pop('trace'), parent=run['id'])
+                elif error is not None and hasattr(error, 'trace'):
+                    tracer.merge(error.trace, parent=run['id'])
+                
+                Execute.__consume(file, file_path, df_temp, error, writer, informativo, dedupe)
+                del df_temp
         
         for _file in os.listdir(Execute.files_path):
             os.unlink(os.path.join(Execute.files_path, _file))
+        
+        history.save()
+        
+        if args.trace:
+            tracer.disable()
+            trace_path = tracer.save(f"{target_path}_trace.json", argv=argv, files=len(files), workers=args.workers, engine=args.engine, formats=args.formats)
+            informativo.add(f"Trace salvo em '{os.path.basename(trace_path)}'")
             
         informativo.add(f"Processo finalizado.")
         
+    @staticmethod
+    def watch(argv:str|list|None=None):
+        """
+        Modo contínuo: observa a pasta 'Files' e consolida cada arquivo assim que termina de ser gravado,
+        mantendo a mesma sessão do Excel e o mesmo cache entre os arquivos.
+        A saída em 'ReturnFiles' é fechada ao fim de cada janela de `--window` minutos (ou a cada lote, com 0)
+        e a próxima é aberta quando chegar um novo arquivo.
+        Parâmetros:
+          - argv: Opções de linha de comando (ex: `--window 15 --settle 2`), ver `Execute.parse_args`.
+        """
+        from Entities.extract_data import ExtractData, WorkbookSession, tracer
+        from Entities.writers import WriterGroup
+        from Entities.watcher import FolderWatcher
+        
+        args = Execute.parse_args(argv)
+        
+        informativo = LogInformativo()
+        informativo.add("Iniciando modo contínuo (watch)")
+        
+        cache = Execute.__cache(args)
+        if args.trace:
+            tracer.clear()
+            tracer.enable()
+        
+        writer:WriterGroup|None = None
+        dedupe = None
+        target_path:str = ""
+        window_end:float = 0
+        stop_at:float|None = time.monotonic() + args.duration if args.duration else None
+        
+        def roll() -> None:
+            nonlocal writer
+            if writer is None:
+                return
+            writer.close()
+            writer = None
+            print(P(f"Saída '{os.path.basename(target_path)}' finalizada", color='green'))
+            informativo.add(f"Saída '{os.path.basename(target_path)}' finalizada")
+            if args.trace:
+                tracer.save(f"{target_path}_trace.json", argv=argv, engine=args.engine, formats=args.formats)
+                tracer.clear()
+        
+        with FolderWatcher(Execute.files_path, settle=args.settle, poll_interval=args.poll_interval) as watcher, \
+             WorkbookSession(recycle_every=args.recycle_every) as session:
+            print(P(f"Observando '{Execute.files_path}' ({watcher.backend})", color='blue'))
+            try:
+                while stop_at is None or time.monotonic() < stop_at:
+                    timeout = 60.0
+                    if stop_at is not None:
+                        timeout = min(timeout, stop_at - time.monotonic())
+                    if writer is not None:
+                        timeout = min(timeout, window_end - time.monotonic())
+                    
+                    ready = watcher.wait(max(timeout, 0))
+                    
+                    if writer is not None and time.monotonic() >= window_end:
+                        roll()
+                    
+                    for file_path in ready:
+                        file = os.path.basename(file_path)
+                        if not file.lower().endswith('.xls'):
+                            informativo.add(f"Arquivo '{file}' não é .xls")
+                            watcher.ignore(file_path)
+                            continue
+                        
+                        print(P(f"'{file}' Iniciado", color='blue'))
+                        df_temp, error = None, None
+                        try:
+                            df_temp = ExtractData.get_dataframe(file_path=file_path, periodo=datetime.now(), engine=args.engine, session=session, cache=cache)
+                        except Exception as e:
+                            error = e
+                        
+                        # uma falha na escrita (ou ao remover o arquivo) não pode encerrar o modo contínuo
+                        try:
+                            if writer is None and df_temp is not None and not df_temp.empty:
+                                target_path = Execute.__target_path()
+                                writer = WriterGroup(target_path, args.formats, Execute.__columns(args))
+                                dedupe = Execute.__dedupe(args)
+                                window_end = time.monotonic() + args.window * 60
+                            
+                            if not Execute.__consume(file, file_path, df_temp, error, writer, informativo, dedupe):
+                                watcher.ignore(file_path)
+                        except Exception as e:
+                            print(P(f"Erro ao gravar '{file}': {e}", color='red'))
+                            informativo.add(f"Erro ao gravar '{file}': {e}")
+                            watcher.ignore(file_path)
+                        del df_temp
+                    
+                    if ready and not args.window:
+                        roll()
+            except KeyboardInterrupt:
+                print(P("Modo contínuo interrompido", color='yellow'))
+            finally:
+                roll()
+                tracer.disable()
+        
+        informativo.add("Modo contínuo finalizado.")
+        
 if __name__ == "__main__":
     Arguments({
-        'start': Execute.start
+        'start': Execute.start,
+        'watch': Execute.watch,
     })
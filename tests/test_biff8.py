@@ -0,0 +1,101 @@
+from datetime import datetime
+import pytest
+from Entities.synthetic import write_xls, statement_rows
+from readers import open_workbook, UnsupportedFormatError
+from readers.biff8 import BiffWorkbook
+from readers.ole2 import CompoundFile
+
+@pytest.fixture
+def xls(tmp_path):
+    return write_xls(str(tmp_path / 'valores.xls'), {
+        'Dados': [
+            ['texto', 1.5, 2, None, datetime(2024, 3, 5), True, 'ação'],
+            [],
+            [None, None, 'x'],
+        ],
+        'Outra': [['a']],
+    })
+
+def test_value_semantics(xls):
+    wb = BiffWorkbook(xls)
+    assert wb.sheet_names == ['Dados', 'Outra']
+    grid = wb.sheets['Dados']
+    assert grid.n_rows == 3
+    assert [grid.cell(1, column) for column in range(1, 8)] == ['texto', 1.5, 2.0, None, datetime(2024, 3, 5), True, 'ação']
+    assert grid.cell(2, 1) is None
+    assert grid.cell(3, 3) == 'x'
+    assert wb.sheets['Outra'].cell(1, 1) == 'a'
+
+def test_large_shared_string_table(tmp_path):
+    # strings suficientes para o SST passar de um registro (CONTINUE)
+    rows = [[f"valor {n} " + 'ç' * (n % 40) for n in range(20)] for _ in range(1)] + \
+           [[f"linha {r} coluna {c}" for c in range(10)] for r in range(400)]
+    path = write_xls(str(tmp_path / 'sst.xls'), {'Sheet0': rows})
+    grid = BiffWorkbook(path).sheets['Sheet0']
+    assert grid.cell(1, 20) == "valor 19 " + 'ç' * 19
+    assert grid.cell(401, 10) == "linha 399 coluna 9"
+
+def test_statement_layout_round_trip(tmp_path):
+    rows = statement_rows(aplicacoes=5, resgates=3, seed=1)
+    path = write_xls(str(tmp_path / 'extrato.xls'), {'Sheet0': rows})
+    grid = BiffWorkbook(path).sheets['Sheet0']
+    assert grid.n_rows == len(rows)
+    for r, row in enumerate(rows, start=1):
+        for c, value in enumerate(row, start=1):
+            expected = float(value) if isinstance(value, int) and not isinstance(value, bool) else value
+            assert grid.cell(r, c) == (expected if expected != "" else None)
+
+def test_compound_file_streams(xls):
+    with open(xls, 'rb') as _file:
+        compound = CompoundFile(_file.read())
+    assert 'Workbook' in compound.stream_names
+    with pytest.raises(KeyError):
+        compound.open_stream('Book')
+
+@pytest.mark.parametrize('size', [600, 2000, 5000])
+def test_truncated_file_is_unsupported(xls, tmp_path, size):
+    with open(xls, 'rb') as _file:
+        data = _file.read()
+    path = tmp_path / 'truncado.xls'
+    path.write_bytes(data[:size])
+    with pytest.raises(UnsupportedFormatError):
+        BiffWorkbook(str(path))
+
+def test_excel95_book_stream_is_unsupported(xls, tmp_path):
+    with open(xls, 'rb') as _file:
+        data = _file.read()
+    path = tmp_path / 'excel95.xls'
+    path.write_bytes(data.replace('Workbook'.encode('utf-16-le'), 'Book'.encode('utf-16-le') + b'\0' * 8))
+    with pytest.raises(UnsupportedFormatError):
+        BiffWorkbook(str(path))
+
+class _FallbackSession:
+    """
+    Substitui o `WorkbookSession` (Excel) para verificar que o motor 'auto' recorre a ele.
+    """
+    def __init__(self) -> None:
+        self.opened = []
+
+    def open(self, file_path:str):
+        from contextlib import contextmanager
+        @contextmanager
+        def opened():
+            self.opened.append(file_path)
+            yield 'excel'
+        return opened()
+
+def test_auto_falls_back_to_session(xls, tmp_path):
+    with open(xls, 'rb') as _file:
+        data = _file.read()
+    path = tmp_path / 'truncado.xls'
+    path.write_bytes(data[:2000])
+    session = _FallbackSession()
+    with open_workbook(str(path), engine='auto', session=session) as wb:
+        assert wb == 'excel'
+    assert session.opened == [str(path)]
+    with pytest.raises(UnsupportedFormatError):
+        with open_workbook(str(path), engine='biff', session=session):
+            pass
+    with open_workbook(xls, engine='auto', session=session) as wb:
+        assert wb.sheet_names == ['Dados', 'Outra']
+    assert session.opened == [str(path)]
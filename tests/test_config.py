@@ -0,0 +1,32 @@
+import pytest
+from Entities.dependencies.config import Config
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    (tmp_path / 'config.init').write_text("[geral]\nurl = http://servidor\n", encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_failed_add_does_not_leak_section(config_dir):
+    config = Config()
+    with pytest.raises(Exception):
+        config.add(section='nova')
+    assert not Config().config.has_section('nova')
+    assert 'nova' not in (config_dir / 'config.init').read_text(encoding='utf-8')
+
+def test_changes_are_shared_after_save(config_dir):
+    other = Config()
+    Config().add(section='nova', chave='valor')
+    Config().alt(section='geral', url='http://outro')
+    assert Config()['nova']['chave'] == 'valor'
+    assert Config()['geral']['url'] == 'http://outro'
+    # instâncias antigas mantêm a leitura anterior até chamarem `read`
+    assert not other.config.has_section('nova')
+    other.read()
+    assert other['nova']['chave'] == 'valor'
+
+def test_delete_missing_option_keeps_cache(config_dir):
+    with pytest.raises(Exception):
+        Config().delete('geral', 'inexistente')
+    Config().delete('geral', 'url')
+    assert 'url' not in Config()['geral']
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import pytest
+from logInformativo import LogInformativo
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def _lines(path) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_buffer_size_triggers_write(workdir):
+    log = LogInformativo(buffer_size=3, flush_interval=60)
+    log.add("a")
+    log.add("b")
+    assert _lines(log.file_path) == []
+    log.add("c")
+    assert [line.split(' - ', 1)[1] for line in _lines(log.file_path)] == ["a", "b", "c"]
+
+def test_flush_interval_without_new_messages(workdir):
+    log = LogInformativo(buffer_size=50, flush_interval=0.2)
+    log.add("a")
+    log.add("b")
+    time.sleep(0.6)
+    assert len(_lines(log.file_path)) == 2
+
+def test_get_flushes_and_clear_empties(workdir):
+    log = LogInformativo(buffer_size=50, flush_interval=60)
+    log.add("primeira")
+    assert [message.split(' - ', 1)[1] for message in log.get()] == ["primeira"]
+    log.add("pendente")
+    log.clear()
+    assert log.get() == []
+    assert os.path.getsize(log.file_path) == 0
+
+def test_pending_messages_written_at_exit(workdir):
+    code = (f"import sys; sys.path.insert(0, {ROOT!r}); import Entities; "
+            "from logInformativo import LogInformativo; "
+            "log = LogInformativo(buffer_size=50, flush_interval=60); log.add('saindo')")
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=workdir)
+    assert [line.split(' - ', 1)[1] for line in _lines(workdir / 'informativoLog.jsonl')] == ["saindo"]
+
+def test_concurrent_processes_do_not_interleave(workdir):
+    code = (f"import sys; sys.path.insert(0, {ROOT!r}); import Entities; "
+            "from logInformativo import LogInformativo; "
+            "log = LogInformativo(buffer_size=7, flush_interval=60)\n"
+            "for n in range(200): log.add(f'{sys.argv[1]}-{n}-' + 'x' * 200)\n"
+            "log.flush()")
+    processes = [subprocess.Popen([sys.executable, '-c', code, str(worker)], cwd=workdir) for worker in range(4)]
+    assert all(process.wait(60) == 0 for process in processes)
+    lines = _lines(workdir / 'informativoLog.jsonl')
+    assert len(lines) == 800
+    for worker in range(4):
+        numbers = [int(line.split(' - ', 1)[1].split('-')[1]) for line in lines if line.split(' - ', 1)[1].startswith(f"{worker}-")]
+        assert numbers == list(range(200))
+
+def test_migrates_legacy_json_array(workdir):
+    (workdir / 'informativoLog.json').write_text(json.dumps(["[2024-01-01 00:00:00] - antiga"]), encoding='utf-8')
+    log = LogInformativo()
+    log.add("nova")
+    messages = log.get()
+    assert messages[0] == "[2024-01-01 00:00:00] - antiga"
+    assert messages[1].endswith(" - nova")
+    assert not (workdir / 'informativoLog.json').exists()
+    assert (workdir / 'informativoLog.json.migrated').exists()
+    assert LogInformativo().get() == messages
@@ -0,0 +1,117 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from Entities.dependencies.log_shipper import LogShipper
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_PATCH(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.received.append((self.headers.get('Authorization'), json.loads(body)))
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    """
+    Servidor HTTP local que substitui o endpoint de logs: guarda cada registro recebido e responde com `status`.
+    """
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.received = []
+    httpd.status = 200
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def _url(httpd) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}/api/rpa_logs/registrar"
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def _shipper(url:str, tmp_path, **kwargs) -> LogShipper:
+    options = dict(spill_path=str(tmp_path / 'spill.jsonl'), timeout=1, retries=1, backoff=0, cooldown=0, exit_timeout=2)
+    options.update(kwargs)
+    return LogShipper(url, **options)
+
+def _spilled(shipper:LogShipper) -> list:
+    with open(shipper.spill_path, 'r', encoding='utf-8') as _file:
+        return [json.loads(line) for line in _file if line.strip()]
+
+def test_sends_records(server, tmp_path):
+    shipper = _shipper(_url(server), tmp_path, headers={'Authorization': 'Token abc'})
+    for n in range(30):
+        shipper.submit({'n': n})
+    assert shipper.flush(5)
+    shipper.close()
+    assert [payload for _, payload in server.received] == [{'n': n} for n in range(30)]
+    assert {auth for auth, _ in server.received} == {'Token abc'}
+    assert shipper.stats['sent'] == 30
+    assert shipper.stats['spilled'] == 0
+
+def test_server_down_spills_without_blocking(tmp_path):
+    shipper = _shipper(f"http://127.0.0.1:{_closed_port()}/", tmp_path, cooldown=60)
+    start = time.monotonic()
+    for n in range(10):
+        shipper.submit({'n': n})
+    assert time.monotonic() - start < 0.5
+    assert shipper.flush(5)
+    shipper.close()
+    assert _spilled(shipper) == [{'n': n} for n in range(10)]
+    assert shipper.stats['spilled'] == 10
+
+def test_replays_spill_when_server_returns(server, tmp_path):
+    down = _shipper(f"http://127.0.0.1:{_closed_port()}/", tmp_path)
+    down.submit({'n': 0})
+    down.submit({'n': 1})
+    down.close()
+
+    shipper = _shipper(_url(server), tmp_path)
+    shipper.submit({'n': 2})
+    assert shipper.flush(5)
+    shipper.close()
+    assert [payload for _, payload in server.received] == [{'n': 2}, {'n': 0}, {'n': 1}]
+    assert shipper.stats['replayed'] == 2
+    assert not (tmp_path / 'spill.jsonl').exists()
+
+def test_client_error_is_dropped_not_spilled(server, tmp_path):
+    server.status = 400
+    shipper = _shipper(_url(server), tmp_path)
+    shipper.submit({'n': 0})
+    assert shipper.flush(5)
+    shipper.close()
+    assert shipper.stats['dropped'] == 1
+    assert not (tmp_path / 'spill.jsonl').exists()
+
+@pytest.fixture
+def hanging_server():
+    """
+    Servidor que aceita a conexão e nunca responde.
+    """
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(8)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}/"
+    sock.close()
+
+def test_close_spills_batch_stuck_on_hanging_server(hanging_server, tmp_path):
+    shipper = _shipper(hanging_server, tmp_path, timeout=30, retries=3, exit_timeout=0.5)
+    shipper.submit({'n': 0})
+    shipper.submit({'n': 1})
+    time.sleep(0.2)
+    start = time.monotonic()
+    shipper.close()
+    assert time.monotonic() - start < 2
+    assert _spilled(shipper) == [{'n': 0}, {'n': 1}]
+    assert shipper.stats['spilled'] == 2
+    assert shipper.stats['sent'] == 0
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+import time
+import pytest
+from Entities.dependencies.resource_tracker import ResourceTracker, wait_until
+
+_SLEEP = "import time; time.sleep(60)"
+_IGNORE_TERM = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(60)"
+
+@pytest.fixture
+def children():
+    """
+    Processos filhos de teste; os que sobrarem são encerrados ao fim do teste.
+    """
+    started = []
+    def spawn(code:str=_SLEEP, **kwargs) -> subprocess.Popen:
+        process = subprocess.Popen([sys.executable, '-c', code], **kwargs)
+        started.append(process)
+        return process
+    yield spawn
+    for process in started:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+
+def test_release_terminates_tracked_processes(children):
+    tracker = ResourceTracker(timeout=5)
+    processes = [children() for _ in range(3)]
+    for process in processes:
+        assert tracker.track_process(process.pid, name='dummy') is not None
+    assert tracker.release() == []
+    assert all(process.wait(5) is not None for process in processes)
+    assert tracker.processes == []
+
+def test_spawn_registers_process(children):
+    tracker = ResourceTracker(timeout=5)
+    process = tracker.spawn([sys.executable, '-c', _SLEEP], name='dummy')
+    try:
+        assert [tracked.pid for tracked in tracker.processes] == [process.pid]
+        assert tracker.close_all() == []
+        assert process.wait(5) is not None
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="SIGTERM só pode ser ignorado em POSIX")
+def test_kill_after_timeout(children):
+    tracker = ResourceTracker(timeout=0.5)
+    process = children(_IGNORE_TERM, stdout=subprocess.PIPE, text=True)
+    assert process.stdout.readline().strip() == 'ready'
+    tracker.track_process(process.pid)
+    start = time.monotonic()
+    assert tracker.release() == []
+    # o terminate é ignorado: só o kill, após o timeout, encerra o processo
+    assert time.monotonic() - start >= 0.5
+    assert process.wait(5) is not None
+
+def test_untracked_processes_are_not_touched(children):
+    tracker = ResourceTracker(timeout=1)
+    own = children()
+    other = children()
+    tracker.track_process(own.pid, name='dummy')
+    assert tracker.release(own.pid, other.pid) == []
+    assert own.wait(5) is not None
+    tracker.close_all()
+    assert other.poll() is None
+
+def test_find_only_running_matches(children):
+    tracker = ResourceTracker(timeout=1)
+    sap = children()
+    excel = children()
+    tracker.track_process(sap.pid, name='saplogon.exe')
+    tracker.track_process(excel.pid, name='EXCEL')
+    assert [tracked.pid for tracked in tracker.find(lambda tracked: 'sap' in tracked.name.lower())] == [sap.pid]
+    sap.kill()
+    sap.wait()
+    assert wait_until(lambda: not tracker.find(lambda tracked: 'sap' in tracked.name.lower()), timeout=5)
+    tracker.close_all()
+
+def test_track_process_of_finished_pid(children):
+    process = children("pass")
+    process.wait()
+    assert ResourceTracker().track_process(process.pid) is None
+
+def test_handles_closed_in_reverse_order():
+    tracker = ResourceTracker()
+    closed = []
+    first, second, kept = object(), object(), object()
+    tracker.track(first, lambda: closed.append('first'), name='first')
+    tracker.track(second, lambda: closed.append('second'), name='second')
+    tracker.track(kept, lambda: closed.append('kept'), name='kept')
+    tracker.untrack(kept)
+    assert tracker.handles == ['first', 'second']
+    tracker.close_all()
+    assert closed == ['second', 'first']
+    assert tracker.handles == []
+
+def test_close_handle_ignores_errors():
+    tracker = ResourceTracker()
+    book = object()
+    def fail():
+        raise RuntimeError("pasta já fechada")
+    tracker.track(book, fail)
+    assert tracker.close_handle(book) is True
+    assert tracker.close_handle(book) is False
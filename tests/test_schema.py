@@ -0,0 +1,70 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+from schema import parse_decimal, parse_date, coerce_types, decimal_value, date_value
+
+DECIMALS = [
+    ('1.234,56', 1234.56),
+    ('R$ 1.234,56', 1234.56),
+    ('(1.234,56)', -1234.56),
+    ('-10,5', -10.5),
+    ('1.234', 1234.0),
+    ('1234.56', 1234.56),
+    (' 7 ', 7.0),
+    (12, 12.0),
+    (3.14159, 3.14),
+    (0.125, 0.12),
+]
+
+def test_parse_decimal_formats():
+    values = pd.Series([raw for raw, _ in DECIMALS], dtype=object)
+    result = parse_decimal(values, 2)
+    assert str(result.dtype) == 'Float64'
+    assert result.tolist() == [expected for _, expected in DECIMALS]
+
+def test_parse_decimal_invalid_and_blank():
+    result = parse_decimal(pd.Series(['abc', None, '', float('nan'), '1,5'], index=[10, 11, 12, 13, 14], dtype=object), 2)
+    assert list(result.index) == [10, 11, 12, 13, 14]
+    assert result.isna().tolist() == [True, True, True, True, False]
+    assert result[14] == 1.5
+
+def test_parse_decimal_scale():
+    assert parse_decimal(pd.Series(['0,123456'], dtype=object), 4).tolist() == [0.1235]
+
+def test_parse_date():
+    values = pd.Series([datetime(2024, 1, 31), '05/02/2024', ' 01/12/2023 ', '5/1/2024', 'amanhã', None, ''], dtype=object)
+    result = parse_date(values)
+    assert str(result.dtype) == 'datetime64[ns]'
+    assert result[:4].tolist() == [pd.Timestamp(2024, 1, 31), pd.Timestamp(2024, 2, 5), pd.Timestamp(2023, 12, 1), pd.Timestamp(2024, 1, 5)]
+    assert result[4:].isna().all()
+
+def test_coerce_types_reports_issues():
+    df = pd.DataFrame({
+        'Conta': ['123', '456'],
+        'Valor Principal': ['1.000,00', 'mil'],
+        'Data de Emissão': ['01/02/2024', '31/02/2024'],
+        'Taxa/ PCT': [0.123456, None],
+    })
+    df = coerce_types(df)
+    assert df['Conta'].tolist() == ['123', '456']
+    assert df['Valor Principal'][0] == 1000.0 and pd.isna(df['Valor Principal'][1])
+    assert df['Data de Emissão'][0] == pd.Timestamp(2024, 2, 1) and pd.isna(df['Data de Emissão'][1])
+    assert df['Taxa/ PCT'][0] == 0.1235
+    assert df.attrs['coercion_issues'] == {
+        'Valor Principal': {'count': 1, 'samples': ['mil']},
+        'Data de Emissão': {'count': 1, 'samples': ['31/02/2024']},
+    }
+
+@pytest.mark.parametrize('raw, expected', DECIMALS + [('abc', None), (None, None), (True, None)])
+def test_decimal_value_matches_column(raw, expected):
+    assert decimal_value(raw, 2) == expected
+
+@pytest.mark.parametrize('raw, expected', [
+    (datetime(2024, 1, 31), datetime(2024, 1, 31)),
+    ('05/02/2024', datetime(2024, 2, 5)),
+    ('5/1/2024', datetime(2024, 1, 5)),
+    ('amanhã', None),
+    (None, None),
+])
+def test_date_value_matches_column(raw, expected):
+    assert date_value(raw) == expected
@@ -0,0 +1,58 @@
+import pytest
+from Entities.synthetic import generate_files
+from Entities.readers import open_workbook
+from Entities.readers.session import WorkbookSession, StubDriver
+
+@pytest.fixture
+def files(tmp_path):
+    return generate_files(str(tmp_path), files=5, aplicacoes=3, resgates=2)
+
+def test_one_engine_for_many_files(files):
+    driver = StubDriver()
+    with WorkbookSession(driver, recycle_every=0) as session:
+        for file_path in files:
+            with session.open(file_path) as wb:
+                assert wb.sheet_names == ['Sheet0']
+    kinds = [kind for kind, _ in driver.events]
+    assert kinds == ['start'] + ['open', 'close'] * len(files) + ['stop']
+    assert session.stats == {'engines': 1, 'books': len(files)}
+
+def test_recycle_every(files):
+    driver = StubDriver()
+    with WorkbookSession(driver, recycle_every=2) as session:
+        for file_path in files:
+            with session.open(file_path):
+                pass
+    engines = [engine for kind, engine in driver.events if kind == 'start']
+    stopped = [engine for kind, engine in driver.events if kind == 'stop']
+    assert engines == ['engine-1', 'engine-2', 'engine-3']
+    assert stopped == engines
+    assert session.stats['engines'] == 3
+
+def test_book_closed_when_caller_fails(files):
+    driver = StubDriver()
+    session = WorkbookSession(driver, recycle_every=0)
+    with pytest.raises(RuntimeError):
+        with session.open(files[0]):
+            raise RuntimeError("falha durante a leitura")
+    assert [kind for kind, _ in driver.events] == ['start', 'open', 'close']
+    session.close()
+    assert driver.events[-1] == ('stop', 'engine-1')
+
+def test_failed_open_stops_engine(tmp_path):
+    driver = StubDriver()
+    bad = tmp_path / 'invalido.xls'
+    bad.write_bytes(b'nao e um xls')
+    session = WorkbookSession(driver, recycle_every=0)
+    with pytest.raises(Exception):
+        with session.open(str(bad)):
+            pass
+    assert [kind for kind, _ in driver.events] == ['start', 'stop']
+    session.close()
+
+def test_open_workbook_uses_session(files):
+    driver = StubDriver()
+    with WorkbookSession(driver) as session:
+        with open_workbook(files[0], engine='xlwings', session=session) as wb:
+            assert wb.sheets['Sheet0'].n_rows > 0
+    assert [kind for kind, _ in driver.events] == ['start', 'open', 'close', 'stop']
@@ -0,0 +1,107 @@
+import codecs
+from datetime import datetime
+import pandas as pd
+import pytest
+from Entities.synthetic import write_xls, statement_rows
+from readers import open_workbook
+from readers.text_formats import sniff_format, HtmlWorkbook, SpreadsheetMLWorkbook, CsvWorkbook
+from extract_data import ExtractData
+
+HTML = """<html><head><meta charset="windows-1252"><title>Extrato</title>
+<style>td { color: red }</style><script>var x = "<td>nao</td>";</script></head>
+<body><p>Relatório de aplicações</p>
+<table>
+<tr><td>Empresa</td><td colspan="2">ACME &amp; Cia</td><td>fim</td></tr>
+<tr><th>Valor</th><td> 1.234,56 </td></tr>
+</table>
+<div>Rodapé</div>
+</body></html>"""
+
+XML = """<?xml version="1.0"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">
+ <Worksheet ss:Name="Extrato">
+  <Table>
+   <Row><Cell><Data ss:Type="String">Conta</Data></Cell><Cell ss:MergeAcross="1"><Data ss:Type="Number">12.5</Data></Cell><Cell><Data ss:Type="Boolean">1</Data></Cell></Row>
+   <Row ss:Index="3"><Cell ss:Index="2"><Data ss:Type="DateTime">2024-03-05T00:00:00.000</Data></Cell></Row>
+  </Table>
+ </Worksheet>
+ <Worksheet ss:Name="Vazia"><Table/></Worksheet>
+</Workbook>"""
+
+def _write(tmp_path, name:str, content, encoding:str='utf-8') -> str:
+    path = tmp_path / name
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    path.write_bytes(content)
+    return str(path)
+
+@pytest.mark.parametrize('content, expected', [
+    (HTML.encode('cp1252'), 'html'),
+    (codecs.BOM_UTF8 + HTML.encode('utf-8'), 'html'),
+    (HTML.encode('utf-16'), 'html'),
+    (XML, 'xml'),
+    ('Agência;Conta\n1234;56789-0\n', 'csv'),
+    ('apenas um texto qualquer, sem tabela', 'csv'),
+    ('<?xml version="1.0"?><outro/>', 'unknown'),
+    (b'PK\x03\x04' + b'\0' * 100, 'zip'),
+    (b'texto\x00binario', 'unknown'),
+    (b'', 'unknown'),
+])
+def test_sniff_format(tmp_path, content, expected):
+    assert sniff_format(_write(tmp_path, 'arquivo.xls', content, 'cp1252')) == expected
+
+def test_sniff_biff(tmp_path):
+    assert sniff_format(write_xls(str(tmp_path / 'binario.xls'), {'Sheet0': [['a']]})) == 'biff'
+
+def test_html_reader(tmp_path):
+    grid = HtmlWorkbook(_write(tmp_path, 'extrato.xls', HTML, 'cp1252')).sheets['Sheet0']
+    rows = [[grid.cell(r, c) for c in range(1, 5)] for r in range(1, grid.n_rows + 1)]
+    assert rows == [
+        ['Relatório de aplicações', None, None, None],
+        ['Empresa', 'ACME & Cia', None, 'fim'],
+        ['Valor', '1.234,56', None, None],
+        ['Rodapé', None, None, None],
+    ]
+
+def test_spreadsheetml_reader(tmp_path):
+    wb = SpreadsheetMLWorkbook(_write(tmp_path, 'extrato.xls', XML))
+    assert wb.sheet_names == ['Extrato', 'Vazia']
+    grid = wb.sheets['Extrato']
+    assert [grid.cell(1, c) for c in range(1, 5)] == ['Conta', 12.5, None, True]
+    assert grid.cell(2, 1) is None
+    assert grid.cell(3, 2) == datetime(2024, 3, 5)
+    assert wb.sheets['Vazia'].n_rows == 0
+
+@pytest.mark.parametrize('text', [
+    'Agência;Conta;Nome\n1234;56789-0;"Ação; Ltda"\n',
+    'Agência,Conta,Nome\n1234,56789-0,"Ação; Ltda"\n',
+    'Agência\tConta\tNome\n1234\t56789-0\tAção; Ltda\n',
+])
+def test_csv_reader(tmp_path, text):
+    grid = CsvWorkbook(_write(tmp_path, 'extrato.xls', text, 'cp1252')).sheets['Sheet0']
+    assert [grid.cell(2, c) for c in range(1, 4)] == ['1234', '56789-0', 'Ação; Ltda']
+
+def test_plain_text_is_read_as_single_column(tmp_path):
+    grid = CsvWorkbook(_write(tmp_path, 'nota.xls', 'primeira linha\nsegunda linha\n')).sheets['Sheet0']
+    assert [grid.cell(r, 1) for r in (1, 2)] == ['primeira linha', 'segunda linha']
+
+def _html_table(rows) -> str:
+    cells = lambda row: "".join(f"<td>{'' if value is None else value.strftime('%d/%m/%Y') if isinstance(value, datetime) else value}</td>" for value in row)
+    return "<html><body><table>" + "".join(f"<tr>{cells(row)}</tr>" for row in rows) + "</table></body></html>"
+
+def _csv(rows) -> str:
+    value = lambda value: '' if value is None else value.strftime('%d/%m/%Y') if isinstance(value, datetime) else str(value)
+    return "".join(";".join(value(v) for v in row) + "\n" for row in rows)
+
+@pytest.mark.parametrize('render', [_html_table, _csv])
+def test_text_statement_matches_binary(tmp_path, render):
+    rows = statement_rows(aplicacoes=4, resgates=2, seed=3)
+    periodo = datetime(2024, 12, 31)
+    binary = ExtractData.get_dataframe(file_path=write_xls(str(tmp_path / 'binario.xls'), {'Sheet0': rows}), periodo=periodo, engine='biff')
+    text = ExtractData.get_dataframe(file_path=_write(tmp_path, 'texto.xls', render(rows)), periodo=periodo, engine='biff')
+    assert len(binary) == 6
+    pd.testing.assert_frame_equal(binary, text, check_dtype=False)
+
+def test_open_workbook_uses_native_reader(tmp_path):
+    with open_workbook(_write(tmp_path, 'extrato.xls', XML), engine='biff') as wb:
+        assert wb.sheet_names == ['Extrato', 'Vazia']